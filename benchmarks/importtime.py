@@ -0,0 +1,98 @@
+"""Import time benchmark of overload package.
+
+Statement is imported in fresh interpreters with `python -X importtime`,
+self and cumulative times of each module are parsed from stderr. Median
+of runs is reported, so results of noisy machines are comparable.
+
+Usage:
+    python -m benchmarks.importtime [-n RUNS] [-t TOP] [STATEMENT]
+
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+__all__ = (
+    'measure',
+    'parse',
+)
+
+DEFAULT_STATEMENT = 'from overload import overload'
+
+# Times in microseconds: {module: (self, cumulative)}.
+_Times = Dict[str, Tuple[int, int]]
+
+
+def parse(output: str) -> _Times:
+    """Parse stderr of `python -X importtime`."""
+    times = {}
+
+    for line in output.splitlines():
+        if not line.startswith('import time:'):
+            continue
+
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            # Header line.
+            continue
+
+        module = fields[2].strip()
+        times[module] = (int(fields[0]), int(fields[1]))
+
+    return times
+
+
+def measure(statement: str = DEFAULT_STATEMENT, runs: int = 5) -> _Times:
+    """Median self and cumulative times of modules imported by statement."""
+    results: List[_Times] = []
+
+    for _ in range(runs):
+        process = subprocess.run(
+            (sys.executable, '-X', 'importtime', '-c', statement),
+            stderr=subprocess.PIPE,
+            universal_newlines=True,
+            check=True,
+        )
+        results.append(parse(process.stderr))
+
+    modules = set.intersection(*(set(result) for result in results))
+
+    return {
+        module: (
+            int(statistics.median(result[module][0] for result in results)),
+            int(statistics.median(result[module][1] for result in results)),
+        )
+        for module in modules
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('statement', nargs='?', default=DEFAULT_STATEMENT)
+    parser.add_argument('-n', '--runs', type=int, default=5)
+    parser.add_argument('-t', '--top', type=int, default=15)
+    options = parser.parse_args()
+
+    times = measure(options.statement, options.runs)
+    package = {
+        module: value for module, value in times.items()
+        if module == 'overload' or module.startswith('overload.')
+    }
+
+    print(f'{options.statement!r}, median of {options.runs} runs')
+    print(f'total: {sum(time for time, _ in times.values()) / 1000:.1f} ms, '
+          f'{len(times)} modules')
+    print(f'overload: {sum(time for time, _ in package.values()) / 1000:.1f}'
+          f' ms, {len(package)} modules')
+    print()
+    print(f'{"self, us":>10} {"cumulative, us":>15}  module')
+
+    top = sorted(times.items(), key=lambda item: item[1][0], reverse=True)
+    for module, (self_time, cumulative) in top[:options.top]:
+        print(f'{self_time:>10} {cumulative:>15}  {module}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,495 @@
+"""Benchmarks of dispatch overhead, registration cost and scaling.
+
+Cases are measured with timeit (the best of repeats, nanoseconds per
+call) and tracemalloc (peak bytes allocated by one call and bytes kept
+alive per call or by registered overloader). Direct call of function and
+functools.singledispatch with the same count of implementations are
+measured as reference. Signature corpora of tests (tests/*/data.py) are
+reused for implementation matching, registration and annotation
+conversion cases.
+
+Results are written to JSON, which can be compared with a saved baseline:
+    python -m benchmarks.suite --output baseline.json
+    python -m benchmarks.suite --compare baseline.json
+
+Usage:
+    python -m benchmarks.suite [-q] [-e ENGINE] [-k FILTER] [-o OUTPUT]
+        [-c BASELINE] [-t THRESHOLD]
+
+"""
+import argparse
+import functools
+import json
+import platform
+import sys
+import timeit
+import tracemalloc
+import warnings
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from overload.overloader.function import FunctionOverloader
+from overload.type.type import Args, Kwargs
+
+__all__ = (
+    'BenchmarkSuite',
+    'compare',
+    'measure_call',
+)
+
+# Counts of registered implementations and of call parameters.
+IMPLEMENTATIONS = (1, 10, 100, 1000)
+PARAMETERS = (0, 1, 2, 4, 8)
+QUICK_IMPLEMENTATIONS = (1, 10, 100)
+QUICK_PARAMETERS = (0, 1, 4)
+# Relative slowdown of case, which is reported as regression.
+DEFAULT_THRESHOLD = 0.1
+# Prefixes of reference cases, which don't measure overloader, so their
+# noise isn't reported as regression.
+REFERENCE_PREFIXES = ('direct/', 'singledispatch/')
+
+# Result of case: {metric: value}.
+_Result = Dict[str, float]
+_Case = Tuple[str, Callable[[], _Result]]
+
+
+def measure_call(
+        call: Callable[[], Any],
+        repeat: int = 5,
+        memory: bool = True,
+) -> _Result:
+    """Measure call without arguments.
+
+    Returns:
+        ns - the best time of call in nanoseconds,
+        peak_bytes - peak of memory allocated by one call,
+        retained_bytes - memory kept alive by call, averaged on 1000 calls.
+
+    """
+    timer = timeit.Timer(call)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat, number)) / number
+    result = {'ns': best * 1e9}
+
+    if memory:
+        result.update(_measure_memory(call))
+
+    return result
+
+
+def _measure_memory(call: Callable[[], Any], number: int = 1000) -> _Result:
+    """Peak and retained memory of call, measured by tracemalloc."""
+    call()
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+
+    try:
+        # Peak is reset with traces, so it is a peak of one call.
+        tracemalloc.clear_traces()
+        call()
+        peak = tracemalloc.get_traced_memory()[1]
+
+        tracemalloc.clear_traces()
+        for _ in range(number):
+            call()
+        retained = tracemalloc.get_traced_memory()[0]
+    finally:
+        if not tracing:
+            tracemalloc.stop()
+
+    return {'peak_bytes': peak, 'retained_bytes': retained / number}
+
+
+def _make_function(name: str, annotations: Dict[str, Any], signature: str,
+                   ) -> Callable:
+    """Create function with signature and annotations."""
+    namespace = {}
+    exec(f'def {name}({signature}):\n    return None\n', namespace)
+    function = namespace[name]
+    function.__annotations__ = annotations
+    return function
+
+
+def _classes(count: int) -> List[type]:
+    """Unrelated classes, a dispatch type of each implementation."""
+    return [type(f'Class{index}', (), {}) for index in range(count)]
+
+
+def _dispatch_functions(
+        implementations: int, parameters: int, classes: List[type],
+) -> Tuple[Callable, List[Callable]]:
+    """Default function and implementations, which differ by the first
+    parameter annotation, other parameters are annotated with int.
+    """
+    names = [f'a{index}' for index in range(parameters)]
+    signature = ', '.join(names)
+    default = _make_function(
+        'default', dict.fromkeys(names, object), signature,
+    )
+    functions = []
+
+    for index in range(implementations):
+        annotations = dict.fromkeys(names, int)
+        if names:
+            annotations[names[0]] = classes[index]
+        functions.append(
+            _make_function(f'implementation_{index}', annotations, signature)
+        )
+
+    return default, functions
+
+
+def _overloader(default: Callable, functions: List[Callable],
+                **options: Any) -> FunctionOverloader:
+    """Overloader with registered functions, analysis warnings of
+    overlapping corpora are ignored."""
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        overloader = FunctionOverloader(
+            default, strict=False, overlapping=True, **options,
+        )
+
+        for function in functions:
+            overloader.register(function)
+
+    return overloader
+
+
+class BenchmarkSuite:
+    """Collection of benchmark cases for overloader options.
+
+    Args:
+        engine (str): Engine of benchmarked overloaders.
+        cache_size (int, optional): Dispatch cache size of benchmarked
+            overloaders, 0 - dispatch is measured without cache.
+        quick (bool): Reduced grid of implementations and parameters counts.
+        repeat (int): Count of timeit repeats, the best is reported.
+
+    """
+    __slots__ = ('engine', 'cache_size', 'repeat', '_implementations',
+                 '_parameters')
+
+    def __init__(
+            self,
+            engine: str = 'linear',
+            cache_size: Optional[int] = 256,
+            quick: bool = False,
+            repeat: int = 5,
+    ):
+        self.engine = engine
+        self.cache_size = cache_size
+        self.repeat = repeat
+        self._implementations = (
+            QUICK_IMPLEMENTATIONS if quick else IMPLEMENTATIONS
+        )
+        self._parameters = QUICK_PARAMETERS if quick else PARAMETERS
+
+    @property
+    def options(self) -> Dict[str, Any]:
+        """Options of benchmarked overloaders."""
+        return {'engine': self.engine, 'cache_size': self.cache_size}
+
+    def cases(self) -> Iterator[_Case]:
+        """Names and measuring functions of all cases."""
+        yield from self._dispatch_cases()
+        yield from self._keyword_cases()
+        yield from self._variadic_cases()
+        yield from self._registration_cases()
+        yield from self._corpus_cases()
+
+    def run(self, name_filter: str = '',
+            report: Optional[Callable[[str, _Result], None]] = None,
+            ) -> Dict[str, _Result]:
+        """Measure cases, which names contain filter."""
+        results = {}
+
+        for name, case in self.cases():
+            if name_filter not in name:
+                continue
+
+            results[name] = case()
+            if report is not None:
+                report(name, results[name])
+
+        return results
+
+    def _measure(self, call: Callable[[], Any]) -> _Result:
+        return measure_call(call, self.repeat)
+
+    def _dispatch_cases(self) -> Iterator[_Case]:
+        """Positional calls by counts of implementations and parameters,
+        with direct and singledispatch calls as reference."""
+        for parameters in self._parameters:
+            # Implementations without parameters can't differ.
+            counts = self._implementations if parameters else (1,)
+
+            for implementations in counts:
+                prefix = f'impls={implementations}/args={parameters}'
+                classes = _classes(implementations)
+                default, functions = _dispatch_functions(
+                    implementations, parameters, classes,
+                )
+                # The first registered implementation is the last found
+                # by linear engine.
+                args = (classes[0](), *range(1, parameters))[:parameters]
+                function = functions[0]
+
+                overloader = _overloader(default, functions, **self.options)
+                yield (f'dispatch/{prefix}',
+                       self._case(lambda o=overloader, a=args: o(*a)))
+                yield (f'direct/{prefix}',
+                       self._case(lambda f=function, a=args: f(*a)))
+
+                if parameters:
+                    dispatcher = functools.singledispatch(default)
+                    for class_, implementation in zip(classes, functions):
+                        dispatcher.register(class_, implementation)
+
+                    yield (f'singledispatch/{prefix}',
+                           self._case(lambda d=dispatcher, a=args: d(*a)))
+
+    def _keyword_cases(self) -> Iterator[_Case]:
+        """Keyword calls of implementations, compared with positional
+        dispatch cases of the same counts."""
+        for parameters in self._parameters:
+            if not parameters:
+                continue
+
+            for implementations in self._implementations:
+                classes = _classes(implementations)
+                default, functions = _dispatch_functions(
+                    implementations, parameters, classes,
+                )
+                kwargs = {
+                    f'a{index}': value for index, value in enumerate(
+                        (classes[0](), *range(1, parameters)),
+                    )
+                }
+                overloader = _overloader(default, functions, **self.options)
+
+                yield (f'keyword/impls={implementations}/args={parameters}',
+                       self._case(lambda o=overloader, k=kwargs: o(**k)))
+
+    def _variadic_cases(self) -> Iterator[_Case]:
+        """Calls of implementations with Args and Kwargs annotations."""
+        for parameters in self._parameters:
+            if not parameters:
+                continue
+
+            default = _make_function(
+                'default', {'args': Args, 'kwargs': Kwargs},
+                '*args, **kwargs',
+            )
+            functions = [
+                _make_function(f'args_{class_.__name__}',
+                               {'args': Args[class_]}, '*args')
+                for class_ in (str, bytes, int)
+            ] + [
+                _make_function(f'kwargs_{class_.__name__}',
+                               {'kwargs': Kwargs[class_]}, '**kwargs')
+                for class_ in (str, bytes, int)
+            ]
+            overloader = _overloader(default, functions, **self.options)
+            args = tuple(range(parameters))
+            kwargs = {f'a{index}': index for index in range(parameters)}
+
+            yield (f'variadic/args/args={parameters}',
+                   self._case(lambda o=overloader, a=args: o(*a)))
+            yield (f'variadic/kwargs/args={parameters}',
+                   self._case(lambda o=overloader, k=kwargs: o(**k)))
+
+    def _registration_cases(self) -> Iterator[_Case]:
+        """Registration of implementations and memory of overloader."""
+        for implementations in self._implementations:
+            classes = _classes(implementations)
+
+            def case(implementations=implementations, classes=classes):
+                default, functions = _dispatch_functions(
+                    implementations, 2, classes,
+                )
+                times = []
+                # Slow registrations aren't repeated after time budget.
+                while len(times) < self.repeat and sum(times) < 1:
+                    start = timeit.default_timer()
+                    _overloader(default, functions, **self.options)
+                    times.append(timeit.default_timer() - start)
+
+                tracemalloc.start()
+                try:
+                    overloader = _overloader(
+                        default, functions, **self.options,
+                    )
+                    memory = tracemalloc.get_traced_memory()[0]
+                finally:
+                    tracemalloc.stop()
+
+                del overloader
+                return {
+                    'ns': min(times) * 1e9,
+                    'ns_per_implementation': (
+                        min(times) * 1e9 / implementations
+                    ),
+                    'bytes': memory,
+                }
+
+            yield f'register/impls={implementations}', case
+
+    def _corpus_cases(self) -> Iterator[_Case]:
+        """Cases of signatures corpora of tests."""
+        from overload.type.type import _TypeHandler
+        from tests.test_implementation.data import (
+            TEST_FUNCTION_IMPLEMENTATION_COMPARE,
+        )
+        from tests.test_overloader.data import FUNCTION_OVERLOADER_REGISTER
+        from tests.test_type.data import OUT_UP_TYPES_AND_EXPECTATIONS
+
+        compare_corpus = [
+            (implementation, named, unnamed)
+            for implementation, named, unnamed, _
+            in TEST_FUNCTION_IMPLEMENTATION_COMPARE
+        ]
+
+        def compare_case():
+            for implementation, named, unnamed in compare_corpus:
+                implementation.compare(named, unnamed)
+
+        yield 'corpus/implementation_compare', self._corpus_case(
+            compare_case, len(compare_corpus),
+        )
+
+        register_corpus = [
+            (default, strict, overlapping, function)
+            for default, strict, overlapping, function, exception
+            in FUNCTION_OVERLOADER_REGISTER if exception is None
+        ]
+
+        def register_case():
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+                for default, strict, overlapping, function in register_corpus:
+                    FunctionOverloader(
+                        default, strict, overlapping, **self.options,
+                    ).register(function)
+
+        yield 'corpus/overloader_register', self._corpus_case(
+            register_case, len(register_corpus),
+        )
+
+        handlers = {True: _TypeHandler(deep=True), False: _TypeHandler()}
+        types_corpus = [
+            (handlers[deep], annotation)
+            for deep, annotation, _ in OUT_UP_TYPES_AND_EXPECTATIONS
+        ]
+
+        def types_case():
+            for handler, annotation in types_corpus:
+                handler.out_up_types(annotation)
+
+        yield 'corpus/type_conversion', self._corpus_case(
+            types_case, len(types_corpus),
+        )
+
+    def _case(self, call: Callable[[], Any]) -> Callable[[], _Result]:
+        return lambda: self._measure(call)
+
+    def _corpus_case(self, call: Callable[[], Any], size: int,
+                     ) -> Callable[[], _Result]:
+        """Case of corpus, times are reported per corpus entry."""
+        def case():
+            result = measure_call(call, self.repeat, memory=False)
+            return {'ns': result['ns'] / size, 'entries': size}
+
+        return case
+
+
+def compare(
+        baseline: Dict[str, _Result],
+        results: Dict[str, _Result],
+        threshold: float = DEFAULT_THRESHOLD,
+) -> List[Tuple[str, float, float, float, bool]]:
+    """Compare times of cases, which are measured in both results.
+
+    Returns:
+        For each case: name, baseline time, time, relative change and
+        regression flag (time grew more than threshold). Reference cases
+        (direct call and functools.singledispatch) are never regressions.
+
+    """
+    rows = []
+
+    for name in sorted(set(baseline) & set(results)):
+        before, after = baseline[name]['ns'], results[name]['ns']
+        change = (after - before) / before if before else 0.0
+        regression = change > threshold and not name.startswith(
+            REFERENCE_PREFIXES,
+        )
+        rows.append((name, before, after, change, regression))
+
+    return rows
+
+
+def _report(name: str, result: _Result) -> None:
+    extra = ' '.join(
+        f'{metric}={value:.0f}' for metric, value in result.items()
+        if metric != 'ns'
+    )
+    print(f'{name:<45} {result["ns"]:>12.0f} ns  {extra}')
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-e', '--engine', default='linear')
+    parser.add_argument('--cache-size', type=int, default=256)
+    parser.add_argument('-q', '--quick', action='store_true')
+    parser.add_argument('-r', '--repeat', type=int, default=5)
+    parser.add_argument('-k', '--filter', default='',
+                        help='run cases, which names contain filter')
+    parser.add_argument('-o', '--output', help='write results to JSON file')
+    parser.add_argument('-c', '--compare', metavar='BASELINE',
+                        help='compare results with saved JSON file')
+    parser.add_argument('-t', '--threshold', type=float,
+                        default=DEFAULT_THRESHOLD)
+    options = parser.parse_args()
+
+    suite = BenchmarkSuite(
+        options.engine, options.cache_size, options.quick, options.repeat,
+    )
+    results = suite.run(options.filter, _report)
+    document = {
+        'meta': {
+            'python': sys.version.split()[0],
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            **suite.options,
+        },
+        'results': results,
+    }
+
+    if options.output:
+        with open(options.output, 'w') as file:
+            json.dump(document, file, indent=2, sort_keys=True)
+
+    if not options.compare:
+        return 0
+
+    with open(options.compare) as file:
+        baseline = json.load(file)
+
+    rows = compare(baseline['results'], results, options.threshold)
+    print()
+    print(f'{"case":<45} {"baseline":>12} {"current":>12} {"change":>8}')
+    for name, before, after, change, regression in rows:
+        if regression:
+            mark = '  REGRESSION'
+        elif name.startswith(REFERENCE_PREFIXES):
+            mark = '  reference'
+        else:
+            mark = ''
+        print(f'{name:<45} {before:>12.0f} {after:>12.0f} '
+              f'{change:>+8.1%}{mark}')
+
+    return int(any(row[-1] for row in rows))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,4 +1,87 @@
-"""Module contain all overload logic."""
-from overload.decorator import *
-from overload.exception import *
-from overload.type import *
+"""Module contain all overload logic.
+
+Public names are imported from submodules at the first access (PEP 562),
+so `from overload import overload` loads only modules, which are required
+by decorators.
+"""
+# Submodule of each public name.
+_SUBMODULES = {
+    **dict.fromkeys(
+        (
+            'overload',
+            'overload_method',
+            'batched',
+            'register_key_extractor',
+            'unregister_key_extractor',
+        ),
+        'overload.decorator',
+    ),
+    **dict.fromkeys(
+        (
+            # Base exceptions.
+            'OverloadException',
+            # Overloader module exceptions.
+            'OverloaderError',
+            'RegisterTypeError',
+            'FunctionRegisterTypeError',
+            'MissedAnnotations',
+            'AnnotationCountError',
+            'ArgumentNameError',
+            'OverlappingError',
+            'UnknownEngine',
+            'FrozenOverloaderError',
+            'CompileEngineError',
+            'MethodRegisterTypeError',
+            'CoroutineMixError',
+            'StatsDisabledError',
+            'OverloaderLookupError',
+            # Type module exceptions.
+            'TypeException',
+            'UnknownType',
+            'CustomTypeError',
+            'CustomTypeAlreadyExist',
+            'IndexValueError',
+            'SingleTypeError',
+            'UnknownDeepStrategy',
+        ),
+        'overload.exception',
+    ),
+    **dict.fromkeys(
+        (
+            'OverloadWarning',
+            'ShadowedImplementationWarning',
+            'AmbiguousImplementationWarning',
+        ),
+        'overload.exception.warning',
+    ),
+    **dict.fromkeys(('Args', 'Kwargs', 'Key'), 'overload.type'),
+    **dict.fromkeys(
+        (
+            'registered_overloaders',
+            'describe_overloader',
+            'export_registry',
+        ),
+        'overload.overloader.registry',
+    ),
+}
+
+__all__ = tuple(_SUBMODULES)
+
+
+def __getattr__(name: str):
+    try:
+        module = _SUBMODULES[name]
+    except KeyError:
+        raise AttributeError(
+            f'module {__name__!r} has no attribute {name!r}'
+        ) from None
+
+    # Package is returned by __import__ only for empty fromlist.
+    value = getattr(__import__(module, fromlist=(name,)), name)
+    # The next access doesn't call __getattr__.
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,58 @@
+"""Export registry of overloaders to JSON.
+
+Modules are imported, so their overloaders are registered, and
+descriptions of all alive overloaders are written to stdout or file.
+Overloaders of running process are exported by
+overload.export_registry().
+
+Usage:
+    python -m overload [-m MIN] [--module MODULE] [--indent INDENT]
+        [-o OUTPUT] [IMPORT ...]
+
+"""
+import argparse
+import sys
+from importlib import import_module
+from typing import List, Optional
+
+from overload.overloader.registry import export_registry
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m overload',
+        description=__doc__.splitlines()[0],
+    )
+    parser.add_argument('imports', nargs='*', metavar='IMPORT',
+                        help='modules, which are imported before export')
+    parser.add_argument('-m', '--min-implementations', type=int, default=0,
+                        help='export overloaders with at least this count '
+                             'of implementations')
+    parser.add_argument('--module',
+                        help='export overloaders of module and submodules')
+    parser.add_argument('--indent', type=int, default=None)
+    parser.add_argument('-o', '--output', help='write JSON to file')
+    options = parser.parse_args(argv)
+
+    # Modules of current directory are imported like by python -c.
+    if '' not in sys.path:
+        sys.path.insert(0, '')
+
+    for module in options.imports:
+        import_module(module)
+
+    document = export_registry(
+        options.min_implementations, options.module, options.indent,
+    )
+
+    if options.output:
+        with open(options.output, 'w') as file:
+            file.write(document + '\n')
+    else:
+        print(document)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
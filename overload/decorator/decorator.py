@@ -1,17 +1,40 @@
 from types import FunctionType
-from typing import Callable, cast, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Union,
+)
+from overload.overloader.base import ABCOverloader
 from overload.overloader.function import FunctionOverloader
+from overload.utils.coroutine import is_coroutine_function
+
+if TYPE_CHECKING:
+    from overload.overloader.method import MethodOverloader
+
+# Overloaders of methods and coroutine functions, and key extractors are
+# imported at the first use, so importing of decorators is faster.
 
 __all__ = (
     'overload',
+    'overload_method',
+    'batched',
+    'register_key_extractor',
+    'unregister_key_extractor',
 )
 
 
 def overload(
         strict: bool = True,
-        overlapping: bool = False
+        overlapping: bool = False,
+        **options: Any,
 ) -> Union[Callable, FunctionOverloader]:
-    """Replace function to FunctionOverloader object.
+    """Replace function to FunctionOverloader object, coroutine function
+    to CoroutineOverloader object.
 
     Args:
         strict (bool): Activate validation of implementation annotations
@@ -19,13 +42,129 @@ def overload(
         overlapping (bool): Activate registration of implementation with
             same annotations as the default overload object.
 
+    Keyword options:
+        cache_size (int, optional): Max count of call signatures, which
+            resolved implementations storage in dispatch cache.
+            0 - cache is disabled, None - cache is unbounded.
+        engine (str): Name of engine, matching implementations with call
+            parameters types: linear, bitset or mro.
+        frozen (bool): Freeze overloader at the first call, after that
+            implementations can't be registered.
+        deep (bool): Compare elements of collections with inner types of
+            annotations (List[int], Dict[str, int], Tuple[int, str]).
+        deep_strategy (str): Checked elements of collection: first, random
+            or all.
+        deep_size (int): Count of checked elements of collection for first
+            and random strategies.
+        lazy (bool): Defer conversion of annotations and registration of
+            implementations to the first call, string annotations can
+            refer to names defined after registration.
+        stats (bool): Collect statistic of dispatching, available by
+            stats() method of overloader.
+
+    """
+    return _decorator(_overloader_class, strict, overlapping, options)
+
+
+def overload_method(
+        strict: bool = True,
+        overlapping: bool = False,
+        **options: Any,
+) -> Union[Callable, 'MethodOverloader']:
+    """Replace method to MethodOverloader object. Take instance method,
+    classmethod or staticmethod object. Options are the same as options
+    of overload.
+    """
+    return _decorator(_method_overloader_class, strict, overlapping, options)
+
+
+def batched(bulk_function: Callable[[List[Any]], Iterable[Any]]) -> Callable:
+    """Mark implementation, which items are processed together by bulk
+    function in overloader batch method.
+
+    Args:
+        bulk_function (callable): Take list of items, resolved to marked
+            implementation, and return results of them in the same order.
+
+    """
+    def wrapper(function: FunctionType) -> FunctionType:
+        function.__overload_batch__ = bulk_function
+        return function
+
+    return wrapper
+
+
+def register_key_extractor(
+        class_: type, extractor: Optional[Callable] = None,
+) -> None:
+    """Dispatch values of class by key, returned by extractor, for all
+    overloaders. Key is compared with annotations of key (Key[class, ...])
+    and annotations of class.
+
+    Args:
+        class_ (type): Class of values, subclasses aren't affected.
+        extractor (callable, optional): Take value and return hashable
+            tuple, the first item of which is class. By default standard
+            extractor of memoryview (format, C contiguity) or numpy array
+            (dtype type code, count of dimensions).
+
+    """
+    if extractor is None:
+        from overload.type.keys import default_key_extractors
+
+        try:
+            extractor = default_key_extractors()[class_]
+        except KeyError:
+            raise ValueError(f'Class {class_} has not standard key extractor.')
+
+    ABCOverloader.__type_handler__.register_extractor(class_, extractor)
+
+
+def unregister_key_extractor(class_: type) -> None:
+    """Dispatch values of class by class."""
+    ABCOverloader.__type_handler__.unregister_extractor(class_)
+
+
+def _decorator(
+        overloader_class: Callable[[Any], type],
+        strict: Any,
+        overlapping: bool,
+        options: Dict[str, Any],
+) -> Union[Callable, ABCOverloader]:
+    """Create overloader of decorated object, if decorator is used without
+    call, otherwise return decorator creating overloader with options.
+
+    Args:
+        overloader_class (callable): Take decorated object and return
+            class of overloader.
+        strict (bool or Any): Option of overloader or decorated object.
+        overlapping (bool): Option of overloader.
+        options (dict): Keyword options of overloader.
+
     """
     if not isinstance(strict, bool):
-        cls = FunctionOverloader(cast(FunctionType, strict))
-        return cls
+        return overloader_class(strict)(strict)
 
-    def wrapper(function) -> FunctionOverloader:
-        cls = FunctionOverloader(function, strict, overlapping)
-        return cls
+    def wrapper(object_: Any) -> ABCOverloader:
+        return overloader_class(object_)(
+            object_, strict, overlapping, **options,
+        )
 
     return wrapper
+
+
+def _method_overloader_class(method: Any) -> type:
+    """Overloader class for method, it is imported at the first use."""
+    from overload.overloader.method import MethodOverloader
+
+    return MethodOverloader
+
+
+def _overloader_class(function: Callable) -> type:
+    """Overloader class for function or coroutine function."""
+    if is_coroutine_function(function):
+        from overload.overloader.coroutine import CoroutineOverloader
+
+        return CoroutineOverloader
+
+    return FunctionOverloader
@@ -0,0 +1,48 @@
+"""Module contain engines for matching implementations of overloader.
+
+Engines are imported at the first use (PEP 562), so overloader imports
+only engine, selected by it.
+"""
+import sys
+from typing import TYPE_CHECKING, Type
+
+if TYPE_CHECKING:
+    from .base import ABCEngine
+
+# Module and class of engine by name.
+_ENGINES = {
+    'linear': ('linear', 'LinearEngine'),
+    'bitset': ('bitset', 'BitsetEngine'),
+    'mro': ('mro', 'MroEngine'),
+}
+# Module of each engine class.
+_CLASSES = {
+    'ABCEngine': 'base',
+    **{class_: module for module, class_ in _ENGINES.values()},
+}
+
+# Names of available engines.
+ENGINES = tuple(_ENGINES)
+
+
+def engine_class(name: str) -> Type['ABCEngine']:
+    """Class of engine by name, raise KeyError for unknown name."""
+    module, class_ = _ENGINES[name]
+    return getattr(_import(module), class_)
+
+
+def _import(module: str):
+    name = f'{__name__}.{module}'
+    __import__(name)
+    return sys.modules[name]
+
+
+def __getattr__(name: str):
+    try:
+        module = _CLASSES[name]
+    except KeyError:
+        raise AttributeError(
+            f'module {__name__!r} has no attribute {name!r}'
+        ) from None
+
+    return getattr(_import(module), name)
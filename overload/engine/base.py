@@ -0,0 +1,102 @@
+"""File contain base engine class."""
+from abc import ABCMeta, abstractmethod
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from overload.type.type import _Type
+
+__all__ = (
+    'ABCEngine',
+)
+
+
+class ABCEngine(metaclass=ABCMeta):
+    """Base engine of matching implementations. Engine storage registered
+    implementations of overloader and finding the last registered
+    implementation, compared with call parameters types.
+
+    Class attributes:
+        name (str): Name of engine, used to select it in overloader.
+        exact (bool): Engine compare call parameters classes with
+            annotations by equality, like generated dispatch function.
+        first_match (bool): Engine finds the first compared candidate,
+            else the most specific of all compared candidates.
+
+    """
+    __slots__ = ('_varieties',)
+
+    name: str = ''
+    exact: bool = True
+    first_match: bool = True
+
+    _varieties: Sequence[Any]
+
+    def __init__(self):
+        self._varieties = []
+
+    def __repr__(self) -> str:
+        return (f'< {self.__class__.__name__} > '
+                f'implementation count = {len(self._varieties)}.')
+
+    @property
+    def uses_abc_registry(self) -> bool:
+        """Found implementations depend on registration of virtual
+        subclasses of abstract base classes (ABC.register), so resolved
+        implementations are valid only for the same abc.get_cache_token().
+        """
+        return False
+
+    def add(self, implementation: Any) -> None:
+        """Add new implementation with the highest priority."""
+        self._varieties.append(implementation)
+
+    def discard(self, implementation: Any) -> None:
+        """Remove implementation, which is never found, because other
+        implementations compare all its calls.
+        """
+        self._varieties = [
+            variety for variety in self._varieties
+            if variety is not implementation
+        ]
+
+    def freeze(self) -> None:
+        """Prepare engine for finding without new implementations.
+        Implementations are storage in tuple, after that can't be added.
+        """
+        self._varieties = tuple(self._varieties)
+
+    @abstractmethod
+    def find(
+            self, args: Tuple[_Type, ...], kwargs: Dict[str, _Type],
+    ) -> Optional[Any]:
+        """Finding the last registered implementation compared with args and
+        kwargs types, None if implementation not found.
+        """
+        pass
+
+    def candidates(
+            self, args: Tuple[_Type, ...], kwargs: Dict[str, _Type],
+    ) -> Sequence[Any]:
+        """Implementations in order, in which find compares them with args
+        and kwargs types. Used by explain only.
+        """
+        return self._varieties[::-1]
+
+    def accepts(
+            self,
+            implementation: Any,
+            args: Tuple[_Type, ...],
+            kwargs: Dict[str, _Type],
+    ) -> bool:
+        """Implementation is compared with args and kwargs types by
+        find. Used by explain only.
+        """
+        return implementation.compare(named=kwargs, unnamed=args)
+
+    def compares(
+            self, args: Tuple[_Type, ...], kwargs: Dict[str, _Type],
+    ) -> int:
+        """Count of implementations, compared with args and kwargs types
+        by find. Used by dispatch statistic only, so find isn't slowed by
+        counting.
+        """
+        return len(self._varieties)
@@ -0,0 +1,163 @@
+"""File contain bitset engine class."""
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple, Union
+
+from overload.type.type import _KeyType, _Type
+from overload.implementation.function import FunctionImplementation
+
+from .base import ABCEngine
+
+__all__ = (
+    'BitsetEngine',
+)
+
+_Shape = Tuple[int, FrozenSet[str]]
+
+
+class _ShapeTable:
+    """Masks of implementations for one call shape.
+
+    Bit with index of implementation is set in mask, if implementation
+    accept the value at this slot of call.
+
+    Attrs:
+        accepted (int): Mask of implementations, compared with call shape.
+        slots (tuple): Slots of call (index of unnamed parameter or name of
+            named parameter) in checking order.
+        masks (tuple): For each slot dict {class: mask}, masks already
+            include implementations accepted any class at slot.
+        free (list): For each slot mask of implementations accepted any
+            class at slot.
+
+    """
+    __slots__ = ('shape', 'accepted', 'slots', 'masks', 'free')
+
+    def __init__(self, shape: _Shape):
+        count, names = shape
+        self.shape = shape
+        self.accepted = 0
+        self.slots: Tuple[Union[int, str], ...] = (
+            *range(count), *sorted(names),
+        )
+        self.masks: Tuple[Dict[Any, int], ...] = tuple(
+            {} for _ in self.slots
+        )
+        self.free: List[int] = [0] * len(self.slots)
+
+    def add(self, index: int, implementation: FunctionImplementation) -> None:
+        """Add implementation bit to masks."""
+        checks = implementation.bind(*self.shape)
+
+        if checks is None:
+            return
+
+        bit = 1 << index
+        self.accepted |= bit
+        positions = {
+            slot: position for position, slot in enumerate(self.slots)
+        }
+
+        for slot, annotation in checks:
+            position = positions[slot]
+            masks = self.masks[position]
+            classes = FunctionImplementation.annotation_classes(annotation)
+
+            if classes is None:
+                self.free[position] |= bit
+                for class_ in masks:
+                    masks[class_] |= bit
+            else:
+                free = self.free[position]
+                for class_ in classes:
+                    masks[class_] = masks.get(class_, free) | bit
+
+
+class BitsetEngine(ABCEngine):
+    """Engine intersecting masks of implementations, accepted each call
+    parameter type. Tables of masks are build once for each call shape
+    (count of unnamed parameters and names of named parameters), so finding
+    is a dict lookup for each parameter, independent of implementations
+    count. The highest bit of intersection is the last registered
+    implementation.
+    """
+    __slots__ = ('_tables',)
+
+    name = 'bitset'
+
+    _tables: Dict[_Shape, _ShapeTable]
+
+    def __init__(self):
+        super().__init__()
+        self._tables = {}
+
+    def add(self, implementation: FunctionImplementation) -> None:
+        index = len(self._varieties)
+        super().add(implementation)
+
+        for table in self._tables.values():
+            table.add(index, implementation)
+
+    def discard(self, implementation: FunctionImplementation) -> None:
+        super().discard(implementation)
+        self._tables.clear()
+
+    def freeze(self) -> None:
+        """Build tables for all shapes of implementations without
+        infinite parameters.
+        """
+        super().freeze()
+
+        for implementation in self._varieties:
+            for shape in implementation.call_shapes():
+                if shape not in self._tables:
+                    self._tables[shape] = self._build_table(shape)
+
+    def find(
+            self, args: Tuple[_Type, ...], kwargs: Dict[str, _Type],
+    ) -> Optional[FunctionImplementation]:
+        shape = (len(args), frozenset(kwargs))
+
+        try:
+            table = self._tables[shape]
+        except KeyError:
+            table = self._tables[shape] = self._build_table(shape)
+
+        mask = table.accepted
+        if not mask:
+            return None
+
+        for slot, masks, free in zip(table.slots, table.masks, table.free):
+            type_ = (args if slot.__class__ is int else kwargs)[slot]
+            class_ = type_.type
+
+            # Call parameter with any type compared with all annotations.
+            if class_ is not Ellipsis:
+                if type_.__class__ is _KeyType:
+                    # Dispatch key compared with annotations of key and
+                    # of key class.
+                    mask &= masks.get(class_, free) | masks.get(
+                        type_.base, free,
+                    )
+                else:
+                    mask &= masks.get(class_, free)
+
+                if not mask:
+                    return None
+
+        return self._varieties[mask.bit_length() - 1]
+
+    def compares(
+            self, args: Tuple[_Type, ...], kwargs: Dict[str, _Type],
+    ) -> int:
+        # Implementations aren't compared one by one, masks of all of them
+        # are intersected by one lookup for each call parameter.
+        table = self._tables.get((len(args), frozenset(kwargs)))
+        return 0 if table is None or not table.accepted else len(table.slots)
+
+    def _build_table(self, shape: _Shape) -> _ShapeTable:
+        """Build masks of all implementations for call shape."""
+        table = _ShapeTable(shape)
+
+        for index, implementation in enumerate(self._varieties):
+            table.add(index, implementation)
+
+        return table
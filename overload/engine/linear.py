@@ -0,0 +1,238 @@
+"""File contain linear engine class."""
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from overload.type.type import _KeyType, _Type
+from overload.implementation.function import FunctionImplementation
+
+from .base import ABCEngine
+
+__all__ = (
+    'LinearEngine',
+)
+
+_Shape = Tuple[int, FrozenSet[str]]
+
+
+class _Bucket:
+    """Implementations for one call shape, the last registered is the first.
+
+    Implementations are indexed by class of annotation at the first slot of
+    call: each member of Union annotation is a separate index entry and
+    implementations with wildcard annotation (typing.Any, TypeVar) at this
+    slot are kept in separate list, so index is consistent with class hash.
+    List of dispatch key (Key, typing.Literal value) includes
+    implementations of key class, so call with key is a dict lookup too.
+
+    Attrs:
+        implementations (list): All implementations for call shape.
+        slot (int or str or None): The first slot of call (index of unnamed
+            parameter or name of named parameter), None for call without
+            parameters.
+        index (dict): Implementations by class of annotation at slot,
+            lists already include implementations with wildcard.
+        wildcards (list): Implementations compared with any class at slot.
+
+    """
+    __slots__ = ('shape', 'implementations', 'slot', 'index', 'wildcards')
+
+    def __init__(self, shape: _Shape):
+        count, names = shape
+        self.shape = shape
+        self.implementations: List[FunctionImplementation] = []
+        self.slot: Union[int, str, None] = (
+            0 if count else min(names, default=None)
+        )
+        self.index: Dict[Any, List[FunctionImplementation]] = {}
+        self.wildcards: List[FunctionImplementation] = []
+
+    def add(self, implementation: FunctionImplementation) -> None:
+        """Add implementation before all added implementations."""
+        checks = implementation.bind(*self.shape)
+
+        if checks is None:
+            return
+
+        self.implementations.insert(0, implementation)
+
+        if self.slot is None:
+            return
+
+        annotation = dict(checks)[self.slot]
+        classes = FunctionImplementation.annotation_classes(annotation)
+
+        if classes is None:
+            self.wildcards.insert(0, implementation)
+            for candidates in self.index.values():
+                candidates.insert(0, implementation)
+            return
+
+        for class_ in classes:
+            if class_ not in self.index:
+                self.index[class_] = list(
+                    self.index.get(class_[0], self.wildcards)
+                    if type(class_) is tuple else self.wildcards
+                )
+
+        for class_, candidates in self.index.items():
+            if class_ in classes or (
+                    type(class_) is tuple and class_[0] in classes
+            ):
+                candidates.insert(0, implementation)
+
+    def freeze(self) -> None:
+        """Storage implementations in tuples."""
+        self.implementations = tuple(self.implementations)
+        self.wildcards = tuple(self.wildcards)
+        self.index = {
+            class_: tuple(candidates)
+            for class_, candidates in self.index.items()
+        }
+
+    def candidates(
+            self, args: Tuple[_Type, ...], kwargs: Dict[str, _Type],
+    ) -> Sequence:
+        """Implementations, compared with call parameter at the first slot."""
+        slot = self.slot
+
+        if slot is None:
+            return self.implementations
+
+        type_ = (args if slot.__class__ is int else kwargs)[slot]
+        class_ = type_.type
+
+        # Call parameter with any type compared with all annotations.
+        if class_ is Ellipsis:
+            return self.implementations
+
+        # Dispatch key compared with annotations of key and of key class.
+        if type_.__class__ is _KeyType:
+            candidates = self.index.get(class_)
+            if candidates is not None:
+                return candidates
+
+            class_ = type_.base
+
+        return self.index.get(class_, self.wildcards)
+
+
+class LinearEngine(ABCEngine):
+    """Engine comparing call parameters with implementations, from the
+    last registered to the first.
+
+    Implementations are indexed by call shape (count of unnamed parameters
+    and names of named parameters), so call is compared only with
+    implementations, which can take parameters of this shape. Bucket of
+    shape is build at first call with it and updated on each registration.
+    In bucket implementations are indexed by class of annotation at the
+    first call parameter, so only implementations accepted class of this
+    parameter are compared.
+    """
+    __slots__ = ('_buckets',)
+
+    name = 'linear'
+
+    # Max count of storage buckets, after that buckets are rebuild.
+    buckets_limit = 1024
+
+    _buckets: Dict[_Shape, _Bucket]
+
+    def __init__(self):
+        super().__init__()
+        self._buckets = {}
+
+    def add(self, implementation: FunctionImplementation) -> None:
+        super().add(implementation)
+
+        for bucket in self._buckets.values():
+            bucket.add(implementation)
+
+    def discard(self, implementation: FunctionImplementation) -> None:
+        super().discard(implementation)
+        # Buckets are rebuilt without shadowed implementation.
+        self._buckets.clear()
+
+    def freeze(self) -> None:
+        """Build buckets for all shapes of implementations without
+        infinite parameters and storage implementations of buckets in tuples.
+        """
+        super().freeze()
+
+        for implementation in self._varieties:
+            for shape in implementation.call_shapes():
+                if shape not in self._buckets:
+                    self._build_bucket(shape)
+
+        for bucket in self._buckets.values():
+            bucket.freeze()
+
+    def find(
+            self, args: Tuple[_Type, ...], kwargs: Dict[str, _Type],
+    ) -> Optional[FunctionImplementation]:
+        shape = (len(args), frozenset(kwargs))
+
+        try:
+            bucket = self._buckets[shape]
+        except KeyError:
+            bucket = self._build_bucket(shape)
+
+        for implementation in bucket.candidates(args, kwargs):
+            if implementation.compare(named=kwargs, unnamed=args):
+                return implementation
+
+        return None
+
+    def candidates(
+            self, args: Tuple[_Type, ...], kwargs: Dict[str, _Type],
+    ) -> Sequence[FunctionImplementation]:
+        shape = (len(args), frozenset(kwargs))
+
+        try:
+            bucket = self._buckets[shape]
+        except KeyError:
+            bucket = self._build_bucket(shape)
+
+        return tuple(bucket.candidates(args, kwargs))
+
+    def compares(
+            self, args: Tuple[_Type, ...], kwargs: Dict[str, _Type],
+    ) -> int:
+        shape = (len(args), frozenset(kwargs))
+        bucket = self._buckets.get(shape)
+
+        if bucket is None:
+            return len(self._varieties)
+
+        count = 0
+        for implementation in bucket.candidates(args, kwargs):
+            count += 1
+            if implementation.compare(named=kwargs, unnamed=args):
+                break
+
+        return count
+
+    def _build_bucket(self, shape: _Shape) -> _Bucket:
+        """Collect implementations for call shape, the last registered
+        is the first.
+        """
+        if len(self._buckets) >= self.buckets_limit:
+            self._buckets.clear()
+
+        bucket = _Bucket(shape)
+        for implementation in self._varieties:
+            bucket.add(implementation)
+
+        # Implementations of frozen engine are never changed.
+        if isinstance(self._varieties, tuple):
+            bucket.freeze()
+
+        self._buckets[shape] = bucket
+        return bucket
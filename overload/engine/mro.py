@@ -0,0 +1,296 @@
+"""File contain engine class, matching subclasses of annotations."""
+from abc import get_cache_token
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+from weakref import WeakKeyDictionary
+
+from overload.type.type import _KeyType, _Type
+from overload.implementation.function import FunctionImplementation
+
+from .base import ABCEngine
+
+__all__ = (
+    'MroEngine',
+)
+
+_Shape = Tuple[int, FrozenSet[str]]
+_Checks = Tuple[
+    Tuple[Union[int, str], Optional[FrozenSet[Any]], FrozenSet[type]], ...
+]
+# Compared implementations with distances of call parameters.
+_Candidates = Sequence[Tuple[FunctionImplementation, Tuple[float, ...]]]
+
+
+class MroEngine(ABCEngine):
+    """Engine comparing call parameters with annotations by class hierarchy.
+    Parameter is compared with annotation, if annotation class is in method
+    resolution order (MRO) of parameter class.
+
+    Annotations with abstract base classes (collections.abc.Mapping,
+    numbers.Real) and runtime checkable protocols are compared by
+    issubclass too. Result of issubclass is cached by parameter class
+    until abc.get_cache_token() is changed by ABC.register.
+
+    From compared implementations the most specific is chosen: for each
+    parameter distance is a position of annotation class in MRO of
+    parameter class, abstract annotation is farther than all classes in MRO
+    except object and any type is the farthest. Implementation
+    is more specific, if all it distances are not greater. If most specific
+    implementations are ambiguous, the last registered of them is chosen.
+    """
+    __slots__ = (
+        '_buckets',
+        '_linearization',
+        '_subclasses',
+        '_subclasses_token',
+        '_has_abstract',
+    )
+
+    name = 'mro'
+    exact = False
+    first_match = False
+
+    _buckets: Dict[_Shape, List[Tuple[FunctionImplementation, _Checks]]]
+    _linearization: WeakKeyDictionary
+    _subclasses: WeakKeyDictionary
+
+    def __init__(self):
+        super().__init__()
+        self._buckets = {}
+        self._linearization = WeakKeyDictionary()
+        self._subclasses = WeakKeyDictionary()
+        self._subclasses_token = get_cache_token()
+        self._has_abstract = False
+
+    @property
+    def uses_abc_registry(self) -> bool:
+        return self._has_abstract
+
+    def add(self, implementation: FunctionImplementation) -> None:
+        super().add(implementation)
+
+        if not self._has_abstract:
+            self._has_abstract = any(
+                implementation.annotation_abstracts(annotation)
+                for annotation in (
+                    *implementation.__all_annotations__.values(),
+                    implementation.__infinite_args__,
+                    implementation.__infinite_kwargs__,
+                )
+                if annotation is not None
+            )
+
+        for shape, bucket in self._buckets.items():
+            checks = self._checks(implementation, shape)
+            if checks is not None:
+                bucket.insert(0, (implementation, checks))
+
+    def discard(self, implementation: FunctionImplementation) -> None:
+        super().discard(implementation)
+        self._buckets.clear()
+
+    def find(
+            self, args: Tuple[_Type, ...], kwargs: Dict[str, _Type],
+    ) -> Optional[FunctionImplementation]:
+        shape = (len(args), frozenset(kwargs))
+
+        try:
+            bucket = self._buckets[shape]
+        except KeyError:
+            bucket = self._buckets[shape] = [
+                (implementation, checks)
+                for implementation, checks in (
+                    (implementation, self._checks(implementation, shape))
+                    for implementation in reversed(self._varieties)
+                )
+                if checks is not None
+            ]
+
+        candidates = []
+        for implementation, checks in bucket:
+            distances = self._distances(checks, args, kwargs)
+            if distances is not None:
+                candidates.append((implementation, distances))
+
+        return self._most_specific(candidates)
+
+    def candidates(
+            self, args: Tuple[_Type, ...], kwargs: Dict[str, _Type],
+    ) -> Sequence[FunctionImplementation]:
+        shape = (len(args), frozenset(kwargs))
+        return [
+            implementation for implementation in reversed(self._varieties)
+            if self._checks(implementation, shape) is not None
+        ]
+
+    def accepts(
+            self,
+            implementation: FunctionImplementation,
+            args: Tuple[_Type, ...],
+            kwargs: Dict[str, _Type],
+    ) -> bool:
+        checks = self._checks(implementation, (len(args), frozenset(kwargs)))
+        return checks is not None and self._distances(
+            checks, args, kwargs,
+        ) is not None
+
+    def compares(
+            self, args: Tuple[_Type, ...], kwargs: Dict[str, _Type],
+    ) -> int:
+        # Each implementation of shape bucket is compared.
+        bucket = self._buckets.get((len(args), frozenset(kwargs)))
+        return len(self._varieties) if bucket is None else len(bucket)
+
+    def _positions(self, class_: Any) -> Dict[Any, int]:
+        """Positions of base classes in MRO of class, cached by class.
+        Class itself (position 0) isn't stored, so cached positions don't
+        keep the class alive.
+        """
+        try:
+            return self._linearization[class_]
+        except KeyError:
+            pass
+        except TypeError:
+            # Not class can't be weak referenced, it isn't cached.
+            return {}
+
+        positions = {}
+        for index, base in enumerate(getattr(class_, '__mro__', ())):
+            if index:
+                positions.setdefault(base, index)
+
+        self._linearization[class_] = positions
+        return positions
+
+    def _is_subclass(self, class_: Any, abstract: type) -> bool:
+        """Cached issubclass for abstract annotation."""
+        token = get_cache_token()
+        if token != self._subclasses_token:
+            self._subclasses = WeakKeyDictionary()
+            self._subclasses_token = token
+
+        try:
+            results = self._subclasses[class_]
+        except KeyError:
+            results = self._subclasses[class_] = {}
+        except TypeError:
+            results = {}
+
+        try:
+            return results[abstract]
+        except KeyError:
+            pass
+
+        try:
+            result = issubclass(class_, abstract)
+        except TypeError:
+            # Not class or protocol with not method members.
+            result = False
+
+        results[abstract] = result
+        return result
+
+    def _distances(
+            self,
+            checks: _Checks,
+            args: Tuple[_Type, ...],
+            kwargs: Dict[str, _Type],
+    ) -> Optional[Tuple[float, ...]]:
+        """Distances of call parameters to annotations, None if parameters
+        isn't compared with annotations.
+        """
+        distances = []
+
+        for slot, classes, abstracts in checks:
+            type_ = (args if slot.__class__ is int else kwargs)[slot]
+            class_ = type_.type
+
+            if class_ is Ellipsis:
+                distances.append(0)
+                continue
+
+            # Dispatch key is more specific than classes in MRO of key
+            # class.
+            offset = 0
+            if type_.__class__ is _KeyType:
+                key, class_, offset = class_, type_.base, 1
+
+            positions = self._positions(class_)
+            length = len(positions) + 1 + offset
+
+            # Any class is less specific than all classes in MRO.
+            if classes is None:
+                distances.append(length)
+                continue
+
+            if offset and key in classes:
+                distance = 0
+            elif class_ in classes:
+                distance = offset
+            else:
+                distance = min(
+                    (positions[annotation] + offset for annotation in classes
+                     if annotation in positions),
+                    default=None,
+                )
+
+            if distance is None and any(
+                    self._is_subclass(class_, abstract)
+                    for abstract in abstracts
+            ):
+                # Abstract class is less specific than all classes in MRO,
+                # except object.
+                distance = length - 1.5
+
+            if distance is None:
+                return None
+
+            distances.append(distance)
+
+        return tuple(distances)
+
+    @staticmethod
+    def _most_specific(
+            candidates: _Candidates,
+    ) -> Optional[FunctionImplementation]:
+        """Choose the first candidate, which distances aren't dominated by
+        other candidate distances.
+        """
+        for implementation, distances in candidates:
+            for _, other in candidates:
+                if other != distances and all(
+                        other_distance <= distance
+                        for other_distance, distance in zip(other, distances)
+                ):
+                    break
+            else:
+                return implementation
+
+        return None
+
+    @staticmethod
+    def _checks(
+            implementation: FunctionImplementation, shape: _Shape,
+    ) -> Optional[_Checks]:
+        """Slots of call and classes of annotation, compared at this slots."""
+        checks = implementation.bind(*shape)
+
+        if checks is None:
+            return None
+
+        return tuple(
+            (
+                slot,
+                implementation.annotation_classes(annotation),
+                implementation.annotation_abstracts(annotation),
+            )
+            for slot, annotation in checks
+        )
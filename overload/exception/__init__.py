@@ -5,7 +5,27 @@
         100 - 199:  Type module exceptions.
         200 - 299:  Overloader module exceptions.
 
+    Warnings of registration analysis are subclasses of OverloadWarning.
+
 """
 from .base import *
 from .overloader import *
 from .type import *
+
+# Warnings are imported at the first warning or access (PEP 562).
+_WARNINGS = (
+    'OverloadWarning',
+    'ShadowedImplementationWarning',
+    'AmbiguousImplementationWarning',
+)
+
+
+def __getattr__(name: str):
+    if name not in _WARNINGS:
+        raise AttributeError(
+            f'module {__name__!r} has no attribute {name!r}'
+        )
+
+    from . import warning
+
+    return getattr(warning, name)
@@ -1,3 +1,5 @@
+from typing import Iterable
+
 from .base import OverloadException
 
 __all__ = (
@@ -8,6 +10,13 @@ __all__ = (
     'AnnotationCountError',
     'ArgumentNameError',
     'OverlappingError',
+    'UnknownEngine',
+    'FrozenOverloaderError',
+    'CompileEngineError',
+    'MethodRegisterTypeError',
+    'CoroutineMixError',
+    'StatsDisabledError',
+    'OverloaderLookupError',
 )
 
 
@@ -82,3 +91,116 @@ class OverlappingError(RegisterTypeError):
 
     _text = 'Implementation annotations duplicate overloading object.'
     _code = 206
+
+
+class UnknownEngine(OverloaderError):
+    """Exception raise if overloader created with unknown matching engine."""
+
+    __slots__ = ()
+
+    _text = 'Unknown matching engine {engine}, available engines: {engines}.'
+    _code = 207
+
+    def __init__(self, engine: str, engines: Iterable[str]):
+        """
+        Args:
+            engine (str): Name of unknown engine.
+            engines (iterable): Names of available engines.
+
+        """
+        super().__init__(
+            self._text.format(engine=engine, engines=', '.join(engines))
+        )
+
+
+class FrozenOverloaderError(OverloaderError):
+    """Exception raise if user try registering implementation in frozen
+    overloader."""
+
+    __slots__ = ()
+
+    _text = 'Overloader is frozen, implementations can not be registered.'
+    _code = 208
+
+
+class CompileEngineError(OverloaderError):
+    """Exception raise if user try generate dispatch function for overloader,
+    which engine compare types not by equality."""
+
+    __slots__ = ()
+
+    _text = (
+        'Dispatch function can be generated only for overloader with engine, '
+        'comparing types by equality.'
+    )
+    _code = 209
+
+
+class MethodRegisterTypeError(RegisterTypeError):
+    """Exception raise if user try registering in method overloader
+    something but function or method of other kind (class method for
+    static method overloader)."""
+
+    __slots__ = ()
+
+    _text = (
+        'Incorrect type of registering object. Method overloader can '
+        'registering only functions or methods of the same kind as '
+        'overloaded method.'
+    )
+    _code = 210
+
+
+class CoroutineMixError(RegisterTypeError):
+    """Exception raise if user try registering coroutine function as
+    implementation of plain function or plain function as implementation
+    of coroutine function."""
+
+    __slots__ = ()
+
+    _text = (
+        'Implementations of overloaded object must be all coroutine '
+        'functions (async def) or all plain functions.'
+    )
+    _code = 211
+
+
+class StatsDisabledError(OverloaderError):
+    """Exception raise if user try getting statistic of dispatching from
+    overloader, which was created without statistic."""
+
+    __slots__ = ()
+
+    _text = (
+        'Statistic of dispatching is disabled, overloader must be created '
+        'with stats=True.'
+    )
+    _code = 212
+
+
+class OverloaderLookupError(OverloaderError):
+    """Exception raise if overloader isn't found by module and qualified
+    name of overloaded function, when calls are sent to executor."""
+
+    __slots__ = ()
+
+    _text = (
+        'Overloader {qualname} is not found in module {module}, overloader '
+        'of parallel calls must be defined at module level.'
+    )
+    _code = 213
+
+    def __init__(self, module: str, qualname: str):
+        """
+        Args:
+            module (str): Module of overloaded function.
+            qualname (str): Qualified name of overloaded function.
+
+        """
+        super().__init__(self._text.format(module=module, qualname=qualname))
+        self.module = module
+        self.qualname = qualname
+
+    def __reduce__(self):
+        # Exception is raised in worker process and pickled to caller.
+        return self.__class__, (self.module, self.qualname)
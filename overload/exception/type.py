@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Iterable
 
 from .base import OverloadException
 
@@ -9,6 +9,7 @@ __all__ = (
     'CustomTypeAlreadyExist',
     'IndexValueError',
     'SingleTypeError',
+    'UnknownDeepStrategy',
 )
 
 
@@ -95,3 +96,23 @@ class SingleTypeError(TypeException):
 
     def __init__(self, type_: type):
         super().__init__(self._text.format(type=type_))
+
+
+class UnknownDeepStrategy(TypeException):
+    """Exception raise if deep checking of collections created with unknown
+    sampling strategy."""
+    __slots__ = ()
+
+    _text = 'Unknown deep strategy {strategy}, available strategies: {all}.'
+    _code = 106
+
+    def __init__(self, strategy: str, strategies: Iterable[str]):
+        """
+        Args:
+            strategy (str): Name of unknown strategy.
+            strategies (iterable): Names of available strategies.
+
+        """
+        super().__init__(
+            self._text.format(strategy=strategy, all=', '.join(strategies))
+        )
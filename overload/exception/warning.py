@@ -0,0 +1,21 @@
+__all__ = (
+    'OverloadWarning',
+    'ShadowedImplementationWarning',
+    'AmbiguousImplementationWarning',
+)
+
+
+class OverloadWarning(UserWarning):
+    """Base warning of overload lib."""
+
+
+class ShadowedImplementationWarning(OverloadWarning):
+    """Warning raise if registered implementation compare all calls of
+    already registered implementation, so it implementation is never
+    called."""
+
+
+class AmbiguousImplementationWarning(OverloadWarning):
+    """Warning raise if registered implementation and already registered
+    implementation compare same calls, but neither compare all calls of
+    other, so calls are dispatched by registration order."""
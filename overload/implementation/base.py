@@ -49,6 +49,18 @@ class ABCImplementation(metaclass=ABCMeta):
         """Comparing parameters with storage annotations."""
         ...
 
+    @abstractmethod
+    def covers(self, other: 'ABCImplementation', exact: bool = True) -> bool:
+        """Check all calls, compared with other implementation, are
+        compared with this implementation too.
+        """
+        ...
+
+    @abstractmethod
+    def overlaps(self, other: 'ABCImplementation') -> bool:
+        """Check some call is compared with both implementations."""
+        ...
+
     @abstractmethod
     def _separate_annotations(self, implementation: Any,
                               annotations: Dict[str, _Type]) -> None:
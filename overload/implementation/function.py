@@ -1,8 +1,27 @@
 """File contain function implementation class."""
+from itertools import combinations
 from types import FunctionType
-from typing import Union, Dict, List, Tuple, FrozenSet, Optional, Set
+from typing import (
+    AbstractSet,
+    Any,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
-from overload.type.type import _Type, _ArgsType, _KwargsType, Args, Kwargs
+from overload.type.type import (
+    _Type,
+    _KeyType,
+    _ArgsType,
+    _KwargsType,
+    _SingleType,
+    _TypeHandler,
+    Args,
+    Kwargs,
+)
 from overload.exception.overloader import MissedAnnotations
 from overload.exception.type import SingleTypeError
 
@@ -12,6 +31,11 @@ __all__ = (
     'FunctionImplementation',
 )
 
+# Max count of call shapes, collected for one implementation.
+SHAPES_LIMIT = 64
+# Signature of implementation isn't collected yet.
+_NO_SIGNATURE = object()
+
 
 class FunctionImplementation(ABCImplementation):
     """Implementation for overload function."""
@@ -25,6 +49,15 @@ class FunctionImplementation(ABCImplementation):
         '__only_args__',
         '__infinite_args__',
         '__infinite_kwargs__',
+        '__positional__',
+        '__positional_slots__',
+        '__positional_classes__',
+        '__keyword_classes__',
+        '__infinite_args_classes__',
+        '__infinite_kwargs_classes__',
+        '__nested__',
+        '_all_annotations',
+        '_signature_cache',
     )
 
     __kwargs_annotations__: Dict[str, _Type]
@@ -36,10 +69,21 @@ class FunctionImplementation(ABCImplementation):
     __only_args__: FrozenSet[str]
     __infinite_args__: Optional[_ArgsType]
     __infinite_kwargs__: Optional[_KwargsType]
+    # Precomputed matcher, classes of annotation or None for any class.
+    __positional__: Tuple[str, ...]
+    __positional_slots__: Dict[str, int]
+    __positional_classes__: Tuple[Optional[FrozenSet[Any]], ...]
+    __keyword_classes__: Dict[str, Optional[FrozenSet[Any]]]
+    __infinite_args_classes__: Optional[FrozenSet[Any]]
+    __infinite_kwargs_classes__: Optional[FrozenSet[Any]]
+    # Some annotation contain inner types of collection (deep annotation).
+    __nested__: bool
+
+    _all_annotations: Dict[str, _Type]
 
     @property
     def __all_annotations__(self) -> Dict[str, _Type]:
-        return {**self.__args_annotations__, **self.__kwargs_annotations__}
+        return self._all_annotations
 
     def compare(
             self,
@@ -56,99 +100,522 @@ class FunctionImplementation(ABCImplementation):
         """
         named = named or {}
         unnamed = unnamed or ()
-        check_args = self.__args_annotations__.copy()
-        check_kwargs = self.__kwargs_annotations__.copy()
+        positional_classes = self.__positional_classes__
 
         # Compare named parameters.
         # Check: in named parameters missed kwargs only parameters without
         # default value and is only args in kwargs.
-        set_named = set(named.keys())
-        is_missed_kwargs = bool(self.__kwargs_without_defaults__ - set_named)
-        is_only_args_in_kwargs = bool(self.__only_args__ & set_named)
-
-        if is_missed_kwargs or is_only_args_in_kwargs:
+        if (
+                not self.__kwargs_without_defaults__ <= named.keys()
+                or not self.__only_args__.isdisjoint(named)
+        ):
             return False
 
-        # Check kwargs parameter values types.
+        # Args parameters after the first args parameter passed with key,
+        # can be passed only with key too.
+        border = len(positional_classes)
+
         for param, type_ in named.items():
             try:
-                # Check type of parameter.
-                if not self._compare_type(
-                        type_,
-                        check_kwargs.pop(param),
-                ):
-                    return False
-
-            # Parameter not found in registered kwargs annotations.
+                classes = self.__keyword_classes__[param]
             except KeyError:
-                # Parameter not found in args and nas not default value and
-                # implementation hasn't kwargs.
-                if (
-                        param not in self.__args_annotations__
-                        and not self.__infinite_kwargs__
-                ):
-                    return False
+                slot = self.__positional_slots__.get(param)
 
-                # Parameter from args, check it.
-                elif param in self.__args_annotations__:
-                    try:
-                        # Slice check_args.
-                        found_border = False
-                        for key, value in self.__args_annotations__.items():
-                            if found_border:
-                                # Transition args to kwargs.
-                                try:
-                                    check_kwargs[key] = check_args.pop(key)
-                                except KeyError:
-                                    break
-
-                            # Find parameter in args.
-                            elif key == param:
-                                found_border = True
-
-                                # Check parameter type.
-                                if not self._compare_type(
-                                        type_,
-                                        check_args.pop(param),
-                                ):
-                                    return False
-
-                    # Parameter not found in registered args or kwargs.
-                    except KeyError:
-                        return False
+                if slot is not None:
+                    classes = positional_classes[slot]
+                    if slot < border:
+                        border = slot
 
                 # Parameters not in kwargs and args check it with infinite.
-                elif type_ not in self.__infinite_kwargs__:
+                elif self.__infinite_kwargs__:
+                    classes = self.__infinite_kwargs_classes__
+                else:
                     return False
 
+            if not (
+                    classes is None
+                    or type_.type in classes
+                    or type_.type is Ellipsis
+                    or (type_.__class__ is _KeyType and type_.base in classes)
+            ):
+                return False
+
         # Compare unnamed parameters.
-        check_args_keys = tuple(check_args.keys())
+        count = len(unnamed)
+        if count > border and not self.__infinite_args__:
+            return False
 
-        # Check args types.
-        index = -1
         for index, type_ in enumerate(unnamed):
+            if index < border:
+                classes = positional_classes[index]
+            else:
+                classes = self.__infinite_args_classes__
+
+            if not (
+                    classes is None
+                    or type_.type in classes
+                    or type_.type is Ellipsis
+                    or (type_.__class__ is _KeyType and type_.base in classes)
+            ):
+                return False
+
+        # Check args without defaults, not passed in unnamed parameters.
+        return not (
+                count < border
+                and count < len(self.__args_without_defaults__)
+        )
+
+    def mismatch(
+            self,
+            named: Dict[str, _Type] = None,
+            unnamed: Union[List[_Type], Tuple[_Type, ...]] = None,
+    ) -> Optional[Tuple[str, Optional[Union[int, str]], str]]:
+        """Explain, why parameters aren't compared with implementation.
+        Checks are done in the same order as by compare, but they are
+        slower, so it isn't used for dispatching.
+
+        Args:
+            named (dict): Dict with format {parameter_name : type}.
+            unnamed (list or tuple): Parameters passed without key.
+                Sequence of type.
+
+        Returns:
+            None if parameters are compared, else tuple (reason, slot,
+            description), where slot is index of unnamed parameter or name
+            of named parameter (None if reason isn't related to one
+            parameter) and reason is one of:
+                missed_keyword - keyword only parameter without default
+                    isn't passed,
+                positional_by_name - positional only parameter is passed
+                    with key,
+                unexpected_keyword - implementation hasn't parameter with
+                    this name,
+                type_mismatch - class of parameter isn't compared with
+                    annotation,
+                too_many_positional - count of unnamed parameters is
+                    greater than count of positional parameters,
+                missed_positional - positional parameters without default
+                    aren't passed.
+
+        """
+        named = named or {}
+        unnamed = unnamed or ()
+        positional = self.__positional__
+
+        missed = sorted(self.__kwargs_without_defaults__ - named.keys())
+        if missed:
+            return 'missed_keyword', missed[0], (
+                f'missed keyword only parameters: {", ".join(missed)}'
+            )
+
+        for param in named:
+            if param in self.__only_args__:
+                return 'positional_by_name', param, (
+                    f'positional only parameter {param} is passed by name'
+                )
+
+        border = len(positional)
+
+        for param, type_ in named.items():
             try:
-                if not self._compare_type(
-                        type_,
-                        check_args.pop(check_args_keys[index]),
-                ):
+                classes = self.__keyword_classes__[param]
+            except KeyError:
+                slot = self.__positional_slots__.get(param)
+
+                if slot is not None:
+                    classes = self.__positional_classes__[slot]
+                    border = min(border, slot)
+                elif self.__infinite_kwargs__:
+                    classes = self.__infinite_kwargs_classes__
+                else:
+                    return 'unexpected_keyword', param, (
+                        f'implementation has no parameter {param}'
+                    )
+
+            if not self._type_compared(type_, classes):
+                return 'type_mismatch', param, self._mismatch_description(
+                    param, type_, classes,
+                )
+
+        count = len(unnamed)
+        if count > border and not self.__infinite_args__:
+            return 'too_many_positional', border, (
+                f'{count} unnamed parameters are passed, implementation '
+                f'takes {border}'
+            )
+
+        for index, type_ in enumerate(unnamed):
+            if index < border:
+                classes = self.__positional_classes__[index]
+                name = positional[index]
+            else:
+                classes = self.__infinite_args_classes__
+                name = f'*args[{index - border}]'
+
+            if not self._type_compared(type_, classes):
+                return 'type_mismatch', index, self._mismatch_description(
+                    name, type_, classes,
+                )
+
+        missed = [
+            name for name in positional[count:border]
+            if name not in self.__default_args__
+        ]
+        if missed:
+            return 'missed_positional', None, (
+                f'missed positional parameters: {", ".join(missed)}'
+            )
+
+        return None
+
+    def accepts_shape(self, count: int, names: AbstractSet[str]) -> bool:
+        """Check call with shape can be compared with implementation by
+        count of parameters and their names only.
+
+        Args:
+            count (int): Count of parameters passed without key.
+            names (set): Names of parameters passed with key.
+
+        """
+        if (
+                self.__kwargs_without_defaults__ - names
+                or self.__only_args__ & names
+        ):
+            return False
+
+        positional = self.__positional__
+        border = len(positional)
+
+        for name in names:
+            if name in self.__positional_slots__:
+                border = min(border, self.__positional_slots__[name])
+            elif (
+                    name not in self.__kwargs_annotations__
+                    and not self.__infinite_kwargs__
+            ):
+                return False
+
+        if count > border and not self.__infinite_args__:
+            return False
+
+        return not self.__args_without_defaults__.intersection(
+            positional[count:border]
+        )
+
+    def call_shapes(
+            self, limit: int = SHAPES_LIMIT,
+    ) -> List[Tuple[int, FrozenSet[str]]]:
+        """Collect call shapes (count of parameters passed without key,
+        names of parameters passed with key), compared with implementation
+        without infinite parameters.
+
+        Args:
+            limit (int): Max count of collected shapes.
+
+        """
+        positional = self.__positional__
+        required = self.__kwargs_without_defaults__
+        optional_kwargs = sorted(self.__kwargs_annotations__.keys() - required)
+        shapes = []
+
+        for count in range(len(positional) + 1):
+            optional = optional_kwargs + [
+                name for name in positional[count:]
+                if name not in self.__only_args__
+            ]
+
+            for size in range(len(optional) + 1):
+                for names in combinations(optional, size):
+                    if len(shapes) >= limit:
+                        return shapes
+
+                    names = required | frozenset(names)
+                    if self.accepts_shape(count, names):
+                        shapes.append((count, names))
+
+        return shapes
+
+    def bind(
+            self, count: int, names: AbstractSet[str],
+    ) -> Optional[Tuple[Tuple[Union[int, str], Any], ...]]:
+        """Bind call shape to implementation parameters without types
+        comparing. Result is the same as compare result for any call with
+        this shape, if all returned checks are succeed.
+
+        Args:
+            count (int): Count of parameters passed without key.
+            names (set): Names of parameters passed with key.
+
+        Returns:
+            Tuple of pairs (slot, annotation), where slot is index of
+            unnamed parameter or name of named parameter and annotation is
+            _Type, tuple of _Type (Union) or _SingleType (Args, Kwargs).
+            None if call with this shape never compared.
+
+        """
+        if (
+                self.__kwargs_without_defaults__ - names
+                or self.__only_args__ & names
+        ):
+            return None
+
+        positional = self.__positional__
+        # Parameters after first args parameter passed with key, can be
+        # passed only with key too.
+        border = len(positional)
+        checks = []
+
+        for name in names:
+            if name in self.__kwargs_annotations__:
+                checks.append((name, self.__kwargs_annotations__[name]))
+            elif name in self.__positional_slots__:
+                border = min(border, self.__positional_slots__[name])
+                checks.append((name, self.__args_annotations__[name]))
+            elif self.__infinite_kwargs__:
+                checks.append((name, self.__infinite_kwargs__))
+            else:
+                return None
+
+        for index in range(count):
+            if index < border:
+                checks.append(
+                    (index, self.__args_annotations__[positional[index]])
+                )
+            elif self.__infinite_args__:
+                checks.append((index, self.__infinite_args__))
+            else:
+                return None
+
+        # Missed args without defaults.
+        if set(positional[count:border]) - self.__default_args__:
+            return None
+
+        return tuple(checks)
+
+    def covers(
+            self, other: 'FunctionImplementation', exact: bool = True,
+    ) -> bool:
+        """Check all calls, compared with other implementation, are
+        compared with this implementation too. Implementations with infinite
+        parameters never cover and aren't covered.
+
+        Args:
+            other (FunctionImplementation): Compared implementation.
+            exact (bool): Call parameters classes are compared with
+                annotations by equality, else annotations must be equal.
+
+        """
+        signature, other_signature = self._signature(), other._signature()
+
+        if signature is None or other_signature is None:
+            return False
+
+        for shape, other_slots in other_signature.items():
+            slots = signature.get(shape)
+            if slots is None:
+                return False
+
+            for slot, other_annotation in other_slots.items():
+                classes = slots[slot][0]
+                other_classes = other_annotation[0]
+
+                # Deep annotation compare only part of values of classes.
+                if slots[slot][2] is not None:
                     return False
 
-            # Check args is ended, but unnamed exists. Check it with infinite.
-            except IndexError:
-                if (
-                        not self.__infinite_args__
-                        or type_ not in self.__infinite_args__
+                if not exact:
+                    if slots[slot] != other_annotation:
+                        return False
+                elif not (
+                        classes is None
+                        or (other_classes is not None
+                            and self._classes_cover(classes, other_classes))
                 ):
                     return False
 
-        if check_args:
-            # Check args without defaults in check annotations.
-            if set(check_args_keys[index + 1:]) - self.__default_args__:
-                return False
-
         return True
 
+    def overlaps(self, other: 'FunctionImplementation') -> bool:
+        """Check some call, compared by equality of classes, is compared
+        with both implementations.
+        """
+        signature, other_signature = self._signature(), other._signature()
+
+        if signature is None or other_signature is None:
+            return False
+
+        for shape, slots in signature.items():
+            other_slots = other_signature.get(shape)
+            if other_slots is None:
+                continue
+
+            if all(
+                    (
+                        classes is None
+                        or other_slots[slot][0] is None
+                        or self._classes_overlap(
+                            classes, other_slots[slot][0],
+                        )
+                    ) and (
+                        nested is None
+                        or other_slots[slot][2] is None
+                        or _TypeHandler.annotations_match(
+                            nested, other_slots[slot][2],
+                        )
+                    )
+                    for slot, (classes, _, nested) in slots.items()
+            ):
+                return True
+
+        return False
+
+    def index_keys(self) -> Optional[Tuple[FrozenSet[tuple], ...]]:
+        """Keys of implementation in index of registered implementations
+        and keys of implementations, which can be covered by it or overlap
+        it. Key contain call shape and class (or dispatch key) of the first
+        slot of shape, so only implementations with common call shape and
+        compared classes of the first slot are checked by covers and
+        overlaps. None if implementation never covers and overlaps.
+        """
+        signature = self._signature()
+
+        if signature is None:
+            return None
+
+        # Implementation without call shapes is covered by any one.
+        shapeless = ('shapeless',)
+        if not signature:
+            return frozenset((shapeless,)), frozenset((shapeless,))
+
+        stored, looked_up = set(), {shapeless}
+
+        for shape, slots in signature.items():
+            stored.add(('shape', shape))
+            classes = None
+
+            if slots:
+                count, names = shape
+                classes = slots[0 if count else min(names)][0]
+
+            if classes is None:
+                stored.add(('any', shape))
+                looked_up.add(('shape', shape))
+                continue
+
+            looked_up.add(('any', shape))
+
+            for class_ in classes:
+                stored.add(('class', shape, class_))
+                looked_up.add(('class', shape, class_))
+
+                # Dispatch key is compared with annotation of its class.
+                if type(class_) is tuple:
+                    stored.add(('key', shape, class_[0]))
+                    looked_up.add(('class', shape, class_[0]))
+                else:
+                    looked_up.add(('key', shape, class_))
+
+        return frozenset(stored), frozenset(looked_up)
+
+    @staticmethod
+    def _classes_cover(
+            classes: FrozenSet[Any], other_classes: FrozenSet[Any],
+    ) -> bool:
+        """All classes and dispatch keys of other annotation are compared
+        with annotation: class is compared with all keys of class.
+        """
+        return all(
+            class_ in classes
+            or (type(class_) is tuple and class_[0] in classes)
+            for class_ in other_classes
+        )
+
+    @staticmethod
+    def _classes_overlap(
+            classes: FrozenSet[Any], other_classes: FrozenSet[Any],
+    ) -> bool:
+        """Some class or dispatch key is compared with both annotations."""
+        if not classes.isdisjoint(other_classes):
+            return True
+
+        return any(
+            type(class_) is tuple and class_[0] in second
+            for first, second in (
+                (classes, other_classes), (other_classes, classes),
+            )
+            for class_ in first
+        )
+
+    @staticmethod
+    def _type_compared(
+            type_: _Type, classes: Optional[FrozenSet[Any]],
+    ) -> bool:
+        """Type of call parameter is compared with classes of annotation,
+        the same check as in compare.
+        """
+        return (
+            classes is None
+            or type_.type in classes
+            or type_.type is Ellipsis
+            or (type_.__class__ is _KeyType and type_.base in classes)
+        )
+
+    @staticmethod
+    def _mismatch_description(
+            name: Union[int, str],
+            type_: _Type,
+            classes: FrozenSet[Any],
+    ) -> str:
+        """Description of type of parameter, not compared with annotation."""
+        def class_name(class_: Any) -> str:
+            return getattr(class_, '__qualname__', repr(class_))
+
+        expected = ', '.join(sorted(map(class_name, classes)))
+        return (f'parameter {name} has type {class_name(type_.type)}, '
+                f'annotation takes {expected}')
+
+    def _signature(self) -> Optional[Dict[Tuple[int, FrozenSet[str]], Dict[
+        Union[int, str],
+        Tuple[Optional[FrozenSet[Any]], FrozenSet[type], Any],
+    ]]]:
+        """Classes, abstract classes and deep annotation (None if
+        annotation has no inner types) at each slot for all call shapes,
+        which pass all parameters without defaults.
+        None if call shapes can't be collected. Signature is collected once,
+        because annotations of implementation are never changed.
+        """
+        if self._signature_cache is _NO_SIGNATURE:
+            self._signature_cache = self._collect_signature()
+
+        return self._signature_cache
+
+    def _collect_signature(self) -> Optional[Dict[Any, Dict[Any, Any]]]:
+        """Collect signature of implementation, see _signature."""
+        if self.__infinite_args__ or self.__infinite_kwargs__:
+            return None
+
+        shapes = self.call_shapes()
+        if len(shapes) >= SHAPES_LIMIT:
+            return None
+
+        positional = self.__positional__
+        shapes = [
+            (count, names) for count, names in shapes
+            if set(positional[count:]) - self.__default_args__ <= names
+        ]
+
+        return {
+            shape: {
+                slot: (
+                    self.annotation_classes(annotation),
+                    self.annotation_abstracts(annotation),
+                    annotation if self.annotation_nested(annotation) else None,
+                )
+                for slot, annotation in self.bind(*shape)
+            }
+            for shape in shapes
+        }
+
     def _separate_annotations(self, implementation: FunctionType,
                               annotations: Dict[str, _Type]) -> None:
         """Separate function annotations to de."""
@@ -161,8 +628,9 @@ class FunctionImplementation(ABCImplementation):
         self.__infinite_args__ = None
         only_args = {}
 
-        args_count = implementation.__code__.co_argcount
-        kwargs_count = implementation.__code__.co_kwonlyargcount
+        args_count, kwargs_count, args_only = self._parameters_count(
+            implementation,
+        )
 
         # Check all parameters has been annotation.
         parameters_count = args_count + kwargs_count
@@ -173,8 +641,6 @@ class FunctionImplementation(ABCImplementation):
                 f'implementation parameters must be annotated.'
             )
 
-        args_only = getattr(implementation.__code__, 'co_posonlyargcount', 0)
-
         # Split annotations to args and kwargs. Counter track parameter index.
         counter = 0
         for key, value in annotations.items():
@@ -240,11 +706,108 @@ class FunctionImplementation(ABCImplementation):
             self.__default_args__ = frozenset()
             self.__args_without_defaults__ = frozenset(args_annotations_keys)
 
+        self._prepare_matcher()
+
     @staticmethod
-    def _compare_type(type_: _Type,
-                      parameter: Union[_Type, Set[_Type]]) -> bool:
-        """Compare type with annotation parameter type."""
-        return False if (
-                (isinstance(parameter, _Type) and type_ != parameter)
-                or (isinstance(parameter, set) and type_ not in parameter)
-        ) else True
+    def _parameters_count(implementation: FunctionType) -> Tuple[int, ...]:
+        """Count of args, kwargs only and args only parameters, compared
+        with call parameters.
+        """
+        code = implementation.__code__
+        return (
+            code.co_argcount,
+            code.co_kwonlyargcount,
+            getattr(code, 'co_posonlyargcount', 0),
+        )
+
+    def _prepare_matcher(self) -> None:
+        """Precompute parameters slots and classes of annotations, which
+        don't depend on call."""
+        self._all_annotations = {
+            **self.__args_annotations__, **self.__kwargs_annotations__,
+        }
+        self.__positional__ = tuple(self.__args_annotations__.keys())
+        self.__positional_slots__ = {
+            name: slot for slot, name in enumerate(self.__positional__)
+        }
+        self.__positional_classes__ = tuple(
+            self.annotation_classes(annotation)
+            for annotation in self.__args_annotations__.values()
+        )
+        self.__keyword_classes__ = {
+            name: self.annotation_classes(annotation)
+            for name, annotation in self.__kwargs_annotations__.items()
+        }
+        self.__infinite_args_classes__ = (
+            self.annotation_classes(self.__infinite_args__)
+            if self.__infinite_args__ else None
+        )
+        self.__infinite_kwargs_classes__ = (
+            self.annotation_classes(self.__infinite_kwargs__)
+            if self.__infinite_kwargs__ else None
+        )
+        self._signature_cache = _NO_SIGNATURE
+        self.__nested__ = any(
+            self.annotation_nested(annotation)
+            for annotation in (
+                *self._all_annotations.values(),
+                self.__infinite_args__,
+                self.__infinite_kwargs__,
+            )
+            if annotation is not None
+        )
+
+    @staticmethod
+    def annotation_classes(
+            annotation: Union[_Type, Tuple[_Type, ...], _SingleType],
+    ) -> Optional[FrozenSet[Any]]:
+        """Classes of annotation members, compared by equality.
+        None if annotation compared with any type.
+        """
+        if isinstance(annotation, _Type):
+            members = (annotation,)
+        elif isinstance(annotation, _SingleType):
+            members = annotation.types
+        else:
+            members = annotation
+
+        classes = set()
+        for member in members:
+            if member.type is Ellipsis:
+                return None
+            classes.add(member.type)
+
+        return frozenset(classes)
+
+    @staticmethod
+    def annotation_abstracts(
+            annotation: Union[_Type, Tuple[_Type, ...], _SingleType],
+    ) -> FrozenSet[type]:
+        """Abstract base classes and runtime checkable protocols of
+        annotation members.
+        """
+        if isinstance(annotation, _Type):
+            members = (annotation,)
+        elif isinstance(annotation, _SingleType):
+            members = annotation.types
+        else:
+            members = annotation
+
+        return frozenset(
+            member.abstract for member in members
+            if member.abstract is not None
+        )
+
+    @staticmethod
+    def annotation_nested(
+            annotation: Union[_Type, Tuple[_Type, ...], _SingleType],
+    ) -> bool:
+        """Some member of annotation contain inner types of collection."""
+        if isinstance(annotation, _Type):
+            return annotation.is_nested
+        elif isinstance(annotation, _SingleType):
+            members = annotation.types
+        else:
+            members = annotation
+
+        return any(member.is_nested for member in members)
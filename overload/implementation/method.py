@@ -0,0 +1,63 @@
+"""File contain method implementation class."""
+from types import FunctionType
+from typing import Dict, Tuple
+
+from overload.type.type import _Type
+
+from .function import FunctionImplementation
+
+__all__ = (
+    'MethodImplementation',
+)
+
+
+class MethodImplementation(FunctionImplementation):
+    """Implementation for overload method. The first parameter of instance
+    method or class method is a receiver (self or cls), it isn't compared
+    with call parameters and is passed to implementation separately.
+
+    Args:
+        implementation (FunctionType): Function of method.
+        annotations (dict): Converted annotations of function.
+        receiver (bool): The first parameter of function is a receiver,
+            False for static method.
+
+    """
+    __slots__ = ('_receiver',)
+
+    _receiver: bool
+
+    def __init__(
+            self,
+            implementation: FunctionType,
+            annotations: Dict[str, _Type],
+            receiver: bool = True,
+    ) -> None:
+        self._receiver = receiver
+        super().__init__(implementation, annotations)
+
+    @property
+    def receiver(self) -> bool:
+        """The first parameter of implementation is a receiver."""
+        return self._receiver
+
+    def _separate_annotations(self, implementation: FunctionType,
+                              annotations: Dict[str, _Type]) -> None:
+        """Separate function annotations without receiver annotation."""
+        if self._receiver and implementation.__code__.co_argcount:
+            annotations.pop(implementation.__code__.co_varnames[0], None)
+
+        super()._separate_annotations(implementation, annotations)
+
+    def _parameters_count(
+            self, implementation: FunctionType,
+    ) -> Tuple[int, ...]:
+        args_count, kwargs_count, args_only = super()._parameters_count(
+            implementation,
+        )
+
+        if self._receiver and args_count:
+            args_count -= 1
+            args_only = max(args_only - 1, 0)
+
+        return args_count, kwargs_count, args_only
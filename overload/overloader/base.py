@@ -1,14 +1,50 @@
-from typing import Any, List
-from abc import ABCMeta, abstractmethod
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+from abc import ABCMeta, abstractmethod, get_cache_token
+from time import perf_counter_ns
+from weakref import ref
 
 from overload.exception.overloader import (
     AnnotationCountError,
     ArgumentNameError,
     OverlappingError,
+    UnknownEngine,
+    FrozenOverloaderError,
+    StatsDisabledError,
+    CompileEngineError,
+)
+from overload.type.type import (
+    _KeyType,
+    _SingleType,
+    _Type,
+    _TypeHandler,
+    _ValueType,
 )
-from overload.type.type import _TypeHandler
 from overload.implementation.base import ABCImplementation
 from overload.exception.overloader import MissedAnnotations
+from overload.overloader.cache import CacheInfo, DispatchCache
+from overload.engine import ENGINES, engine_class
+
+# Engines, statistic, explanation and warnings are imported at the first
+# use, so import of decorators is faster.
+if TYPE_CHECKING:
+    from overload.engine.base import ABCEngine
+    from overload.overloader.explain import CallReport
+    from overload.overloader.stats import DispatchStats, StatsInfo
+    from overload.type.deep import DeepChecker
+
+# Weak references of created overloaders by id, reference is removed by
+# callback before id can be reused (see overload.overloader.registry).
+_OVERLOADERS: Dict[int, ref] = {}
 
 
 class ABCOverloader(metaclass=ABCMeta):
@@ -30,6 +66,18 @@ class ABCOverloader(metaclass=ABCMeta):
             and it priority compared overload object annotations.
         overlapping (bool): Activate registration of implementation with
             same annotations as the default overload object.
+        cache_size (int, optional): Max count of call signatures, which
+            resolved implementations storage in dispatch cache.
+            0 - cache is disabled, None - cache is unbounded.
+        engine (str): Name of engine, matching implementations with call
+            parameters types:
+                linear - compare implementations one by one,
+                bitset - intersect masks of implementations, accepted each
+                    parameter type, fit for many implementations,
+                mro - compare parameters with annotations of their base
+                    classes, the most specific implementation is chosen.
+        frozen (bool): Freeze overloader at the first call, after that
+            implementations can't be registered.
         deep (bool): Saving and validate implementation
             and object calling parameter not only on top level.
 
@@ -39,46 +87,163 @@ class ABCOverloader(metaclass=ABCMeta):
                 (deep = True)
                 var: dict[str, list[int]] -> var: dict[str, list[int]]
 
-            Example converting calling parameter:
-                (deep = False)
-                {'var': [1,2,3]} -> dict
-                (deep = True)
-                {'var':[1,2,3]} -> dict[str, list[int]]
+            Implementation found by engine is checked with elements of
+            call parameters, if check is failed, other implementations
+            are checked in reverse registration order.
+        deep_strategy (str): Elements of collection, checked in deep mode:
+            first, random or all (see overload.type.deep.DeepChecker).
+        deep_size (int): Count of checked elements of collection for
+            first and random strategies.
+        lazy (bool): Defer conversion of annotations, validation and
+            analysis of implementations to the first call, freeze or
+            access to implementations, then all registered objects are
+            added in one pass. Without lazy mode only objects, which
+            string annotations (PEP 563) refer to names defined after
+            registration (class in own methods), are deferred so.
+        stats (bool): Collect statistic of dispatching: calls of each
+            implementation, compared implementations, calls of default
+            implementation and histogram of dispatch latency. Without
+            statistic calls are dispatched without counting.
 
     """
     __slots__ = (
         '_default',
         '_varieties',
+        '_engine',
         '_strict',
         '_overlapping',
+        '_cache',
+        '_dispatch',
+        '_compiled',
+        '_compiled_source',
+        '_frozen',
+        '_abc_token',
+        '_shadowed',
+        '_shadowed_ids',
+        '_ambiguities',
+        '_signatures',
+        '_deep',
+        '_resolve_shallow',
+        '_values',
+        '_value_classes',
+        '_lazy',
+        '_pending',
+        '_stats',
+        '_resolve_uncounted',
         '__origin_name__',
+        '__weakref__',
     )
 
     __implementation_class__: Any = ABCImplementation
     __type_handler__: _TypeHandler = _TypeHandler()
     __origin_name__: str
 
-    _varieties: List[__implementation_class__]
+    _varieties: Sequence[__implementation_class__]
+    _engine: 'ABCEngine'
     _strict: bool
     _overlapping: bool
+    _cache: DispatchCache
+    _dispatch: Callable
+    _compiled: Optional[Callable]
+    _compiled_source: Optional[str]
+    # None - overloader will be frozen at the first call.
+    _frozen: Optional[bool]
+    # abc.get_cache_token() of storage signatures in dispatch cache.
+    _abc_token: Any
+    _shadowed: List[__implementation_class__]
+    # Ids of shadowed implementations, which are kept alive by _shadowed.
+    _shadowed_ids: Set[int]
+    _ambiguities: List[Tuple[__implementation_class__, ...]]
+    # Positions of registered implementations by index keys (see
+    # FunctionImplementation.index_keys).
+    _signatures: Dict[tuple, List[int]]
+    # Checker of collections elements, None if deep mode is disabled.
+    _deep: Optional['DeepChecker']
+    # Dispatch function of engine, which result is checked in deep mode.
+    _resolve_shallow: Optional[Callable]
+    # Types of literal values by key (class of value, value) and classes
+    # of literal values, values of other classes aren't looked up.
+    _values: Dict[Tuple[type, Any], _KeyType]
+    _value_classes: Set[type]
+    _lazy: bool
+    # Objects, registration of which is deferred in lazy mode, and flag of
+    # default object.
+    _pending: List[Tuple[Any, bool]]
+    # Counters of dispatching, None if statistic is disabled.
+    _stats: Optional['DispatchStats']
+    # Dispatch function without counting, None until deferred objects
+    # are registered and overloader is frozen on the first call.
+    _resolve_uncounted: Optional[Callable]
 
     def __init__(
             self,
             overload_object: Any,
             strict: bool = False,
             overlapping: bool = False,
+            cache_size: Optional[int] = 256,
+            engine: str = 'linear',
+            frozen: bool = False,
+            deep: bool = False,
+            deep_strategy: str = 'first',
+            deep_size: int = 8,
+            lazy: bool = False,
+            stats: bool = False,
     ):
+        try:
+            self._engine = engine_class(engine)()
+        except KeyError:
+            raise UnknownEngine(engine, ENGINES)
+
+        self._deep = None
+        if deep:
+            # Checker uses random, it is imported only in deep mode.
+            from overload.type.deep import DeepChecker
+
+            self._deep = DeepChecker(
+                deep_strategy, deep_size, self._engine.exact,
+            )
+        self._resolve_shallow = None
+        self._values = {}
+        self._value_classes = set()
+        self._lazy = lazy
+        self._pending = []
+        self._stats = None
+        if stats:
+            from overload.overloader.stats import DispatchStats
+
+            self._stats = DispatchStats()
+        self._resolve_uncounted = None
+
         self._strict = strict
         self._overlapping = overlapping
         self._varieties = []
+        self._cache = DispatchCache(cache_size)
+        self._compiled = None
+        self._compiled_source = None
+        self._frozen = None if frozen else False
+        self._abc_token = get_cache_token()
+        self._shadowed = []
+        self._shadowed_ids = set()
+        self._ambiguities = []
+        self._signatures = {}
+        self._install_dispatch()
 
         self.__origin_name__ = getattr(
             overload_object,
             '__name__',
             self.__class__.__name__,
         )
-        self._register_implementation(overload_object)
-        self._default = self.varieties[-1]
+
+        if lazy or _TypeHandler.has_forward_references(overload_object):
+            self._default = None
+            self._pending.append((overload_object, True))
+            self._install_dispatch()
+        else:
+            self._register_implementation(overload_object)
+            self._default = self.varieties[-1]
+
+        key = id(self)
+        _OVERLOADERS[key] = ref(self, lambda _: _OVERLOADERS.pop(key, None))
 
     def __repr__(self):
         return "< ABCOverloader >"
@@ -90,16 +255,37 @@ class ABCOverloader(metaclass=ABCMeta):
         """
         return self._strict
 
+    @property
+    def is_lazy(self) -> bool:
+        """Registration of implementations is deferred to the first
+        call.
+        """
+        return self._lazy
+
     @property
     def default(self) -> __implementation_class__:
         """Default object, who was overload."""
+        if self._pending:
+            self._register_pending()
+
         return self._default
 
     @property
-    def varieties(self) -> List[__implementation_class__]:
+    def varieties(self) -> Sequence[__implementation_class__]:
         """Contain all implementations of overload object."""
+        if self._pending:
+            self._register_pending()
+
         return self._varieties
 
+    @property
+    def engine(self) -> 'ABCEngine':
+        """Engine, matching implementations with call parameters types."""
+        if self._pending:
+            self._register_pending()
+
+        return self._engine
+
     @property
     def can_overlapping(self) -> bool:
         """If it is True, overloader can storage implementation with
@@ -107,35 +293,564 @@ class ABCOverloader(metaclass=ABCMeta):
         """
         return self._overlapping
 
+    @property
+    def shadowed(self) -> Tuple[__implementation_class__, ...]:
+        """Implementations, which are never called, because implementations
+        registered after them compare all their calls.
+        """
+        if self._pending:
+            self._register_pending()
+
+        return tuple(self._shadowed)
+
+    @property
+    def ambiguities(self) -> Tuple[Tuple[__implementation_class__, ...], ...]:
+        """Pairs of implementations, comparing same calls, which are
+        dispatched by registration order: the last registered is called.
+        """
+        if self._pending:
+            self._register_pending()
+
+        return tuple(self._ambiguities)
+
+    @property
+    def is_deep(self) -> bool:
+        """Elements of collections are compared with inner types of
+        annotations.
+        """
+        return self._deep is not None
+
+    @property
+    def cache_info(self) -> CacheInfo:
+        """Statistic of dispatch cache: hits, misses, max and current
+        size. Hit ratio is available as cache_info.hit_ratio.
+        """
+        return self._cache.info()
+
+    @property
+    def has_stats(self) -> bool:
+        """Statistic of dispatching is collected."""
+        return self._stats is not None
+
+    def stats(self) -> 'StatsInfo':
+        """Statistic of dispatching: calls of each implementation,
+        compared implementations, calls of default implementation and
+        histogram of dispatch latency.
+        """
+        if self._stats is None:
+            raise StatsDisabledError()
+
+        return self._stats.info()
+
+    def reset_stats(self) -> None:
+        """Remove collected statistic of dispatching."""
+        if self._stats is None:
+            raise StatsDisabledError()
+
+        self._stats.reset()
+
+    def explain(self, *args, **kwargs) -> 'CallReport':
+        """Explain dispatching of call without calling implementation and
+        without dispatch cache: extracted types of parameters, candidates
+        in comparing order, reason of rejection and time of comparing of
+        each candidate. Receiver of method isn't passed.
+        """
+        from overload.overloader.explain import CallReport, CandidateReport
+
+        if self._pending:
+            self._register_pending()
+
+        engine = self._engine
+        args_types, kwargs_types = self._call_types(args, kwargs)
+
+        if args_types or kwargs_types:
+            candidates = engine.candidates(args_types, kwargs_types)
+        else:
+            # Call without parameters isn't compared by engine.
+            candidates = self._varieties[::-1]
+
+        reports = []
+        for candidate in candidates:
+            start = perf_counter_ns()
+            compared = engine.accepts(candidate, args_types, kwargs_types)
+            time = perf_counter_ns() - start
+
+            mismatch = None
+            if not compared:
+                mismatch = candidate.mismatch(kwargs_types, args_types)
+                # Engine compares classes with their bases.
+                if mismatch is None:
+                    mismatch = ('type_mismatch', None, (
+                        'parameters types are not compared with '
+                        'annotations by engine'
+                    ))
+
+            reports.append(CandidateReport(
+                candidate, compared, *(mismatch or (None, None, None)), time,
+            ))
+
+            if compared and engine.first_match:
+                break
+
+        implementation = self._get_variety(args_types, kwargs_types)
+
+        return CallReport(
+            args=args_types,
+            kwargs=kwargs_types,
+            engine=engine.name,
+            candidates=tuple(reports),
+            implementation=implementation,
+            is_default=implementation is self.default,
+        )
+
+    @property
+    def is_compiled(self) -> bool:
+        """Calls dispatched by generated dispatch function."""
+        return self._compiled_source is not None
+
+    @property
+    def dispatcher_source(self) -> Optional[str]:
+        """Source code of generated dispatch function, None if overloader
+        wasn't compiled.
+        """
+        return self._compiled_source
+
+    @property
+    def is_frozen(self) -> bool:
+        """Implementations can't be registered."""
+        return bool(self._frozen)
+
+    def compile(self) -> None:
+        """Generate dispatch function specialized for registered
+        implementations and use it for dispatching calls.
+        Dispatch function is regenerated after each registration.
+        """
+        if not self._engine.exact:
+            raise CompileEngineError()
+
+        if self._pending:
+            self._register_pending()
+
+        self._compiled_source, self._compiled = self._compile_dispatcher()
+        self._install_dispatch()
+
+    def freeze(self) -> None:
+        """Forbid registration of implementations and build lookup
+        tables of engine for all registered implementations.
+        """
+        if self._frozen:
+            return
+
+        if self._pending:
+            self._register_pending()
+
+        self._frozen = True
+        self._varieties = tuple(self._varieties)
+        self._engine.freeze()
+        self._install_dispatch()
+
     @abstractmethod
     def register(self, object_: Any) -> None:
         """Registering new implementation of overload object
         by it argument types.
         """
+        if self._frozen:
+            raise FrozenOverloaderError()
+
+        # Objects, which annotations refer to names defined later (and all
+        # objects after them), are registered at the first call.
+        if (
+                self._lazy
+                or self._pending
+                or _TypeHandler.has_forward_references(object_)
+        ):
+            self._pending.append((object_, False))
+            self._install_dispatch()
+            return
+
         self._validate_register_object(object_)
         self._register_implementation(object_)
+        self._cache.clear()
+
+        if self.is_compiled:
+            self.compile()
 
     @abstractmethod
     def _get_variety(self, *args, **kwargs) -> __implementation_class__:
         """Finding implementation by args and kwargs types."""
         pass
 
+    @abstractmethod
+    def _resolve(self, args: Tuple[Any, ...],
+                 kwargs: dict) -> __implementation_class__:
+        """Finding implementation by call args and kwargs values."""
+        pass
+
+    @abstractmethod
+    def _compile_dispatcher(self) -> Tuple[str, Callable]:
+        """Generate source code and function for dispatching calls."""
+        pass
+
     def as_default(self, object_: Any) -> None:
         """Registering new implementation of overload object as default
         implementation.
         """
         self.register(object_)
-        self._default = self.varieties[-1]
+
+        if self._pending:
+            self._pending[-1] = (self._pending[-1][0], True)
+            return
+
+        self._set_default(self.varieties[-1])
+        self._cache.clear()
+
+        if self.is_compiled:
+            self.compile()
+
+    def _set_default(self, implementation: __implementation_class__) -> None:
+        """Replace default implementation."""
+        self._default = implementation
+
+    def _register_pending(self) -> None:
+        """Validate and register objects, registration of which was
+        deferred in lazy mode, and select dispatch function once. If object
+        isn't valid, objects registered after it are kept deferred.
+        """
+        pending, self._pending = self._pending, []
+
+        for index, (object_, as_default) in enumerate(pending):
+            try:
+                # Default object of overloader isn't validated.
+                if self._default is not None:
+                    self._validate_register_object(object_)
+
+                self._register_implementation(object_)
+            except Exception:
+                self._pending[:0] = pending[index + 1:]
+                self._install_dispatch()
+                raise
+
+            if self._default is None:
+                self._default = self._varieties[-1]
+            elif as_default:
+                self._set_default(self._varieties[-1])
+
+        self._cache.clear()
+
+        if self.is_compiled:
+            self.compile()
+        else:
+            self._install_dispatch()
+
+    def _register_on_call(
+            self, args: Tuple[Any, ...], kwargs: dict,
+    ) -> __implementation_class__:
+        """Register deferred objects and dispatch the call."""
+        self._register_pending()
+        return self._dispatch(args, kwargs)
+
+    def _install_dispatch(self) -> None:
+        """Select function dispatching calls by overloader state."""
+        if self._pending:
+            self._dispatch = self._register_on_call
+            self._resolve_uncounted = None
+            return
+        elif self._frozen is None:
+            self._dispatch = self._freeze_on_call
+            self._resolve_uncounted = None
+            return
+        elif self._compiled is not None:
+            dispatch = self._compiled
+        elif self._engine.uses_abc_registry:
+            dispatch = self._resolve_abstract
+        else:
+            dispatch = self._resolve
+
+        # Implementations without inner types are checked by engine only.
+        if self._deep is not None and any(
+                variety.__nested__ for variety in self._varieties
+        ):
+            self._resolve_shallow = dispatch
+            dispatch = self._resolve_deep
+        else:
+            self._resolve_shallow = None
+
+        # Counting is a wrapper, so calls without statistic aren't slowed.
+        self._resolve_uncounted = dispatch
+        if self._stats is not None:
+            dispatch = self._resolve_counted
+
+        self._dispatch = dispatch
+
+    def _resolve_counted(
+            self, args: Tuple[Any, ...], kwargs: dict,
+    ) -> __implementation_class__:
+        """Dispatch the call and count it in statistic."""
+        misses = self._cache.misses
+        start = perf_counter_ns()
+        implementation = self._resolve_uncounted(args, kwargs)
+        latency = perf_counter_ns() - start
+
+        # Engine is asked for count of compares after dispatching, so
+        # counting isn't included in latency.
+        compares = 0
+        if self._cache.misses != misses and (args or kwargs):
+            compares = self._count_compares(args, kwargs)
+
+        self._stats.add(
+            implementation,
+            latency,
+            compares,
+            implementation is self.default,
+        )
+        return implementation
+
+    def _count_compares(self, args: Tuple[Any, ...], kwargs: dict) -> int:
+        """Count of implementations, compared by engine with call."""
+        return self._engine.compares(*self._call_types(args, kwargs))
+
+    def _call_types(
+            self, args: Tuple[Any, ...], kwargs: dict,
+    ) -> Tuple[Tuple[_Type, ...], Dict[str, _Type]]:
+        """Convert call parameters to types, compared by engine."""
+        if self._values:
+            extract_type = self._value_type
+        else:
+            extract_type = self.__type_handler__.extract_type
+
+        return (
+            tuple(map(extract_type, args)),
+            {name: extract_type(value) for name, value in kwargs.items()},
+        )
+
+    def _resolve_deep(
+            self, args: Tuple[Any, ...], kwargs: dict,
+    ) -> __implementation_class__:
+        """Check elements of call parameters with implementation, found
+        by engine. If check is failed, the last registered implementation,
+        which check is succeed, is chosen.
+        """
+        implementation = self._resolve_shallow(args, kwargs)
+
+        if not implementation.__nested__ or self._deep_check(
+                implementation, args, kwargs,
+        ):
+            return implementation
+
+        for variety in reversed(self._varieties):
+            if (
+                    variety is implementation
+                    or id(variety) in self._shadowed_ids
+            ):
+                continue
+
+            if self._deep_check(variety, args, kwargs):
+                return variety
+
+        return self._default
+
+    def _deep_check(
+            self,
+            implementation: __implementation_class__,
+            args: Tuple[Any, ...],
+            kwargs: dict,
+    ) -> bool:
+        """Check call parameters and their elements with implementation."""
+        checks = implementation.bind(len(args), kwargs.keys())
+
+        return checks is not None and self._deep.check_call(
+            checks, args, kwargs, self._dispatch_key(),
+        )
+
+    def _dispatch_key(self) -> Callable:
+        """Dispatch key of call parameter: class, key of key extractor or
+        key of literal value.
+        """
+        if self._values:
+            return self._value_key
+
+        return self.__type_handler__.dispatch_key
+
+    def _value_key(self, value: Any) -> Any:
+        """Dispatch key of call parameter, if literal annotations
+        are registered.
+        """
+        class_ = type(value)
+
+        if class_ in self._value_classes:
+            key = (class_, value)
+            if key in self._values:
+                return key
+
+        return self.__type_handler__.dispatch_key(value)
+
+    def _value_type(self, value: Any) -> Any:
+        """Convert call parameter to _Type, if literal annotations are
+        registered.
+        """
+        class_ = type(value)
+
+        if class_ in self._value_classes:
+            type_ = self._values.get((class_, value))
+            if type_ is not None:
+                return type_
+
+        return self.__type_handler__.extract_type(value)
+
+    def _add_values(self, implementation: __implementation_class__) -> None:
+        """Add values of literal annotations of implementation to table of
+        values.
+        """
+        for annotation in (
+                *implementation.__all_annotations__.values(),
+                implementation.__infinite_args__,
+                implementation.__infinite_kwargs__,
+        ):
+            if annotation is None:
+                continue
+            elif isinstance(annotation, _SingleType):
+                annotation = annotation.types
+            elif not isinstance(annotation, tuple):
+                annotation = (annotation,)
+
+            for member in annotation:
+                if isinstance(member, _ValueType):
+                    self._values[member.type] = _KeyType(member.type)
+                    self._value_classes.add(member.base)
+
+    def _resolve_abstract(
+            self, args: Tuple[Any, ...], kwargs: dict,
+    ) -> __implementation_class__:
+        """Clear dispatch cache after registration of virtual subclass
+        by ABC.register and dispatch the call.
+        """
+        token = get_cache_token()
+        if token != self._abc_token:
+            self._abc_token = token
+            self._cache.clear()
+
+        return self._resolve(args, kwargs)
+
+    def _freeze_on_call(
+            self, args: Tuple[Any, ...], kwargs: dict,
+    ) -> __implementation_class__:
+        """Freeze overloader and dispatch the first call."""
+        self.freeze()
+        return self._dispatch(args, kwargs)
 
     def _register_implementation(self, implementation: Any) -> None:
         """Registering new implementation of overload object."""
-        new_implementation = self.__implementation_class__(
+        new_implementation = self._create_implementation(implementation)
+        self._analyze_implementation(new_implementation)
+        self._add_values(new_implementation)
+        self._varieties.append(new_implementation)
+        self._engine.add(new_implementation)
+
+        if not self._frozen:
+            self._install_dispatch()
+
+    def _create_implementation(
+            self, implementation: Any,
+    ) -> __implementation_class__:
+        """Wrap implementation of overload object."""
+        return self.__implementation_class__(
             implementation=implementation,
-            annotations=self.__type_handler__.converting_annotations(
-                annotations=implementation.__annotations__,
+            annotations=self._annotation_handler.converting_annotations(
+                annotations=_TypeHandler.resolve_annotations(implementation),
             ),
         )
-        self._varieties.append(new_implementation)
+
+    @property
+    def _annotation_handler(self) -> _TypeHandler:
+        """Handler converting annotations of implementations, it keeps
+        inner types of collections in deep mode.
+        """
+        if self._deep is not None:
+            return self._deep.__type_handler__
+
+        return self.__type_handler__
+
+    def _analyze_implementation(
+            self, implementation: __implementation_class__,
+            report: bool = True,
+    ) -> None:
+        """Compare registering implementation with registered ones.
+        Implementations, which calls are all compared with registering
+        implementation, are shadowed and removed from engine. Partly
+        overlapped implementations are ambiguous, engines comparing by
+        equality resolve them by registration order. Only implementations
+        with common index keys are compared, so registration of
+        implementations with different classes doesn't slow down with count
+        of registered implementations.
+
+        Args:
+            implementation (ABCImplementation): Registering implementation.
+            report (bool): Warn about shadowed and ambiguous
+                implementations.
+
+        """
+        keys = implementation.index_keys()
+        if keys is None:
+            return
+
+        stored, looked_up = keys
+        signatures = self._signatures
+        positions = set()
+
+        for key in looked_up:
+            positions.update(signatures.get(key, ()))
+
+        # Implementation is appended to varieties after analyzing.
+        for key in stored:
+            signatures.setdefault(key, []).append(len(self._varieties))
+
+        exact = self._engine.exact
+
+        for position in sorted(positions):
+            variety = self._varieties[position]
+
+            if id(variety) in self._shadowed_ids:
+                continue
+
+            if implementation.covers(variety, exact):
+                self._shadowed.append(variety)
+                self._shadowed_ids.add(id(variety))
+                self._engine.discard(variety)
+
+                if report:
+                    _warn(
+                        f'Implementation {self._implementation_name(variety)} '
+                        f'of {self.__origin_name__} is shadowed by '
+                        f'{self._implementation_name(implementation)} and '
+                        'is never called.',
+                        'ShadowedImplementationWarning',
+                    )
+            elif (
+                    exact
+                    and not variety.covers(implementation)
+                    and implementation.overlaps(variety)
+            ):
+                self._ambiguities.append((variety, implementation))
+
+                if report:
+                    _warn(
+                        'Implementations '
+                        f'{self._implementation_name(variety)} and '
+                        f'{self._implementation_name(implementation)} of '
+                        f'{self.__origin_name__} are ambiguous, the last '
+                        'registered is called.',
+                        'AmbiguousImplementationWarning',
+                    )
+
+    @staticmethod
+    def _implementation_name(
+            implementation: __implementation_class__,
+    ) -> str:
+        return getattr(
+            implementation.implementation,
+            '__qualname__',
+            repr(implementation.implementation),
+        )
 
     def _validate_register_object(self, object_: Any) -> None:
         """Validation of registering object."""
@@ -160,8 +875,8 @@ class ABCOverloader(metaclass=ABCMeta):
         if not self.can_overlapping:
             # Check all parameter types of new implementation not comparing
             # with current default object.
-            new_annotations = self.__type_handler__.converting_annotations(
-                annotations=object_annotations,
+            new_annotations = self._annotation_handler.converting_annotations(
+                annotations=_TypeHandler.resolve_annotations(object_),
             )
 
             if new_annotations:
@@ -170,7 +885,9 @@ class ABCOverloader(metaclass=ABCMeta):
                     # compare its.
                     try:
                         for parameter, value in new_annotations.items():
-                            if value != def_annotations[parameter]:
+                            if not self.__type_handler__.annotations_match(
+                                    value, def_annotations[parameter],
+                            ):
                                 break
                         else:
                             raise OverlappingError()
@@ -180,3 +897,15 @@ class ABCOverloader(metaclass=ABCMeta):
 
             elif not def_annotations:
                 raise OverlappingError()
+
+
+def _warn(message: str, category: str) -> None:
+    """Warn by warning of overload.exception.warning with name category
+    from the first frame outside of package.
+    """
+    from warnings import warn
+
+    from overload.exception import warning
+    from overload.utils.stack import external_stacklevel
+
+    warn(message, getattr(warning, category), stacklevel=external_stacklevel())
@@ -0,0 +1,139 @@
+"""File contain dispatch cache of overloader."""
+from typing import Any, Dict, Hashable, NamedTuple, Optional
+from weakref import ref
+
+__all__ = (
+    'CacheInfo',
+    'DispatchCache',
+)
+
+
+class CacheInfo(NamedTuple):
+    """Statistic of overloader dispatch cache.
+
+    Attrs:
+        hits (int): Count of calls, resolved by cache.
+        misses (int): Count of calls, resolved by implementations comparing.
+        maxsize (int or None): Max count of storage signatures,
+            None - cache is unbounded.
+        currsize (int): Current count of storage signatures.
+
+    """
+    hits: int
+    misses: int
+    maxsize: Optional[int]
+    currsize: int
+
+    @property
+    def hit_ratio(self) -> float:
+        """Part of calls, resolved by cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class DispatchCache:
+    """Bounded storage of resolved implementations by call signature.
+
+    Call signature is a hashable key, build from concrete classes of call
+    arguments and names of keyword arguments. Resolved implementation for
+    same signature is always the same, while implementations of overloader
+    not changed, so overloader must clear cache on each registration.
+    When cache is full, the oldest signature is evicted.
+
+    Classes are referenced in signature by weak references, so cache
+    doesn't keep alive classes created at runtime: signature is evicted,
+    when one of its classes is garbage-collected.
+
+    Args:
+        maxsize (int, optional): Max count of storage signatures,
+            0 - cache is disabled, None - cache is unbounded.
+            Default value = 256.
+
+    """
+    __slots__ = ('_storage', '_maxsize', '_hits', '_misses')
+
+    _storage: Dict[Hashable, Any]
+
+    def __init__(self, maxsize: Optional[int] = 256):
+        if maxsize is not None and (
+                not isinstance(maxsize, int) or maxsize < 0
+        ):
+            raise ValueError(
+                f'Cache size must be positive integer or None, not {maxsize}.'
+            )
+
+        self._storage = {}
+        self._maxsize = maxsize
+        self._hits = 0
+        self._misses = 0
+
+    def __repr__(self) -> str:
+        return f'< DispatchCache > {self.info()}'
+
+    def __len__(self) -> int:
+        return len(self._storage)
+
+    @property
+    def maxsize(self) -> Optional[int]:
+        """Max count of storage signatures."""
+        return self._maxsize
+
+    @property
+    def misses(self) -> int:
+        """Count of calls, resolved by implementations comparing."""
+        return self._misses
+
+    def get(self, key: Hashable) -> Any:
+        """Return implementation storage for signature or None."""
+        try:
+            value = self._storage[key]
+        except KeyError:
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Storage resolved implementation for signature."""
+        storage = self._storage
+        maxsize = self._maxsize
+
+        if maxsize is not None and len(storage) >= maxsize:
+            if not maxsize:
+                return
+
+            # Evict the oldest signature.
+            del storage[next(iter(storage))]
+
+        if type(key) is tuple:
+            # Stored signature is equal to signature of call, but its weak
+            # references evict it, when class is garbage-collected.
+            def evict(_):
+                storage.pop(key, None)
+
+            key = tuple(
+                ref(part(), evict) if type(part) is ref else part
+                for part in key
+            )
+
+        storage[key] = value
+
+    def clear(self) -> None:
+        """Remove all storage signatures. Statistic is kept."""
+        self._storage.clear()
+
+    def reset(self) -> None:
+        """Remove all storage signatures and statistic."""
+        self._storage.clear()
+        self._hits = 0
+        self._misses = 0
+
+    def info(self) -> CacheInfo:
+        """Current statistic of cache."""
+        return CacheInfo(
+            hits=self._hits,
+            misses=self._misses,
+            maxsize=self._maxsize,
+            currsize=len(self._storage),
+        )
@@ -0,0 +1,183 @@
+"""File contain generator of specialized dispatch functions."""
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Sequence,
+    Tuple,
+)
+
+from overload.implementation.function import FunctionImplementation
+
+__all__ = (
+    'compile_dispatcher',
+)
+
+
+class _Source:
+    """Builder of dispatch function source code."""
+    __slots__ = ('lines', 'namespace', '_names')
+
+    def __init__(self):
+        self.lines: List[str] = []
+        self.namespace: Dict[str, Any] = {}
+        self._names: Dict[int, str] = {}
+
+    def add(self, indent: int, line: str) -> None:
+        self.lines.append('    ' * indent + line)
+
+    def name(self, prefix: str, value: Any) -> str:
+        """Bind value to namespace of dispatch function."""
+        try:
+            return self._names[id(value)]
+        except KeyError:
+            name = f'{prefix}{len(self._names)}'
+            self._names[id(value)] = name
+            self.namespace[name] = value
+            return name
+
+
+def _condition(
+        source: _Source,
+        checks: Sequence[Tuple[Any, Any]],
+        variables: Dict[Any, str],
+) -> str:
+    """Generate condition of implementation checks."""
+    conditions = []
+
+    for slot, annotation in checks:
+        classes = FunctionImplementation.annotation_classes(annotation)
+
+        if classes is None:
+            continue
+        elif len(classes) == 1:
+            class_name = source.name('_c', next(iter(classes)))
+            conditions.append(f'{variables[slot]} is {class_name}')
+        else:
+            classes_name = source.name('_s', classes)
+            conditions.append(f'{variables[slot]} in {classes_name}')
+
+    return ' and '.join(conditions)
+
+
+def _shape_branch(
+        source: _Source,
+        indent: int,
+        shape: Tuple[int, FrozenSet[str]],
+        varieties: Sequence[FunctionImplementation],
+        default: FunctionImplementation,
+        fallback_name: str,
+) -> None:
+    """Generate checks of implementations for call shape."""
+    count, names = shape
+    variables = {}
+
+    # Dispatch keys are extracted from values, calls with shape compared
+    # with annotations of key are dispatched by fallback.
+    for implementation in varieties:
+        checks = implementation.bind(count, names) or ()
+
+        for _, annotation in checks:
+            classes = FunctionImplementation.annotation_classes(annotation)
+
+            if classes and any(type(class_) is tuple for class_ in classes):
+                source.add(indent, f'return {fallback_name}(args, kwargs)')
+                return
+
+    for index in range(count):
+        variables[index] = f'a{index}'
+        source.add(indent, f'a{index} = type(args[{index}])')
+
+    for index, name in enumerate(sorted(names)):
+        variables[name] = f'k{index}'
+        source.add(indent, f'k{index} = type(kwargs[{name!r}])')
+
+    for implementation in reversed(varieties):
+        checks = implementation.bind(count, names)
+
+        if checks is None:
+            continue
+
+        implementation_name = source.name('_i', implementation)
+        condition = _condition(source, checks, variables)
+
+        if not condition:
+            source.add(indent, f'return {implementation_name}')
+            return
+
+        source.add(indent, f'if {condition}:')
+        source.add(indent + 1, f'return {implementation_name}')
+
+    source.add(indent, f'return {source.name("_i", default)}')
+
+
+def compile_dispatcher(
+        name: str,
+        varieties: Sequence[FunctionImplementation],
+        default: FunctionImplementation,
+        empty: FunctionImplementation,
+        fallback: Callable,
+) -> Tuple[str, Callable]:
+    """Generate dispatch function for function implementations.
+
+    Generated function take tuple of call args and dict of call kwargs and
+    return compared implementation. Checks are grouped by count of unnamed
+    parameters and names of named parameters, each check is a direct
+    comparing of argument class. Calls with shapes, which wasn't generated
+    or compared with annotations of dispatch key, are dispatched by
+    fallback.
+
+    Args:
+        name (str): Name of overloaded object, used in dispatch function name.
+        varieties (sequence): Registered implementations.
+        default (FunctionImplementation): Default implementation.
+        empty (FunctionImplementation): Implementation for call without
+            parameters.
+        fallback (callable): Dispatch function for not generated shapes.
+
+    Returns:
+        Source code of dispatch function and dispatch function.
+
+    """
+    shapes = set()
+    for implementation in varieties:
+        shapes.update(implementation.call_shapes())
+
+    # Call without parameters dispatch separately.
+    shapes.discard((0, frozenset()))
+    shapes = sorted(shapes, key=lambda shape: (shape[0], sorted(shape[1])))
+
+    source = _Source()
+    fallback_name = source.name('_fallback', fallback)
+    empty_name = source.name('_i', empty)
+
+    function_name = f'dispatch_{name}' if name.isidentifier() else 'dispatch'
+    source.add(0, f'def {function_name}(args, kwargs):')
+    source.add(1, 'count = len(args)')
+    source.add(1, 'if kwargs:')
+
+    named_shapes = [shape for shape in shapes if shape[1]]
+    for shape in named_shapes:
+        names_name = source.name('_n', shape[1])
+        source.add(2, f'if count == {shape[0]} and kwargs.keys() == '
+                      f'{names_name}:')
+        _shape_branch(source, 3, shape, varieties, default, fallback_name)
+    source.add(2, f'return {fallback_name}(args, kwargs)')
+
+    source.add(1, 'if not count:')
+    source.add(2, f'return {empty_name}')
+
+    for shape in shapes:
+        if not shape[1]:
+            source.add(1, f'if count == {shape[0]}:')
+            _shape_branch(source, 2, shape, varieties, default,
+                          fallback_name)
+    source.add(1, f'return {fallback_name}(args, kwargs)')
+
+    code = '\n'.join(source.lines) + '\n'
+    namespace = source.namespace
+    exec(compile(code, f'<overload dispatcher {name}>', 'exec'), namespace)
+
+    return code, namespace[function_name]
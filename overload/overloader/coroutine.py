@@ -0,0 +1,52 @@
+import inspect
+from asyncio import coroutines
+from types import CodeType
+from typing import Any, Dict, Optional, Tuple
+
+from overload.overloader.function import FunctionOverloader
+
+__all__ = (
+    'CoroutineOverloader',
+)
+
+
+class CoroutineOverloader(FunctionOverloader):
+    """Class coroutine function overloading. All implementations must be
+    coroutine functions (async def).
+
+    Overloader is recognized as coroutine function by
+    inspect.iscoroutinefunction and asyncio.iscoroutinefunction, so
+    frameworks call it without wrapping. Call return coroutine of compared
+    implementation directly, without intermediate coroutine.
+    """
+    __slots__ = ()
+
+    # Marker of asyncio.iscoroutinefunction.
+    _is_coroutine = getattr(coroutines, '_is_coroutine', None)
+    # Marker of inspect.markcoroutinefunction, python >= 3.12.
+    _is_coroutine_marker = getattr(inspect, '_is_coroutine_mark', None)
+
+    def __repr__(self):
+        return (f"< Overloaded coroutine function {self.__origin_name__} >"
+                f' implementation count = {len(self.varieties)}.')
+
+    def __str__(self):
+        return f'< Overloaded coroutine "{self.__origin_name__}" >'
+
+    # Attributes of function, by which inspect recognize function like
+    # object and it code flags before python 3.12.
+    @property
+    def __name__(self) -> str:
+        return self.__origin_name__
+
+    @property
+    def __code__(self) -> CodeType:
+        return self.default.implementation.__code__
+
+    @property
+    def __defaults__(self) -> Optional[Tuple[Any, ...]]:
+        return self.default.implementation.__defaults__
+
+    @property
+    def __kwdefaults__(self) -> Optional[Dict[str, Any]]:
+        return self.default.implementation.__kwdefaults__
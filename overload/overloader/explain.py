@@ -0,0 +1,91 @@
+"""File contain reports of dispatching explained by overloader."""
+from typing import Any, Dict, NamedTuple, Optional, Tuple, Union
+
+__all__ = (
+    'CandidateReport',
+    'CallReport',
+)
+
+
+class CandidateReport(NamedTuple):
+    """Result of comparing call with one candidate implementation.
+
+    Attrs:
+        implementation (Any): Candidate implementation.
+        compared (bool): Call is compared with implementation.
+        reason (str, optional): Reason of rejection (see
+            FunctionImplementation.mismatch), None if compared.
+        slot (int or str, optional): Index of unnamed parameter or name of
+            named parameter, which caused rejection.
+        description (str, optional): Description of rejection.
+        time (int): Time of comparing in nanoseconds.
+
+    """
+    implementation: Any
+    compared: bool
+    reason: Optional[str]
+    slot: Optional[Union[int, str]]
+    description: Optional[str]
+    time: int
+
+
+class CallReport(NamedTuple):
+    """Explanation of dispatching of one call.
+
+    Attrs:
+        args (tuple): Types of unnamed parameters, extracted from values.
+        kwargs (dict): Types of named parameters, extracted from values.
+        engine (str): Name of engine, comparing candidates.
+        candidates (tuple): Reports of candidates in comparing order. Engine
+            with first match stops at the first compared candidate.
+        implementation (Any): Resolved implementation.
+        is_default (bool): Call is dispatched to default implementation.
+
+    """
+    args: Tuple[Any, ...]
+    kwargs: Dict[str, Any]
+    engine: str
+    candidates: Tuple[CandidateReport, ...]
+    implementation: Any
+    is_default: bool
+
+    @property
+    def time(self) -> int:
+        """Time of comparing all candidates in nanoseconds."""
+        return sum(candidate.time for candidate in self.candidates)
+
+    def format(self) -> str:
+        """Human readable report."""
+        parameters = ', '.join((
+            *(_type_name(type_) for type_ in self.args),
+            *(f'{name}={_type_name(type_)}'
+              for name, type_ in self.kwargs.items()),
+        ))
+        lines = [f'call ({parameters}), engine {self.engine}:']
+
+        for index, candidate in enumerate(self.candidates):
+            result = (
+                'compared' if candidate.compared
+                else f'{candidate.reason}: {candidate.description}'
+            )
+            lines.append(
+                f'  {index}. {_name(candidate.implementation)} '
+                f'{candidate.time} ns - {result}'
+            )
+
+        lines.append(
+            f'resolved: {_name(self.implementation)}'
+            + (' (default)' if self.is_default else '')
+        )
+        return '\n'.join(lines)
+
+
+def _type_name(type_: Any) -> str:
+    """Name of class (or dispatch key) of call parameter."""
+    return getattr(type_.type, '__qualname__', repr(type_.type))
+
+
+def _name(implementation: Any) -> str:
+    """Qualified name of implementation function."""
+    function = implementation.implementation
+    return getattr(function, '__qualname__', repr(function))
@@ -1,6 +1,19 @@
-from typing import Tuple, Dict
+from collections import deque
+from functools import partial
+from time import perf_counter
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Tuple,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+)
 from types import FunctionType
 from collections.abc import Callable
+from weakref import ref
 
 from overload.overloader.base import ABCOverloader
 from overload.type.type import _Type
@@ -8,13 +21,26 @@ from overload.exception.overloader import (
     FunctionRegisterTypeError,
     AnnotationCountError,
     MissedAnnotations,
+    CoroutineMixError,
+    OverloaderLookupError,
 )
 from overload.implementation.function import FunctionImplementation
+from overload.utils.coroutine import is_coroutine_function
+
+if TYPE_CHECKING:
+    # Executors are imported by map_parallel, logging imported by them
+    # slows import of overloader.
+    from concurrent.futures import Executor, Future
 
 __all__ = (
     'FunctionOverloader',
 )
 
+# Dispatch key of item, which differs from any item key.
+_NO_KEY = object()
+# Count of items in chunk of implementation, which calls wasn't measured.
+_INITIAL_CHUNK_SIZE = 8
+
 
 class FunctionOverloader(ABCOverloader):
     """Class function overloading. It take function and registering
@@ -35,41 +61,421 @@ class FunctionOverloader(ABCOverloader):
         return f'< Overloaded "{self.__origin_name__}" >'
 
     def __call__(self, *args, **kwargs):
-        args_types = self.__type_handler__.converting_args(args)
-        kwargs_types = self.__type_handler__.converting_kwargs(kwargs)
-        implementation = self._get_variety(args_types, kwargs_types)
-        return implementation(*args, **kwargs)
+        return self._dispatch(args, kwargs)(*args, **kwargs)
 
     def register(self, function_: FunctionType) -> None:
         """Registering new implementation of function/coroutine."""
         super(FunctionOverloader, self).register(function_)
 
+    def imap(self, iterable: Iterable[Any]) -> Iterator[Any]:
+        """Lazily call overloaded function with each item of iterable.
+        Implementation is resolved again only when item class (dispatch
+        key) differs from class of previous item, so runs of same class
+        items skip matching.
+        """
+        return self._imap(iterable, ())
+
+    def starmap(self, iterable: Iterable[Tuple[Any, ...]]) -> Iterator[Any]:
+        """Lazily call overloaded function with each args tuple of
+        iterable. Implementation is resolved again only when classes of
+        args differ from classes of previous args.
+        """
+        return self._starmap(iterable, ())
+
+    def batch(self, iterable: Iterable[Any]) -> List[Any]:
+        """Call overloaded function with each item of finite iterable and
+        return results in items order.
+
+        Items are grouped by resolved implementation. Implementation, marked
+        by overload.batched decorator, is called once for group: its bulk
+        function take list of group items and return results of them in the
+        same order. Other implementations are called for each item.
+        """
+        return self._batch(iterable, ())
+
+    def map_parallel(
+            self,
+            iterable: Iterable[Any],
+            executor: Optional['Executor'] = None,
+            chunk_time: float = 0.01,
+            max_chunk_size: int = 4096,
+    ) -> Iterator[Any]:
+        """Call overloaded function with each item of iterable in executor
+        and lazily return results in items order.
+
+        Implementations are resolved in calling process, consecutive items
+        of the same implementation are sent to executor in chunks. Chunk
+        size of implementation is adapted to measured time of its calls, so
+        chunk takes about chunk_time seconds. Chunk is sent with module and
+        qualified name of overloaded function and index of implementation,
+        so overloader must be defined at module level.
+
+        Args:
+            iterable (iterable): Items, passed as the only call parameter.
+            executor (Executor, optional): Thread or process pool executor,
+                by default thread pool is created for the call.
+            chunk_time (float): Expected time of chunk calls in seconds.
+            max_chunk_size (int): Max count of items in chunk.
+
+        """
+        return self._map_parallel(
+            iterable, (), executor, chunk_time, max_chunk_size,
+        )
+
+    def _imap(
+            self, iterable: Iterable[Any], receiver: Tuple[Any, ...],
+    ) -> Iterator[Any]:
+        """Call implementations with receiver (empty for functions) and
+        each item of iterable.
+        """
+        dispatch_key = self._items_key()
+        last_key = _NO_KEY
+        function = None
+
+        for item in iterable:
+            key = dispatch_key(item)
+
+            if key != last_key:
+                last_key = key
+                function = _bind(
+                    self._dispatch((item,), {}).implementation, receiver,
+                )
+
+            yield function(item)
+
+    def _starmap(
+            self,
+            iterable: Iterable[Tuple[Any, ...]],
+            receiver: Tuple[Any, ...],
+    ) -> Iterator[Any]:
+        """Call implementations with receiver and each args tuple of
+        iterable.
+        """
+        dispatch_key = self._items_key()
+        last_key = None
+        function = None
+
+        for args in iterable:
+            key = tuple(map(dispatch_key, args))
+
+            if key != last_key:
+                last_key = key
+                function = _bind(
+                    self._dispatch(tuple(args), {}).implementation, receiver,
+                )
+
+            yield function(*args)
+
+    def _batch(
+            self, iterable: Iterable[Any], receiver: Tuple[Any, ...],
+    ) -> List[Any]:
+        """Call implementations with receiver and groups of items of
+        iterable.
+        """
+        items = list(iterable)
+        # Resolved implementations and indexes of their items by id.
+        groups: Dict[int, Tuple[FunctionImplementation, List[int]]] = {}
+        dispatch_key = self._items_key()
+        last_key = _NO_KEY
+        indexes = None
+
+        for index, item in enumerate(items):
+            key = dispatch_key(item)
+
+            if key != last_key:
+                last_key = key
+                implementation = self._dispatch((item,), {})
+                indexes = groups.setdefault(
+                    id(implementation), (implementation, []),
+                )[1]
+
+            indexes.append(index)
+
+        results = [None] * len(items)
+        for implementation, indexes in groups.values():
+            function = implementation.implementation
+            bulk_function = getattr(function, '__overload_batch__', None)
+
+            if bulk_function is None:
+                function = _bind(function, receiver)
+                for index in indexes:
+                    results[index] = function(items[index])
+            else:
+                group_results = bulk_function(
+                    *receiver, [items[index] for index in indexes],
+                )
+                for index, result in zip(indexes, group_results):
+                    results[index] = result
+
+        return results
+
+    def _map_parallel(
+            self,
+            iterable: Iterable[Any],
+            receiver: Tuple[Any, ...],
+            executor: Optional['Executor'],
+            chunk_time: float,
+            max_chunk_size: int,
+    ) -> Iterator[Any]:
+        """Call implementations with receiver and chunks of items of
+        iterable in executor, receiver is sent with each chunk.
+        """
+        module, qualname = self._origin()
+        if _load_overloader(module, qualname) is not self:
+            raise OverloaderLookupError(module, qualname)
+
+        own_executor = executor is None
+        if own_executor:
+            from concurrent.futures import ThreadPoolExecutor
+
+            executor = ThreadPoolExecutor()
+
+        # Seconds per item by index of implementation.
+        costs: Dict[int, float] = {}
+        pending = deque()
+
+        try:
+            for index, items in self._chunks(
+                    iterable, costs, chunk_time, max_chunk_size,
+            ):
+                pending.append((index, executor.submit(
+                    _call_chunk, module, qualname, index, items, receiver,
+                )))
+
+                while pending and pending[0][1].done():
+                    yield from _chunk_results(*pending.popleft(), costs)
+
+            while pending:
+                yield from _chunk_results(*pending.popleft(), costs)
+        finally:
+            for _, future in pending:
+                future.cancel()
+
+            if own_executor:
+                executor.shutdown()
+
+    def _origin(self) -> Tuple[str, str]:
+        """Module and qualified name of overloaded function."""
+        if self._pending:
+            self._register_pending()
+
+        function = self._varieties[0].implementation
+        return function.__module__, function.__qualname__
+
+    def _chunks(
+            self,
+            iterable: Iterable[Any],
+            costs: Dict[int, float],
+            chunk_time: float,
+            max_chunk_size: int,
+    ) -> Iterator[Tuple[int, List[Any]]]:
+        """Split items to chunks of the same implementation."""
+        indexes = {
+            id(implementation): index
+            for index, implementation in enumerate(self.varieties)
+        }
+        dispatch_key = self._items_key()
+        last_key = _NO_KEY
+        index = None
+        items = []
+
+        for item in iterable:
+            key = dispatch_key(item)
+
+            if key != last_key:
+                last_key = key
+                item_index = indexes[id(self._dispatch((item,), {}))]
+
+                if item_index != index and items:
+                    yield index, items
+                    items = []
+
+                index = item_index
+
+            items.append(item)
+
+            cost = costs.get(index)
+            size = (
+                _INITIAL_CHUNK_SIZE if cost is None
+                else max(1, min(max_chunk_size, int(chunk_time / cost)))
+            )
+            if len(items) >= size:
+                yield index, items
+                items = []
+
+        if items:
+            yield index, items
+
+    def _items_key(self) -> Callable:
+        """Dispatch key of items, runs of which are resolved once. In deep
+        mode implementation depends on elements of item, so each item is
+        resolved.
+        """
+        if self._deep is not None:
+            return _unique_key
+
+        return self._dispatch_key()
+
+    def _resolve(
+            self, args: Tuple[Any, ...], kwargs: Dict[str, Any],
+    ) -> FunctionImplementation:
+        """Get compared function implementation through dispatch cache."""
+        # Signature key: dispatch keys (classes) of args, names of kwargs
+        # and their dispatch keys. Classes are referenced weakly.
+        if self._values:
+            dispatch_key = self._value_key
+            extract_type = self._value_type
+        else:
+            dispatch_key = self.__type_handler__.dispatch_key
+            extract_type = self.__type_handler__.extract_type
+
+        if dispatch_key is type:
+            args_key = map(ref, map(type, args))
+        else:
+            args_key = map(_weak_key, map(dispatch_key, args))
+
+        if kwargs:
+            key = (
+                *args_key,
+                *kwargs,
+                *map(_weak_key, map(dispatch_key, kwargs.values())),
+            )
+        else:
+            key = tuple(args_key)
+
+        implementation = self._cache.get(key)
+
+        if implementation is None:
+            args_types = tuple(map(extract_type, args))
+            kwargs_types = {
+                name: extract_type(value) for name, value in kwargs.items()
+            }
+            implementation = self._get_variety(args_types, kwargs_types)
+            self._cache.set(key, implementation)
+
+        return implementation
+
+    def _compile_dispatcher(self) -> Tuple[str, Callable]:
+        """Generate dispatch function for registered implementations."""
+        from overload.overloader.compiler import compile_dispatcher
+
+        return compile_dispatcher(
+            name=self.__origin_name__,
+            varieties=[
+                implementation for implementation in self._varieties
+                if id(implementation) not in self._shadowed_ids
+            ],
+            default=self._default,
+            empty=self._get_variety((), {}),
+            fallback=self._resolve,
+        )
+
     def _validate_register_object(self, function_: FunctionType) -> None:
         """Validation of registering object."""
         if type(function_) is not FunctionType:
             raise FunctionRegisterTypeError()
 
-        arg_count = function_.__code__.co_argcount
-        kw_count = function_.__code__.co_kwonlyargcount
+        if (
+                is_coroutine_function(function_)
+                is not is_coroutine_function(self.default.implementation)
+        ):
+            raise CoroutineMixError()
 
-        if not function_.__annotations__ and arg_count + kw_count:
+        parameters_count = self._parameters_count(function_)
+
+        if not function_.__annotations__ and parameters_count:
             raise MissedAnnotations()
-        elif len(function_.__annotations__) < arg_count + kw_count:
+        elif len(function_.__annotations__) < parameters_count:
             raise AnnotationCountError()
 
         super(FunctionOverloader, self)._validate_register_object(function_)
 
+    @staticmethod
+    def _parameters_count(function_: FunctionType) -> int:
+        """Count of function parameters, which must be annotated."""
+        return (
+                function_.__code__.co_argcount
+                + function_.__code__.co_kwonlyargcount
+        )
+
     def _get_variety(
             self, args: Tuple[_Type, ...], kwargs: Dict[str, _Type],
     ) -> Callable:
         """Get compared function implementation."""
         if args or kwargs:
-            for implementation in reversed(self.varieties):
-                if implementation.compare(named=kwargs, unnamed=args):
-                    return implementation
+            implementation = self._engine.find(args, kwargs)
+
+            if implementation is not None:
+                return implementation
         else:
-            for implementation in self.varieties[::-1]:
+            for implementation in self._varieties[::-1]:
                 if not implementation.__all_annotations__:
                     return implementation
 
-        return self.default
+        return self._default
+
+
+def _load_overloader(module: str, qualname: str) -> FunctionOverloader:
+    """Find overloader by module and qualified name of overloaded function."""
+    from importlib import import_module
+    from inspect import getattr_static
+
+    try:
+        overloader = import_module(module)
+        # Static lookup doesn't bind overloaders of methods.
+        for name in qualname.split('.'):
+            overloader = getattr_static(overloader, name)
+    except (ImportError, AttributeError):
+        raise OverloaderLookupError(module, qualname) from None
+
+    if not isinstance(overloader, FunctionOverloader):
+        raise OverloaderLookupError(module, qualname)
+
+    return overloader
+
+
+def _weak_key(key: Any) -> Any:
+    """Weak reference of class in signature key of dispatch cache. Dispatch
+    keys of key extractors and literal values are kept.
+    """
+    return key if type(key) is tuple else ref(key)
+
+
+def _unique_key(item: Any) -> Any:
+    """Dispatch key, which differs from key of any other item."""
+    return object()
+
+
+def _bind(function: Callable, receiver: Tuple[Any, ...]) -> Callable:
+    """Function, which calls implementation with receiver of method before
+    call parameters.
+    """
+    return partial(function, *receiver) if receiver else function
+
+
+def _call_chunk(
+        module: str,
+        qualname: str,
+        index: int,
+        items: List[Any],
+        receiver: Tuple[Any, ...] = (),
+) -> Tuple[List[Any], float]:
+    """Find overloader, call implementation with receiver and each item,
+    return results and time of calls.
+    """
+    overloader = _load_overloader(module, qualname)
+    function = _bind(overloader.varieties[index].implementation, receiver)
+    start = perf_counter()
+    results = [function(item) for item in items]
+    return results, perf_counter() - start
+
+
+def _chunk_results(
+        index: int, future: 'Future', costs: Dict[int, float],
+) -> List[Any]:
+    """Wait results of chunk and update cost of implementation calls."""
+    results, elapsed = future.result()
+    cost = elapsed / len(results)
+    previous = costs.get(index)
+    costs[index] = cost if previous is None else (previous + cost) / 2
+    return results
@@ -0,0 +1,389 @@
+from types import FunctionType, MethodType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from overload.overloader.function import FunctionOverloader
+from overload.exception.overloader import MethodRegisterTypeError
+from overload.implementation.method import MethodImplementation
+from overload.type.type import _TypeHandler
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+    from overload.overloader.explain import CallReport
+
+__all__ = (
+    'MethodOverloader',
+)
+
+
+class _Inherited:
+    """Default of derived overloader without own default. Calls, which
+    aren't compared with own implementations, are resolved to it and
+    dispatched by parent overloader.
+    """
+    __slots__ = ()
+
+    __nested__ = False
+
+    def __repr__(self):
+        return '< Inherited default >'
+
+
+_INHERITED = _Inherited()
+
+
+class MethodOverloader(FunctionOverloader):
+    """Class method overloading. It take instance method, class method or
+    static method and registering implementations of it.
+
+    Overloader is a descriptor: on attribute access it is bound to instance
+    (or class for class method) like function, call parameters after the
+    receiver (self or cls) are dispatched without extracting receiver type.
+    For static method access return call function, cached in overloader,
+    so binding is free of allocations.
+
+    Overloader, assigned in subclass to name of overloaded method of base
+    class, is derived from overloader of base class method: overloaded
+    method is registered as implementation, default is the default of
+    parent, unless overloaded method has the same annotations and overrides
+    it. Call is compared with own implementations of derived
+    overloader, other calls are dispatched by parent, so registration in
+    parent doesn't change derived overloaders. Calls, dispatched by parent
+    to its default, are dispatched to own default, if it is replaced by
+    as_default.
+    """
+    __slots__ = (
+        '_kind',
+        '_static_call',
+        '_parent',
+        '_resolve_own',
+    )
+
+    __implementation_class__ = MethodImplementation
+
+    # FunctionType for instance method, classmethod or staticmethod.
+    _kind: type
+    _static_call: Callable
+    _parent: Optional['MethodOverloader']
+    # Dispatch function of own implementations of derived overloader.
+    _resolve_own: Optional[Callable]
+
+    def __init__(
+            self,
+            overload_method: Union[FunctionType, classmethod, staticmethod],
+            *args,
+            **kwargs,
+    ):
+        if isinstance(overload_method, (classmethod, staticmethod)):
+            self._kind = type(overload_method)
+        else:
+            self._kind = FunctionType
+
+        self._static_call = self._call_static
+        self._parent = None
+        self._resolve_own = None
+        super().__init__(self._unwrap(overload_method), *args, **kwargs)
+
+    def __repr__(self):
+        return (f"< Overloaded method {self.__origin_name__} >"
+                f' implementation count = {len(self.varieties)}.')
+
+    def __str__(self):
+        return f'< Overloaded method "{self.__origin_name__}" >'
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        kind = self._kind
+
+        if kind is FunctionType:
+            return self if instance is None else MethodType(self, instance)
+        elif kind is classmethod:
+            return MethodType(
+                self, owner if owner is not None else type(instance),
+            )
+
+        return self._static_call
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        """Derive overloader from overloader of the same kind, which is
+        found by name in bases of owner class.
+        """
+        for base in owner.__mro__[1:]:
+            parent = base.__dict__.get(name)
+
+            if parent is not None:
+                break
+        else:
+            return
+
+        if isinstance(parent, MethodOverloader) and (
+                parent._kind is self._kind
+        ):
+            self._derive(parent)
+
+    def __call__(self, receiver, *args, **kwargs):
+        return self._dispatch(args, kwargs)(receiver, *args, **kwargs)
+
+    @property
+    def varieties(self) -> Sequence[MethodImplementation]:
+        """Contain implementations of parent overloader and own
+        implementations.
+        """
+        varieties = super(MethodOverloader, self).varieties
+
+        if self._parent is None:
+            return varieties
+
+        return (*self._parent.varieties, *varieties)
+
+    @property
+    def default(self) -> MethodImplementation:
+        """Default implementation of derived overloader is default of
+        parent, until it is replaced in derived overloader.
+        """
+        default = super(MethodOverloader, self).default
+
+        if default is _INHERITED:
+            return self._parent.default
+
+        return default
+
+    @property
+    def parent(self) -> Optional['MethodOverloader']:
+        """Overloader of base class method, None if overloader isn't
+        derived.
+        """
+        return self._parent
+
+    @property
+    def kind(self) -> type:
+        """Kind of overloaded method: FunctionType for instance method,
+        classmethod or staticmethod.
+        """
+        return self._kind
+
+    def register(
+            self, method: Union[FunctionType, classmethod, staticmethod],
+    ) -> None:
+        """Registering new implementation of method. Function is registered
+        as method of overloaded method kind.
+        """
+        super(MethodOverloader, self).register(self._unwrap(method))
+
+    def as_default(
+            self, method: Union[FunctionType, classmethod, staticmethod],
+    ) -> None:
+        super(MethodOverloader, self).as_default(self._unwrap(method))
+
+    def imap(self, receiver: Any, iterable: Iterable[Any]) -> Iterator[Any]:
+        """Lazily call overloaded method with receiver (instance or class)
+        and each item of iterable (see FunctionOverloader.imap). Receiver
+        isn't passed to static method implementations.
+        """
+        return self._imap(iterable, self._receiver(receiver))
+
+    def starmap(
+            self, receiver: Any, iterable: Iterable[Tuple[Any, ...]],
+    ) -> Iterator[Any]:
+        """Lazily call overloaded method with receiver and each args tuple
+        of iterable (see FunctionOverloader.starmap).
+        """
+        return self._starmap(iterable, self._receiver(receiver))
+
+    def batch(self, receiver: Any, iterable: Iterable[Any]) -> List[Any]:
+        """Call overloaded method with receiver and each item of finite
+        iterable (see FunctionOverloader.batch). Bulk function of batched
+        implementation take receiver and list of group items.
+        """
+        return self._batch(iterable, self._receiver(receiver))
+
+    def map_parallel(
+            self,
+            receiver: Any,
+            iterable: Iterable[Any],
+            executor: Optional['Executor'] = None,
+            chunk_time: float = 0.01,
+            max_chunk_size: int = 4096,
+    ) -> Iterator[Any]:
+        """Call overloaded method with receiver and each item of iterable
+        in executor (see FunctionOverloader.map_parallel). Receiver is sent
+        with each chunk, for process pool executor it must be picklable.
+        """
+        return self._map_parallel(
+            iterable,
+            self._receiver(receiver),
+            executor,
+            chunk_time,
+            max_chunk_size,
+        )
+
+    def explain(self, *args, **kwargs) -> 'CallReport':
+        """Candidates of derived overloader are own implementations and,
+        if they aren't compared with call, candidates of parent.
+        """
+        report = super(MethodOverloader, self).explain(*args, **kwargs)
+
+        if self._parent is None or report.implementation is not (
+                self._default
+        ):
+            return report
+
+        inherited = self._parent.explain(*args, **kwargs)
+        implementation = self._inherit(report.implementation,
+                                       inherited.implementation)
+
+        return report._replace(
+            candidates=report.candidates + inherited.candidates,
+            implementation=implementation,
+            is_default=implementation is self.default,
+        )
+
+    def _derive(self, parent: 'MethodOverloader') -> None:
+        """Register overloaded method as implementation and use default of
+        parent. Overloaded method isn't validated: method with the same
+        annotations as default of parent overrides it.
+        """
+        self._parent = parent
+
+        if self._default is None:
+            # Default object is registered with deferred objects.
+            return
+
+        self._inherit_default()
+        self._cache.clear()
+
+        if self.is_compiled:
+            self.compile()
+        else:
+            self._install_dispatch()
+
+    def _inherit_default(self) -> None:
+        """Use default of parent, if overloaded method doesn't override it
+        and default isn't replaced in class body.
+        """
+        implementation = self._default
+
+        if implementation is not self._varieties[0]:
+            return
+
+        own = implementation.__all_annotations__
+        inherited = self._parent.default.__all_annotations__
+
+        if own.keys() != inherited.keys() or not all(
+                _TypeHandler.annotations_match(value, inherited[name])
+                for name, value in own.items()
+        ):
+            self._default = _INHERITED
+
+    def _register_pending(self) -> None:
+        derived = self._parent is not None and self._default is None
+
+        try:
+            super(MethodOverloader, self)._register_pending()
+        finally:
+            if derived and self._default is not None:
+                self._inherit_default()
+                self._cache.clear()
+
+                if self.is_compiled:
+                    self.compile()
+                else:
+                    self._install_dispatch()
+
+    def _install_dispatch(self) -> None:
+        super(MethodOverloader, self)._install_dispatch()
+
+        if self._parent is None or self._resolve_uncounted is None:
+            return
+
+        # Own implementations are compared before implementations of
+        # parent, so the result of own dispatch function is checked.
+        self._resolve_own = self._resolve_uncounted
+        self._resolve_uncounted = self._resolve_inherited
+
+        if self._stats is None:
+            self._dispatch = self._resolve_inherited
+
+    def _resolve_inherited(
+            self, args: tuple, kwargs: dict,
+    ) -> MethodImplementation:
+        """Dispatch the call by own implementations, calls resolved to
+        default are dispatched by parent (without counting in statistic
+        of parent).
+        """
+        implementation = self._resolve_own(args, kwargs)
+
+        if implementation is not self._default:
+            return implementation
+
+        parent = self._parent
+        if parent._resolve_uncounted is None:
+            # Parent registers deferred objects and freezes on the first
+            # call.
+            if parent._pending:
+                parent._register_pending()
+
+            if parent._frozen is None:
+                parent.freeze()
+
+        return self._inherit(
+            implementation, parent._resolve_uncounted(args, kwargs),
+        )
+
+    def _inherit(
+            self,
+            default: Union[MethodImplementation, _Inherited],
+            inherited: MethodImplementation,
+    ) -> MethodImplementation:
+        """Replace default of parent with own default."""
+        if default is _INHERITED or inherited is not self._parent.default:
+            return inherited
+
+        return default
+
+    def _receiver(self, receiver: Any) -> Tuple[Any, ...]:
+        """Parameters passed to implementations before call parameters."""
+        return () if self._kind is staticmethod else (receiver,)
+
+    def _call_static(self, *args, **kwargs):
+        return self._dispatch(args, kwargs)(*args, **kwargs)
+
+    def _create_implementation(
+            self, implementation: FunctionType,
+    ) -> MethodImplementation:
+        return self.__implementation_class__(
+            implementation=implementation,
+            annotations=self._annotation_handler.converting_annotations(
+                annotations=_TypeHandler.resolve_annotations(implementation),
+            ),
+            receiver=self._kind is not staticmethod,
+        )
+
+    def _parameters_count(self, function_: FunctionType) -> int:
+        count = super(MethodOverloader, self)._parameters_count(function_)
+
+        # Receiver isn't annotated.
+        if self._kind is not staticmethod and function_.__code__.co_argcount:
+            count -= 1
+
+        return count
+
+    def _unwrap(self, method: Any) -> Any:
+        """Get function of class method or static method."""
+        if isinstance(method, (classmethod, staticmethod)):
+            if type(method) is not self._kind:
+                raise MethodRegisterTypeError()
+
+            return method.__func__
+
+        return method
@@ -0,0 +1,209 @@
+"""File contain process-wide registry of overloaders.
+
+Each created overloader is tracked by weak reference, so registry doesn't
+keep overloaders alive. Registry is exported to JSON with implementations
+tables and dispatch metrics of each overloader, so overloaders with large
+tables can be found in running process.
+"""
+from typing import Any, Dict, List, Optional, Tuple
+
+from overload.overloader.base import _OVERLOADERS
+from overload.type.type import _ArgsType, _SingleType, _Type, _ValueType
+
+__all__ = (
+    'registered_overloaders',
+    'describe_overloader',
+    'export_registry',
+)
+
+
+def registered_overloaders() -> Tuple[Any, ...]:
+    """Alive overloaders, sorted by module and qualified name."""
+    # Values of dict are copied to tuple atomically, so registry is read
+    # while overloaders are created in other threads.
+    overloaders = [
+        overloader for overloader in (
+            reference() for reference in tuple(_OVERLOADERS.values())
+        )
+        if overloader is not None
+    ]
+
+    return tuple(sorted(
+        overloaders, key=lambda overloader: _origin(overloader)[:2],
+    ))
+
+
+def describe_overloader(overloader: Any) -> Dict[str, Any]:
+    """JSON compatible description of overloader: origin, options,
+    implementations table and dispatch metrics. Calls of implementations
+    are reported in table, if overloader collects statistic.
+
+    Description doesn't register deferred implementations of lazy
+    overloader, count of them is reported as pending.
+    """
+    module, qualname, name = _origin(overloader)
+    shadowed = overloader._shadowed
+    default = overloader._default
+    cache = overloader._cache.info()
+    stats = overloader.stats() if overloader.has_stats else None
+    calls = {} if stats is None else {
+        id(implementation): count
+        for implementation, count in stats.implementations
+    }
+
+    description = {
+        'name': name,
+        'qualname': qualname,
+        'module': module,
+        'kind': type(overloader).__name__,
+        'engine': overloader._engine.name,
+        'frozen': overloader.is_frozen,
+        'compiled': overloader.is_compiled,
+        'deep': overloader.is_deep,
+        'lazy': overloader.is_lazy,
+        'implementations': len(overloader._varieties),
+        'pending': len(overloader._pending),
+        'shadowed': len(shadowed),
+        'ambiguities': len(overloader._ambiguities),
+        'cache': {
+            'hits': cache.hits,
+            'misses': cache.misses,
+            'maxsize': cache.maxsize,
+            'currsize': cache.currsize,
+        },
+        'table': [
+            {
+                'name': _implementation_name(implementation),
+                'default': implementation is default,
+                'shadowed': id(implementation) in overloader._shadowed_ids,
+                'parameters': _parameters(implementation),
+                'calls': (
+                    None if stats is None
+                    else calls.get(id(implementation), 0)
+                ),
+            }
+            for implementation in overloader._varieties
+        ],
+        'stats': None,
+    }
+
+    if stats is not None:
+        description['stats'] = {
+            'calls': stats.calls,
+            'compares': stats.compares,
+            'defaults': stats.defaults,
+            'compares_per_call': stats.compares_per_call,
+            'default_ratio': stats.default_ratio,
+            'latency': [list(bucket) for bucket in stats.latency],
+        }
+
+    return description
+
+
+def export_registry(
+        min_implementations: int = 0,
+        module: Optional[str] = None,
+        indent: Optional[int] = None,
+) -> str:
+    """Export descriptions of alive overloaders to JSON.
+
+    Args:
+        min_implementations (int): Export only overloaders with at least
+            this count of registered implementations.
+        module (str, optional): Export only overloaders of module or its
+            submodules.
+        indent (int, optional): Indent of JSON, None - compact JSON.
+
+    """
+    # JSON encoder isn't imported by overloaders.
+    import json
+
+    overloaders = []
+
+    for overloader in registered_overloaders():
+        description = describe_overloader(overloader)
+
+        if description['implementations'] < min_implementations:
+            continue
+
+        if module is not None and not (
+                description['module'] == module
+                or description['module'].startswith(f'{module}.')
+        ):
+            continue
+
+        overloaders.append(description)
+
+    return json.dumps(
+        {'count': len(overloaders), 'overloaders': overloaders},
+        indent=indent,
+    )
+
+
+def _origin(overloader: Any) -> Tuple[str, str, str]:
+    """Module, qualified name and name of overloaded object."""
+    if overloader._varieties:
+        object_ = overloader._varieties[0].implementation
+    elif overloader._pending:
+        object_ = overloader._pending[0][0]
+    else:
+        object_ = None
+
+    # Functions of classmethod and staticmethod.
+    object_ = getattr(object_, '__func__', object_)
+    name = overloader.__origin_name__
+
+    return (
+        getattr(object_, '__module__', None) or '',
+        getattr(object_, '__qualname__', name),
+        name,
+    )
+
+
+def _implementation_name(implementation: Any) -> str:
+    function = implementation.implementation
+    function = getattr(function, '__func__', function)
+    return getattr(function, '__qualname__', repr(function))
+
+
+def _parameters(implementation: Any) -> Dict[str, str]:
+    """Annotations of implementation parameters, infinite parameters are
+    named *args and **kwargs.
+    """
+    parameters = {
+        name: _annotation_name(annotation)
+        for name, annotation in implementation.__all_annotations__.items()
+    }
+
+    for name, annotation in (
+            ('*args', implementation.__infinite_args__),
+            ('**kwargs', implementation.__infinite_kwargs__),
+    ):
+        if annotation is not None:
+            parameters[name] = _annotation_name(annotation)
+
+    return parameters
+
+
+def _annotation_name(annotation: Any) -> str:
+    """Readable name of converted annotation."""
+    if isinstance(annotation, _SingleType):
+        kind = 'Args' if isinstance(annotation, _ArgsType) else 'Kwargs'
+        return f'{kind}[{_annotation_name(annotation.types)}]'
+
+    members: List[_Type] = (
+        [annotation] if isinstance(annotation, _Type) else list(annotation)
+    )
+    names = []
+
+    for member in members:
+        class_ = member.type
+
+        if member.__class__ is _ValueType:
+            names.append(f'Literal[{member.value!r}]')
+        elif class_ is Ellipsis:
+            names.append('Any')
+        else:
+            names.append(getattr(class_, '__qualname__', repr(class_)))
+
+    return ' | '.join(names)
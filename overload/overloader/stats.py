@@ -0,0 +1,114 @@
+"""File contain dispatch statistic of overloader."""
+from bisect import bisect_left
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+__all__ = (
+    'LATENCY_BOUNDS',
+    'StatsInfo',
+    'DispatchStats',
+)
+
+# Upper bounds of dispatch latency histogram buckets in nanoseconds, the
+# last bucket counts slower dispatches.
+LATENCY_BOUNDS = (500, 1000, 2000, 5000, 10000, 50000, 100000, 1000000)
+
+
+class StatsInfo(NamedTuple):
+    """Statistic of overloader dispatching.
+
+    Attrs:
+        calls (int): Count of dispatched calls.
+        implementations (tuple): Pairs (implementation, count of calls
+            dispatched to it), the most called implementation is the first.
+        compares (int): Count of checks of calls types by engine:
+            compared implementations for linear and mro engines, looked
+            up masks for bitset engine. Calls resolved by cache aren't
+            checked.
+        defaults (int): Count of calls dispatched to default implementation.
+        latency (tuple): Pairs (upper bound in nanoseconds, count of
+            dispatches), bound of the last bucket is None.
+
+    """
+    calls: int
+    implementations: Tuple[Tuple[Any, int], ...]
+    compares: int
+    defaults: int
+    latency: Tuple[Tuple[Optional[int], int], ...]
+
+    @property
+    def compares_per_call(self) -> float:
+        """Average count of compared implementations per call."""
+        return self.compares / self.calls if self.calls else 0.0
+
+    @property
+    def default_ratio(self) -> float:
+        """Part of calls, dispatched to default implementation."""
+        return self.defaults / self.calls if self.calls else 0.0
+
+
+class DispatchStats:
+    """Counters of overloader dispatching.
+
+    Implementations are counted by identity, counted implementations are
+    kept alive until reset.
+    """
+    __slots__ = ('_calls', '_counts', '_compares', '_defaults', '_latency')
+
+    # Count of calls by id of implementation: [implementation, count].
+    _counts: Dict[int, List[Any]]
+    _latency: List[int]
+
+    def __init__(self):
+        self.reset()
+
+    def __repr__(self) -> str:
+        return (f'< DispatchStats > calls={self._calls} '
+                f'defaults={self._defaults}')
+
+    def add(
+            self,
+            implementation: Any,
+            latency: int,
+            compares: int,
+            is_default: bool,
+    ) -> None:
+        """Count dispatched call.
+
+        Args:
+            implementation (Any): Dispatched implementation.
+            latency (int): Time of dispatching in nanoseconds.
+            compares (int): Count of compared implementations.
+            is_default (bool): Call is dispatched to default implementation.
+
+        """
+        self._calls += 1
+        self._compares += compares
+        self._defaults += is_default
+        self._latency[bisect_left(LATENCY_BOUNDS, latency)] += 1
+
+        try:
+            self._counts[id(implementation)][1] += 1
+        except KeyError:
+            self._counts[id(implementation)] = [implementation, 1]
+
+    def reset(self) -> None:
+        """Remove all counted calls."""
+        self._calls = 0
+        self._counts = {}
+        self._compares = 0
+        self._defaults = 0
+        self._latency = [0] * (len(LATENCY_BOUNDS) + 1)
+
+    def info(self) -> StatsInfo:
+        """Current statistic of dispatching."""
+        return StatsInfo(
+            calls=self._calls,
+            implementations=tuple(sorted(
+                map(tuple, self._counts.values()),
+                key=lambda item: item[1],
+                reverse=True,
+            )),
+            compares=self._compares,
+            defaults=self._defaults,
+            latency=tuple(zip((*LATENCY_BOUNDS, None), self._latency)),
+        )
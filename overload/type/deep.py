@@ -0,0 +1,252 @@
+"""File contain checker of collections elements for deep overloaders."""
+from collections.abc import Mapping, Sequence
+from itertools import islice
+from random import sample
+from typing import Any, Callable, Dict, Iterable, Tuple, Union
+
+from overload.exception.type import UnknownDeepStrategy
+
+from .type import _KeyType, _SingleType, _Type, _TypeHandler, _ValueType
+
+__all__ = (
+    'DEEP_STRATEGIES',
+    'DeepChecker',
+)
+
+DEEP_STRATEGIES = ('first', 'random', 'all')
+# Classes of immutable collections, which results are cached by id.
+_IMMUTABLE = (tuple, frozenset)
+
+_Annotation = Union[_Type, Tuple[_Type, ...], _SingleType]
+
+
+class DeepChecker:
+    """Checker of call parameters values with annotations of collections
+    elements (List[int], Dict[str, List[int]], Tuple[int, str]).
+
+    Checking cost is bounded by strategy: only a sample of collection
+    elements is checked, except elements of fixed length tuples. Result
+    for tuple and frozenset, which elements annotations have no inner
+    types, is cached by id of collection, collection is kept alive by
+    cache, so id isn't reused while result is cached.
+
+    Class attributes:
+        __type_handler__ (_TypeHandler): Annotation converting class,
+            which keeps inner types of collections.
+
+    Args:
+        strategy (str): Elements of collection, which are checked:
+            first - the first size elements,
+            random - random size elements of sequence, the first size
+                elements of other collections,
+            all - all elements.
+        size (int): Count of checked elements for first and random
+            strategies.
+        exact (bool): Class of value is compared with annotation by
+            equality, else by isinstance.
+        cache_size (int): Max count of cached results of tuples and
+            frozensets, 0 - cache is disabled.
+
+    """
+    __slots__ = ('_strategy', '_size', '_exact', '_cache', '_cache_size')
+
+    __type_handler__: _TypeHandler = _TypeHandler(deep=True)
+
+    _cache: Dict[Tuple[int, int], Tuple[Any, bool]]
+
+    def __init__(
+            self,
+            strategy: str = 'first',
+            size: int = 8,
+            exact: bool = True,
+            cache_size: int = 256,
+    ):
+        if strategy not in DEEP_STRATEGIES:
+            raise UnknownDeepStrategy(strategy, DEEP_STRATEGIES)
+
+        if not isinstance(size, int) or size < 1:
+            raise ValueError(
+                f'Deep size must be positive integer, not {size}.'
+            )
+
+        self._strategy = strategy
+        self._size = size
+        self._exact = exact
+        self._cache = {}
+        self._cache_size = cache_size
+
+    def __repr__(self) -> str:
+        return (f'< DeepChecker > strategy={self._strategy} '
+                f'size={self._size}')
+
+    @property
+    def strategy(self) -> str:
+        """Name of strategy, choosing checked elements."""
+        return self._strategy
+
+    @property
+    def size(self) -> int:
+        """Count of checked elements for first and random strategies."""
+        return self._size
+
+    def check_call(
+            self,
+            checks: Iterable[Tuple[Union[int, str], _Annotation]],
+            args: Tuple[Any, ...],
+            kwargs: Dict[str, Any],
+            dispatch_key: Callable = type,
+    ) -> bool:
+        """Check call parameters with annotations of bound implementation.
+
+        Args:
+            checks (iterable): Pairs (slot, annotation), returned by
+                FunctionImplementation.bind.
+            args (tuple): Call args values.
+            kwargs (dict): Call kwargs values.
+            dispatch_key (callable): Dispatch key of value, compared with
+                annotations of dispatch key.
+
+        """
+        for slot, annotation in checks:
+            value = (args if slot.__class__ is int else kwargs)[slot]
+
+            if not self.check(value, annotation, dispatch_key):
+                return False
+
+        return True
+
+    def check(
+            self,
+            value: Any,
+            annotation: _Annotation,
+            dispatch_key: Callable = type,
+    ) -> bool:
+        """Check value and sample of its elements with annotation."""
+        if isinstance(annotation, _Type):
+            return self._check_member(value, annotation, dispatch_key)
+
+        if isinstance(annotation, _SingleType):
+            annotation = annotation.types
+
+        return any(
+            self._check_member(value, member, dispatch_key)
+            for member in annotation
+        )
+
+    def clear(self) -> None:
+        """Remove cached results of tuples and frozensets."""
+        self._cache.clear()
+
+    def _check_member(
+            self, value: Any, member: _Type, dispatch_key: Callable,
+    ) -> bool:
+        """Check value with one member of annotation."""
+        class_ = member.type
+
+        if class_ is Ellipsis:
+            return True
+
+        if member.__class__ is _ValueType:
+            return type(value) is member.base and value == member.value
+
+        if member.__class__ is _KeyType:
+            return dispatch_key(value) == class_
+
+        try:
+            if member.abstract is not None:
+                matched = isinstance(value, member.abstract)
+            elif self._exact:
+                matched = type(value) is class_
+            else:
+                matched = isinstance(value, class_)
+        except TypeError:
+            # Annotation isn't class.
+            return False
+
+        if not matched:
+            return False
+
+        if not member.is_nested:
+            return True
+
+        if type(value) not in _IMMUTABLE or not self._is_shallow(member):
+            return self._check_elements(value, member, dispatch_key)
+
+        key = (id(value), id(member))
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] is value:
+            return cached[1]
+
+        result = self._check_elements(value, member, dispatch_key)
+
+        if self._cache_size:
+            if len(self._cache) >= self._cache_size:
+                # Evict the oldest result.
+                del self._cache[next(iter(self._cache))]
+
+            self._cache[key] = (value, result)
+
+        return result
+
+    def _check_elements(
+            self, value: Any, member: _Type, dispatch_key: Callable,
+    ) -> bool:
+        """Check elements of collection with inner types of annotation."""
+        v_types, k_types = member.v_types, member.k_types
+
+        # Fixed length tuple is checked by positions.
+        if not member.can_mixed_v:
+            return len(value) == len(v_types) and all(
+                self.check(item, annotation, dispatch_key)
+                for item, annotation in zip(value, v_types)
+            )
+
+        if isinstance(value, Mapping):
+            for key in self._sample(value):
+                if k_types is not None and not self.check(
+                        key, k_types, dispatch_key,
+                ):
+                    return False
+
+                if v_types is not None and not self.check(
+                        value[key], v_types, dispatch_key,
+                ):
+                    return False
+
+            return True
+
+        if v_types is None:
+            return True
+
+        return all(
+            self.check(item, v_types, dispatch_key)
+            for item in self._sample(value)
+        )
+
+    def _sample(self, value: Any) -> Iterable[Any]:
+        """Elements of collection (keys of mapping), chosen by strategy."""
+        size = self._size
+
+        if self._strategy == 'all' or len(value) <= size:
+            return value
+
+        if self._strategy == 'random' and isinstance(value, Sequence):
+            return [value[index] for index in sample(range(len(value)), size)]
+
+        return islice(value, size)
+
+    @staticmethod
+    def _is_shallow(member: _Type) -> bool:
+        """Inner types of annotation have no inner types, so result for
+        immutable collection doesn't change."""
+        for types in (member.v_types, member.k_types):
+            for annotation in types or ():
+                inner = (
+                    (annotation,) if isinstance(annotation, _Type)
+                    else annotation
+                )
+
+                if any(type_.is_nested for type_ in inner):
+                    return False
+
+        return True
@@ -0,0 +1,46 @@
+"""File contain key extractors of dispatch keys for standard classes."""
+from typing import Any, Callable, Dict, Tuple
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+__all__ = (
+    'memoryview_key',
+    'ndarray_key',
+    'default_key_extractors',
+)
+
+
+def memoryview_key(value: memoryview) -> Tuple[Any, ...]:
+    """Dispatch key of memoryview: format of items and C contiguity.
+
+    Example:
+        memoryview(b'abc') -> (memoryview, 'B', True)
+
+    """
+    return memoryview, value.format, value.c_contiguous
+
+
+def ndarray_key(value: Any) -> Tuple[Any, ...]:
+    """Dispatch key of numpy array: type code of dtype and count of
+    dimensions.
+
+    Example:
+        numpy.zeros(3, dtype=numpy.float32) -> (numpy.ndarray, 'f', 1)
+
+    """
+    return type(value), value.dtype.char, value.ndim
+
+
+def default_key_extractors() -> Dict[type, Callable]:
+    """Key extractors of standard classes, numpy array is included if numpy
+    is installed.
+    """
+    extractors = {memoryview: memoryview_key}
+
+    if numpy is not None:
+        extractors[numpy.ndarray] = ndarray_key
+
+    return extractors
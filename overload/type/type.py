@@ -3,7 +3,9 @@ try:
 except ImportError:
     from overload.utils.property import cached_property
 
-from types import FunctionType
+from abc import ABCMeta
+from types import FunctionType, SimpleNamespace
+from weakref import WeakKeyDictionary, ref
 from typing import (
     Dict,
     Any,
@@ -20,10 +22,13 @@ from typing import (
     Tuple,
     # Functions.
     cast,
+    get_type_hints,
     # Other.
     Generic
 )
 from collections.abc import (
+    Collection,
+    Mapping,
     Callable,
     Coroutine,
     Iterator,
@@ -33,24 +38,37 @@ from collections.abc import (
 )
 from contextlib import AbstractContextManager, AbstractAsyncContextManager
 
+try:
+    from typing import Literal
+except ImportError:
+    Literal = None
+
 __all__ = (
     'Args',
-    'Kwargs'
+    'Kwargs',
+    'Key',
 )
 
+# Annotations of functions with string annotations (PEP 563), evaluated
+# by typing.get_type_hints.
+_RESOLVED_ANNOTATIONS = WeakKeyDictionary()
+
 
 class _Type:
     """Class contained overloading type and it parameters
     for typing.TypeVar instance."""
-    __slots__ = ('_type', '_v_types', '_k_types', '_can_mixed_v')
+    __slots__ = (
+        '_type', '_v_types', '_k_types', '_can_mixed_v', '_abstract',
+    )
 
     def __init__(
-            self, type_: Union[type, TypeVar],
+            self, type_: Union[type, TypeVar], abstract: type = None,
     ):
         self._type = type_
         self._v_types = None
         self._k_types = None
         self._can_mixed_v = True
+        self._abstract = abstract
 
     @property
     def type(self) -> type or TypeVar:
@@ -82,6 +100,18 @@ class _Type:
         """
         return self._k_types
 
+    @property
+    def abstract(self) -> Optional[type]:
+        """Abstract base class or runtime checkable protocol of annotation,
+        which subclasses are checked by issubclass.
+
+        Example:
+            for typing.Iterator annotation type is FunctionType and abstract
+            is collections.abc.Iterator.
+
+        """
+        return self._abstract
+
     @property
     def can_mixed_v(self) -> bool:
         """Flag, about can mixed value types or must be an strict sequence."""
@@ -95,20 +125,90 @@ class _Type:
     def __str__(self):
         return f"_Type({self.type})"
 
+    @property
+    def base(self) -> Any:
+        """Class of values compared with type, for dispatch key it is the
+        first item of key."""
+        return self.type
+
+    @property
+    def is_nested(self) -> bool:
+        """Type contain expected types of inner values (deep type)."""
+        return self._v_types is not None or self._k_types is not None
+
+    @property
+    def is_wildcard(self) -> bool:
+        """Annotation is compared with any type (typing.Any, TypeVar)."""
+        return self.type is Ellipsis
+
+    def matches(self, other: '_Type') -> bool:
+        """Compare types, wildcard is compared with any type and class is
+        compared with any dispatch key of it. Unlike equality, matching isn't
+        consistent with hash, so matched types can't be found in dict or set
+        by each other.
+        """
+        return (
+                self.type is Ellipsis
+                or other.type is Ellipsis
+                or self.type == other.type
+                or self.type == other.base
+        )
+
     def __eq__(self, other: '_Type') -> bool:
         if not isinstance(other, _Type):
             # Do not support not _Type class instance
             raise ValueError('_Type object can be compared only with self.')
 
-        if self.type is Ellipsis or other.type is Ellipsis:
-            return True
-
         return self.type == other.type
 
     def __hash__(self):
         return hash(self.type)
 
 
+class _ClassType(_Type):
+    """Shared _Type of call parameters class. Class is storage by weak
+    reference, so classes created at runtime can be garbage-collected."""
+    __slots__ = ('_hash',)
+
+    def __init__(self, type_: type, callback: Callable = None):
+        super().__init__(ref(type_, callback))
+        self._hash = hash(type_)
+
+    @property
+    def type(self) -> type:
+        return self._type()
+
+    def __hash__(self):
+        return self._hash
+
+
+class _KeyType(_Type):
+    """_Type of dispatch key, extracted from value by key extractor of value
+    class. Key is a tuple, the first item of which is class of value."""
+    __slots__ = ()
+
+    def __init__(self, key: Tuple[Any, ...]):
+        super().__init__(key)
+
+    @property
+    def base(self) -> Any:
+        return self._type[0]
+
+
+class _ValueType(_KeyType):
+    """_Type of value of typing.Literal annotation. Key of value is a pair
+    (class of value, value), so values are compared by hash table."""
+    __slots__ = ()
+
+    def __init__(self, value: Any):
+        super().__init__((type(value), value))
+
+    @property
+    def value(self) -> Any:
+        """Value of literal annotation."""
+        return self._type[1]
+
+
 class _SingleType:
     """Base type for single types."""
     __slots__ = ('_types',)
@@ -130,7 +230,7 @@ class _SingleType:
         return self.__class__.__name__
 
     def __contains__(self, item):
-        return item in self.types
+        return any(type_.matches(item) for type_ in self.types)
 
     def __eq__(self, other):
         if not isinstance(other, _SingleType):
@@ -170,7 +270,7 @@ class _TypeHandler:
         Any,
     )
 
-    __slots__ = ('__dict__', '_deep')
+    __slots__ = ('__dict__', '_deep', '_classes', '_extractors', '_keys')
 
     def __repr__(self) -> str:
         return "<class 'TypeHandler'>"
@@ -178,7 +278,7 @@ class _TypeHandler:
     def __str__(self) -> str:
         return 'Handler for python3 base types and types from typing module.'
 
-    def __init__(self):
+    def __init__(self, deep: bool = False):
         """
         Args:
             deep (Bool, optional): Check inner field types of arguments (True)
@@ -194,14 +294,30 @@ class _TypeHandler:
                     List[str] -> _Type(list)
 
         """
-        # Start realisation without deep functional.
-        self._deep = False
+        self._deep = deep
+        # Extracted types of call parameters classes, weakly keyed by class.
+        self._classes: Dict[ref, _Type] = {}
+        # Key extractors by class and extracted types of dispatch keys.
+        self._extractors: Dict[type, Callable] = {}
+        self._keys: Dict[Tuple[Any, ...], _KeyType] = {}
+        # Dispatch key of value: class or key of key extractor.
+        self.dispatch_key: Callable = type
 
     def out_up_types(self, type_: Any, ) -> Union[_Type, Tuple[_Type, ...]]:
         """Convert type to _Type instance or tuple with _Type instances."""
+        if isinstance(type_, Key):
+            return _KeyType(type_.key)
+
+        # Each value of literal is a separate member of Union.
+        origin = getattr(type_, '__origin__', None)
+        if Literal is not None and origin is Literal:
+            values = tuple(map(_ValueType, type_.__args__))
+            return values[0] if len(values) == 1 else values
+
         real_type, v_types, k_types = None, None, None
         type_class = _Type
         can_mixed: bool = True
+        abstract = None
 
         try:
             real_type = type_.__origin__
@@ -212,7 +328,10 @@ class _TypeHandler:
                 real_type = type_
         finally:
             if real_type in self._FUNCTION_INTERPRET:
+                abstract = real_type
                 real_type = FunctionType
+            elif self._is_abstract(real_type):
+                abstract = real_type
             elif real_type is Args:
                 type_class = _ArgsType
             elif real_type is Kwargs:
@@ -236,43 +355,204 @@ class _TypeHandler:
                     real_type.append(new_type)
 
             real_type = tuple(real_type)
-        # Handling inner types.
-        # elif self._deep:
-        #     try:
-        #         # Only typing.Tuple can contain fixed count of types.
-        #         if real_type is tuple:
-        #             if type_.__args__[-1] is not Ellipsis:
-        #                 can_mixed = False
-        #
-        #             v_types = tuple(
-        #                 self.out_up_types(inner)
-        #                 for inner in type_.__args__[:(-1 - can_mixed)]
-        #             )
-        #
-        #         # Not tuple.
-        #         else:
-        #             v_types = tuple(
-        #                 self.out_up_types(type_.__args__[-1])
-        #             )
-        #
-        #         # object type is variation of dict
-        #         if len(type_.__args__) > 1:
-        #             k_types = tuple(
-        #                 self.out_up_types(type_.__args__[0])
-        #             )
-        #     except IndexError:
-        #         pass
+        # Handling inner types of collections.
+        elif self._deep and self._is_collection(real_type):
+            type_args = getattr(type_, '__args__', None) or ()
+
+            # Only typing.Tuple can contain fixed count of types.
+            if (
+                    real_type is tuple
+                    and type_args
+                    and type_args[-1] is not Ellipsis
+            ):
+                can_mixed = False
+                v_types = tuple(
+                    self.out_up_types(inner) for inner in type_args
+                )
+            elif len(type_args) > 1 and real_type is not tuple:
+                k_types = self._inner_types(type_args[0])
+                v_types = self._inner_types(type_args[-1])
+            elif type_args and issubclass(real_type, Mapping):
+                k_types = self._inner_types(type_args[0])
+            elif type_args:
+                v_types = self._inner_types(type_args[0])
 
         # Generate output result.
         real_type_is_tuple = isinstance(real_type, tuple)
         is_single_subclass = issubclass(type_class, _SingleType)
         if real_type_is_tuple and not is_single_subclass:
             type_ = real_type
+        elif abstract is not None:
+            type_ = type_class(real_type, abstract)
         else:
             type_ = type_class(real_type)
 
+        if v_types is not None or k_types is not None:
+            type_._v_types = v_types
+            type_._k_types = k_types
+            type_._can_mixed_v = can_mixed
+
         return type_
 
+    def _inner_types(self, type_: Any) -> Optional[Tuple[_Type, ...]]:
+        """Convert inner type of collection to tuple of _Type, None if
+        inner type is compared with any type.
+        """
+        types = self.out_up_types(type_)
+        types = types if isinstance(types, tuple) else (types,)
+
+        if any(inner.is_wildcard for inner in types):
+            return None
+
+        return types
+
+    @staticmethod
+    def _is_collection(type_: Any) -> bool:
+        """Check elements of type instances can be checked without
+        consuming instance."""
+        return (
+                isinstance(type_, type)
+                and issubclass(type_, Collection)
+                and not issubclass(type_, (str, bytes, bytearray))
+        )
+
+    @staticmethod
+    def _is_abstract(type_: Any) -> bool:
+        """Check type is abstract base class or runtime checkable protocol,
+        subclasses of which can be checked by issubclass. Each class with
+        ABCMeta metaclass is abstract, because virtual subclasses can be
+        registered in it after annotation is converted.
+        """
+        return isinstance(type_, ABCMeta) and (
+            not getattr(type_, '_is_protocol', False)
+            or getattr(type_, '_is_runtime_protocol', False)
+        )
+
+    @staticmethod
+    def annotations_match(
+            first: Union[_Type, Tuple[_Type, ...], _SingleType],
+            second: Union[_Type, Tuple[_Type, ...], _SingleType],
+    ) -> bool:
+        """Compare converted annotations, wildcard is compared with any type.
+        Annotations of different kind (_Type, Union tuple, Args or Kwargs)
+        aren't compared.
+        """
+        if isinstance(first, _Type) and isinstance(second, _Type):
+            if not first.matches(second):
+                return False
+
+            # Not deep type is compared with any inner types, as well as
+            # fixed and variable length tuples.
+            if not (first.is_nested and second.is_nested) or (
+                    first.can_mixed_v != second.can_mixed_v
+            ):
+                return True
+
+            fixed = not first.can_mixed_v
+            return (
+                    _TypeHandler._inner_match(
+                        first.k_types, second.k_types, fixed,
+                    )
+                    and _TypeHandler._inner_match(
+                        first.v_types, second.v_types, fixed,
+                    )
+            )
+
+        if isinstance(first, _SingleType):
+            if first.__class__ is not second.__class__:
+                return False
+            first, second = first.types, second.types
+
+        if not (isinstance(first, tuple) and isinstance(second, tuple)):
+            return False
+
+        return len(first) == len(second) and all(
+            _TypeHandler.annotations_match(first_type, second_type)
+            for first_type, second_type in zip(first, second)
+        )
+
+    @staticmethod
+    def _inner_match(
+            first: Optional[Tuple[Any, ...]],
+            second: Optional[Tuple[Any, ...]],
+            fixed: bool,
+    ) -> bool:
+        """Compare inner types of deep types, None is any type. Fixed types
+        are compared by positions, else any pair of types must be compared.
+        """
+        if first is None or second is None:
+            return True
+
+        if fixed:
+            return len(first) == len(second) and all(
+                _TypeHandler.annotations_match(first_type, second_type)
+                for first_type, second_type in zip(first, second)
+            )
+
+        return any(
+            _TypeHandler.annotations_match(first_type, second_type)
+            for first_type in first for second_type in second
+        )
+
+    @staticmethod
+    def resolve_annotations(function: Any) -> Dict[str, Any]:
+        """Annotations of function, where string annotations
+        (from __future__ import annotations) are evaluated in module
+        globals of function. Result is cached until function is alive.
+
+        Only string annotations are evaluated, so parameters with None
+        default aren't wrapped to Optional (before python 3.11). NameError
+        is raised, if string annotation refers to name, which isn't
+        defined yet.
+        """
+        annotations = function.__annotations__
+        strings = {
+            name: value for name, value in annotations.items()
+            if isinstance(value, str)
+        }
+
+        if not strings:
+            return annotations
+
+        try:
+            return _RESOLVED_ANNOTATIONS[function]
+        except KeyError:
+            pass
+
+        globalns = getattr(function, '__globals__', {})
+
+        try:
+            # Holder isn't function, so typing doesn't read defaults.
+            hints = get_type_hints(
+                SimpleNamespace(__annotations__=strings), globalns,
+            )
+        except TypeError:
+            # Annotation isn't type (Key), before python 3.11 typing
+            # don't evaluate it.
+            hints = {
+                name: eval(value, globalns)
+                for name, value in strings.items()
+            }
+
+        resolved = {**annotations, **hints}
+        _RESOLVED_ANNOTATIONS[function] = resolved
+        return resolved
+
+    @staticmethod
+    def has_forward_references(function: Any) -> bool:
+        """String annotations of function refer to names, which aren't
+        defined yet (class annotating own methods).
+        """
+        if getattr(function, '__annotations__', None) is None:
+            return False
+
+        try:
+            _TypeHandler.resolve_annotations(function)
+        except NameError:
+            return True
+
+        return False
+
     def converting_annotations(
             self,
             annotations: Dict[str, type],
@@ -289,8 +569,71 @@ class _TypeHandler:
         return new_annotations
 
     def extract_type(self, value: Any) -> _Type:
-        """Convert value to instance of _Type."""
-        return self.out_up_types(type(value))
+        """Convert value to instance of _Type. Instance is shared for all
+        values of same class."""
+        try:
+            # Key is the basic weak reference of class, which is reused by
+            # weakref.ref while key is alive.
+            return self._classes[ref(type(value))]
+        except KeyError:
+            extractor = self._extractors.get(type(value))
+
+            if extractor is not None:
+                return self._intern_key(extractor(value))
+
+            return self._intern_class(type(value))
+
+    def register_extractor(
+            self, class_: type, extractor: Callable,
+    ) -> None:
+        """Register key extractor of class. Values of class are compared
+        with annotations by dispatch key, returned by extractor.
+
+        Args:
+            class_ (type): Class of values, subclasses aren't affected.
+            extractor (callable): Take value and return hashable tuple,
+                the first item of which is class.
+
+        """
+        self._extractors[class_] = extractor
+        self._classes.pop(ref(class_), None)
+        self._keys.clear()
+        self.dispatch_key = self._dispatch_key
+
+    def unregister_extractor(self, class_: type) -> None:
+        """Remove key extractor of class."""
+        self._extractors.pop(class_, None)
+        self._keys.clear()
+
+        if not self._extractors:
+            self.dispatch_key = type
+
+    def _dispatch_key(self, value: Any) -> Any:
+        extractor = self._extractors.get(type(value))
+        return type(value) if extractor is None else extractor(value)
+
+    def _intern_key(self, key: Tuple[Any, ...]) -> _KeyType:
+        """Convert dispatch key to shared _KeyType."""
+        try:
+            return self._keys[key]
+        except KeyError:
+            type_ = self._keys[key] = _KeyType(key)
+            return type_
+
+    def _intern_class(self, class_: type) -> _Type:
+        """Convert class to _Type and storage it until class is alive."""
+        type_ = self.out_up_types(class_)
+        key = ref(class_)
+        classes = self._classes
+
+        if type(type_) is _Type and type_.type is class_:
+            type_ = _ClassType(
+                class_,
+                lambda _, key_=key: classes.pop(key_, None),
+            )
+
+        classes[key] = type_
+        return type_
 
     def converting_args(self, args: Tuple[Any, ...]) -> Tuple[_Type, ...]:
         """Converting all call args values to _Type instances."""
@@ -307,3 +650,20 @@ class Args(Generic[T]):
 
 class Kwargs(Generic[T]):
     pass
+
+
+class Key:
+    """Annotation of dispatch key. Key[memoryview, 'B', True] is compared
+    with values, for which key extractor of memoryview return
+    (memoryview, 'B', True).
+    """
+    __slots__ = ('key',)
+
+    def __init__(self, key: Tuple[Any, ...]):
+        self.key = key
+
+    def __repr__(self) -> str:
+        return f'Key[{", ".join(map(repr, self.key))}]'
+
+    def __class_getitem__(cls, key: Any) -> 'Key':
+        return cls(key if isinstance(key, tuple) else (key,))
@@ -0,0 +1,31 @@
+"""File contain checking of coroutine functions without importing inspect."""
+import sys
+from functools import partial
+from types import FunctionType
+from typing import Any
+
+__all__ = (
+    'is_coroutine_function',
+)
+
+# Flag of code of coroutine function, inspect.CO_COROUTINE.
+CO_COROUTINE = 0x80
+
+
+def is_coroutine_function(function: Any) -> bool:
+    """Check function is coroutine function like inspect.iscoroutinefunction.
+    Function can be marked as coroutine function only by inspect, so while
+    inspect isn't imported, flags of function code are checked.
+    """
+    inspect = sys.modules.get('inspect')
+    if inspect is not None:
+        return inspect.iscoroutinefunction(function)
+
+    while isinstance(function, partial):
+        function = function.func
+
+    function = getattr(function, '__func__', function)
+
+    return isinstance(function, FunctionType) and bool(
+        function.__code__.co_flags & CO_COROUTINE
+    )
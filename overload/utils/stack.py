@@ -0,0 +1,28 @@
+"""File contain stack level of warnings, raised inside overload package."""
+import sys
+
+__all__ = (
+    'external_stacklevel',
+)
+
+_PACKAGE = __name__.partition('.')[0]
+
+
+def external_stacklevel() -> int:
+    """Stack level for warnings.warn, called by caller of this function,
+    pointing to the first frame outside of overload package. Registration
+    is reached by decorators, register, deferred registration on the first
+    call and derived overloaders, so stack depth isn't constant.
+    """
+    frame = sys._getframe(1)
+    level = 1
+
+    while frame.f_back is not None:
+        module = frame.f_globals.get('__name__', '')
+        if module != _PACKAGE and not module.startswith(f'{_PACKAGE}.'):
+            break
+
+        frame = frame.f_back
+        level += 1
+
+    return level
@@ -34,6 +34,7 @@ setup(
     packages=[
         "overload",
         "overload.decorator",
+        "overload.engine",
         "overload.exception",
         "overload.implementation",
         "overload.overloader",
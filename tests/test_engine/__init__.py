@@ -0,0 +1 @@
+"""Module with engines tests."""
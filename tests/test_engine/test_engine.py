@@ -0,0 +1,344 @@
+import gc
+from abc import ABC
+from collections.abc import Mapping
+from numbers import Real
+from typing import Any, Optional, Union
+from weakref import ref
+
+try:
+    from typing import Protocol, runtime_checkable
+except ImportError:  # pragma: no cover
+    from typing_extensions import Protocol, runtime_checkable
+
+import pytest
+
+from overload.engine import BitsetEngine, LinearEngine, MroEngine
+from overload.exception.overloader import CompileEngineError, UnknownEngine
+from overload.exception.warning import ShadowedImplementationWarning
+from overload.overloader.function import FunctionOverloader
+from overload.type.type import _Type, _TypeHandler
+
+from tests.test_implementation.data import (
+    TEST_FUNCTION_IMPLEMENTATION_COMPARE,
+    implementation_2,
+    implementation_4,
+    implementation_5,
+    implementation_6,
+    implementation_13,
+)
+
+ENGINES = (LinearEngine, BitsetEngine)
+
+
+@pytest.mark.engine
+@pytest.mark.parametrize('engine_class', (*ENGINES, MroEngine))
+@pytest.mark.parametrize(
+    'implementation,named,unnamed,compare_result',
+    TEST_FUNCTION_IMPLEMENTATION_COMPARE,
+)
+def test_engine_find_single(engine_class, implementation, named, unnamed,
+                            compare_result):
+    if not isinstance(unnamed, tuple):
+        unnamed = (unnamed,)
+
+    engine = engine_class()
+    engine.add(implementation)
+    found = engine.find(unnamed, named)
+
+    assert compare_result == (found is implementation)
+
+
+@pytest.mark.engine
+@pytest.mark.parametrize('engine_class', ENGINES)
+@pytest.mark.parametrize(
+    'named,unnamed,expected',
+    (
+        ({}, (_Type(int),), implementation_6),
+        ({}, (_Type(int), _Type(str)), implementation_5),
+        ({'a': _Type(int)}, (), implementation_4),
+        ({}, (_Type(str),), implementation_5),
+        ({'c': _Type(int)}, (_Type(int),), implementation_13),
+        ({'a': _Type(str)}, (), None),
+    ),
+)
+def test_engine_find_last_registered(engine_class, named, unnamed, expected):
+    engine = engine_class()
+
+    for implementation in (
+            implementation_13,
+            implementation_2,
+            implementation_4,
+            implementation_5,
+            implementation_6,
+    ):
+        # Tables of shape is build before registration of all
+        # implementations, to check updating of them.
+        engine.find(unnamed, named)
+        engine.add(implementation)
+
+    assert engine.find(unnamed, named) is expected
+
+
+@pytest.mark.engine
+def test_overloader_engine_selection():
+    def default_function(a: int):
+        return 'default'
+
+    def implementation(a: str):
+        return 'str'
+
+    overloader = FunctionOverloader(default_function, engine='bitset')
+    overloader.register(implementation)
+
+    assert isinstance(overloader.engine, BitsetEngine)
+    assert overloader('a') == 'str'
+    assert overloader(1.5) == 'default'
+
+    with pytest.raises(UnknownEngine):
+        FunctionOverloader(default_function, engine='unknown')
+
+
+class Model:
+    pass
+
+
+class UserModel(Model):
+    pass
+
+
+class AdminModel(UserModel):
+    pass
+
+
+def model_function(a: Model, b: int):
+    return 'model'
+
+
+def user_function(a: UserModel, b: int):
+    return 'user'
+
+
+def any_function(a: UserModel, b: Any):
+    return 'any'
+
+
+def default_mro_function(a: object, b: object):
+    return 'default'
+
+
+@pytest.mark.engine
+@pytest.mark.parametrize(
+    'args,expected',
+    (
+        ((Model(), 1), 'model'),
+        ((UserModel(), 1), 'user'),
+        ((AdminModel(), True), 'user'),
+        ((AdminModel(), 'b'), 'any'),
+        ((Model(), 'b'), 'default'),
+        ((1, 1), 'default'),
+    ),
+)
+def test_mro_engine_most_specific(args, expected):
+    overloader = FunctionOverloader(default_mro_function, engine='mro')
+
+    for function in (any_function, user_function, model_function):
+        overloader.register(function)
+
+    assert overloader(*args) == expected
+    assert overloader(*args) == expected
+    assert overloader.cache_info.hits == 1
+
+    with pytest.raises(CompileEngineError):
+        overloader.compile()
+
+
+@runtime_checkable
+class Closable(Protocol):
+    def close(self): ...
+
+
+class Resource:
+    def close(self):
+        pass
+
+
+class Shape(ABC):
+    pass
+
+
+class Square:
+    pass
+
+
+class Circle(Shape):
+    pass
+
+
+class Marker(ABC):
+    pass
+
+
+def mapping_function(a: Mapping):
+    return 'mapping'
+
+
+def dict_function(a: dict):
+    return 'dict'
+
+
+def real_function(a: Real):
+    return 'real'
+
+
+def closable_function(a: Closable):
+    return 'closable'
+
+
+def shape_function(a: Shape):
+    return 'shape'
+
+
+def default_abstract_function(a: object):
+    return 'default'
+
+
+@pytest.mark.engine
+def test_mro_engine_abstract():
+    overloader = FunctionOverloader(default_abstract_function, engine='mro')
+
+    for function in (
+            mapping_function, dict_function, real_function,
+            closable_function, shape_function,
+    ):
+        overloader.register(function)
+
+    assert overloader.engine.uses_abc_registry
+    assert overloader({}) == 'dict'
+    assert overloader({}.keys()) == 'default'
+    assert overloader(1.5) == 'real'
+    assert overloader(True) == 'real'
+    assert overloader(Resource()) == 'closable'
+    assert overloader('a') == 'default'
+
+    # Virtual subclass registration invalidates cached resolution.
+    assert overloader(Square()) == 'default'
+    Shape.register(Square)
+    assert overloader(Square()) == 'shape'
+
+
+def circle_function(a: Circle):
+    return 'circle'
+
+
+def marker_function(a: Marker):
+    return 'marker'
+
+
+@pytest.mark.engine
+def test_mro_engine_late_register():
+    # Class with ABCMeta metaclass without abstract methods and virtual
+    # subclasses is compared by issubclass, classes registered later are
+    # dispatched too.
+    assert _TypeHandler._is_abstract(Circle)
+    assert _TypeHandler._is_abstract(Marker)
+
+    overloader = FunctionOverloader(default_abstract_function, engine='mro')
+    overloader.register(circle_function)
+    overloader.register(marker_function)
+
+    assert overloader.engine.uses_abc_registry
+    assert overloader(Circle()) == 'circle'
+    assert overloader(1) == 'default'
+
+    Marker.register(int)
+    assert overloader(1) == 'marker'
+
+
+@pytest.mark.engine
+def test_mro_engine_classes_collected():
+    overloader = FunctionOverloader(
+        default_abstract_function, engine='mro', cache_size=0,
+    )
+    overloader.register(circle_function)
+    overloader.register(marker_function)
+
+    # Classes created at runtime aren't kept alive by cached MRO.
+    runtime_class = type('RuntimeCircle', (Circle,), {})
+    assert overloader(runtime_class()) == 'circle'
+
+    reference = ref(runtime_class)
+    del runtime_class
+    gc.collect()
+    assert reference() is None
+
+
+def union_function(a: Union[int, str], b: int):
+    return 'union'
+
+
+def optional_function(a: Optional[float], b: int):
+    return 'optional'
+
+
+def wildcard_function(a: Any, b: str):
+    return 'wildcard'
+
+
+def default_index_function(a: bytes, b: bytes):
+    return 'default'
+
+
+@pytest.mark.engine
+@pytest.mark.parametrize('engine', ('linear', 'bitset', 'mro'))
+@pytest.mark.parametrize(
+    'args,expected',
+    (
+        ((1, 1), 'union'),
+        (('a', 1), 'union'),
+        ((None, 1), 'optional'),
+        ((1.5, 1), 'optional'),
+        ((1, 'b'), 'wildcard'),
+        ((b'a', 'b'), 'wildcard'),
+        ((b'a', b'b'), 'default'),
+        ((b'a', 1), 'default'),
+    ),
+)
+def test_engine_union_wildcard_index(engine, args, expected):
+    overloader = FunctionOverloader(default_index_function, engine=engine)
+
+    # Bucket of shape is build before registration to check updating.
+    overloader(b'a', b'b')
+    for function in (union_function, optional_function, wildcard_function):
+        overloader.register(function)
+
+    assert overloader(*args) == expected
+
+
+def shadowed_function(a: str, b: str):
+    return 'shadowed'
+
+
+def shadowing_function(a: str, b: str):
+    return 'shadowing'
+
+
+@pytest.mark.engine
+def test_linear_engine_discard_shadowed():
+    overloader = FunctionOverloader(default_index_function)
+    overloader.register(shadowed_function)
+
+    # Bucket of shape is build before shadowed implementation is discarded.
+    assert overloader('a', 'b') == 'shadowed'
+    with pytest.warns(ShadowedImplementationWarning):
+        overloader.register(shadowing_function)
+
+    shadowed = overloader.varieties[1]
+    assert overloader.shadowed == (shadowed,)
+
+    engine = overloader.engine
+    types = (_Type(str), _Type(str))
+    assert not any(
+        candidate is shadowed for candidate in engine.candidates(types, {})
+    )
+    assert engine.find(types, {}).implementation is shadowing_function
+    assert overloader('a', 'b') == 'shadowing'
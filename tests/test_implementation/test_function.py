@@ -1,7 +1,13 @@
+from itertools import combinations
+
 import pytest
 
 from .data import TEST_FUNCTION_IMPLEMENTATION_COMPARE
 
+IMPLEMENTATIONS = tuple({
+    id(case[0]): case[0] for case in TEST_FUNCTION_IMPLEMENTATION_COMPARE
+}.values())
+
 
 @pytest.mark.implementation
 @pytest.mark.parametrize(
@@ -11,3 +17,60 @@ from .data import TEST_FUNCTION_IMPLEMENTATION_COMPARE
 def test_function_implementation_compare(implementation, named, unnamed,
                                          compare_result):
     assert compare_result == implementation.compare(named, unnamed)
+
+
+@pytest.mark.implementation
+@pytest.mark.parametrize(
+    'implementation,named,unnamed,compare_result',
+    TEST_FUNCTION_IMPLEMENTATION_COMPARE,
+)
+def test_function_implementation_bind(implementation, named, unnamed,
+                                      compare_result):
+    if not isinstance(unnamed, tuple):
+        unnamed = (unnamed,)
+
+    checks = implementation.bind(len(unnamed), frozenset(named))
+    values = {**dict(enumerate(unnamed)), **named}
+
+    assert compare_result == (checks is not None and all(
+        implementation._type_compared(
+            values[slot], implementation.annotation_classes(annotation),
+        )
+        for slot, annotation in checks
+    ))
+
+
+@pytest.mark.implementation
+@pytest.mark.parametrize(
+    'implementation,named,unnamed,compare_result',
+    TEST_FUNCTION_IMPLEMENTATION_COMPARE,
+)
+def test_function_implementation_mismatch(implementation, named, unnamed,
+                                          compare_result):
+    mismatch = implementation.mismatch(named, unnamed)
+
+    assert compare_result == (mismatch is None)
+    if mismatch is not None:
+        assert mismatch[0] in (
+            'missed_keyword',
+            'positional_by_name',
+            'unexpected_keyword',
+            'type_mismatch',
+            'too_many_positional',
+            'missed_positional',
+        )
+
+
+@pytest.mark.implementation
+@pytest.mark.parametrize('implementation', IMPLEMENTATIONS)
+def test_function_implementation_accepts_shape(implementation):
+    names = ('a', 'b', 'c', 'd', 'e', 'm', 'n')
+
+    for count in range(6):
+        for size in range(len(names) + 1):
+            for shape_names in combinations(names, size):
+                shape_names = frozenset(shape_names)
+
+                assert implementation.accepts_shape(count, shape_names) == (
+                    implementation.bind(count, shape_names) is not None
+                )
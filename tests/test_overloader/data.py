@@ -59,6 +59,44 @@ def two_parameters_different_types_mixed(b: int, a: str):
     pass
 
 
+# Overloader dispatching calls by class of one parameter.
+def int_default(a: int):
+    return 'default'
+
+
+def object_default(a: object):
+    return 'default'
+
+
+def int_implementation(a: int):
+    return 'int'
+
+
+def str_implementation(a: str):
+    return 'str'
+
+
+def list_implementation(a: list):
+    return 'list'
+
+
+# Overloader with implementations of different call shapes.
+def optional_default(a: object, b: int = 0):
+    return 'default'
+
+
+def int_optional_implementation(a: int, b: int = 0):
+    return 'int'
+
+
+def str_pair_implementation(a: str, b: str):
+    return 'str'
+
+
+def keyword_implementation(a: str, *, c: int):
+    return 'keyword'
+
+
 FUNCTION_OVERLOADER_REGISTER = (
     # Pytest parameters format:
     # default, strict, overlap, new_func, exception.
@@ -362,3 +400,4 @@ FUNCTION_OVERLOADER_REGISTER = (
         None,  # exception
     ),
 )
+
@@ -0,0 +1,161 @@
+from typing import Any, Union
+
+try:
+    from typing import Literal
+except ImportError:  # pragma: no cover
+    from typing_extensions import Literal
+
+import pytest
+
+from overload.exception.warning import (
+    AmbiguousImplementationWarning,
+    ShadowedImplementationWarning,
+)
+from overload.implementation.function import FunctionImplementation
+from overload.overloader.function import FunctionOverloader
+
+
+def default_function(a: bytes):
+    return 'default'
+
+
+def int_implementation(a: int, b: str = ''):
+    return 'int'
+
+
+def number_implementation(a: Union[int, float], b: str = ''):
+    return 'number'
+
+
+def object_implementation(a: object, b: str = ''):
+    return 'object'
+
+
+def value_implementation(value: int):
+    def implementation(a):
+        return value
+
+    implementation.__annotations__ = {'a': Literal[value]}
+    return implementation
+
+
+def int_any_implementation(a: int, b: Any):
+    return 'int any'
+
+
+def any_str_implementation(a: Any, b: str):
+    return 'any str'
+
+
+@pytest.mark.overloader
+@pytest.mark.parametrize('engine', ('linear', 'bitset'))
+def test_shadowed_implementation(engine):
+    overloader = FunctionOverloader(default_function, engine=engine)
+    overloader.register(int_implementation)
+
+    with pytest.warns(ShadowedImplementationWarning):
+        overloader.register(number_implementation)
+
+    shadowed = overloader.varieties[1]
+    assert overloader.shadowed == (shadowed,)
+    assert all(
+        variety is not shadowed for variety in overloader.engine._varieties
+    )
+    assert overloader(1) == 'number'
+    assert overloader(1, 'b') == 'number'
+
+    overloader.compile()
+    assert 'int_implementation' not in str(overloader.dispatcher_source)
+
+
+@pytest.mark.overloader
+def test_ambiguous_implementations():
+    overloader = FunctionOverloader(default_function)
+    overloader.register(int_any_implementation)
+
+    with pytest.warns(AmbiguousImplementationWarning):
+        overloader.register(any_str_implementation)
+
+    assert overloader.ambiguities == (tuple(overloader.varieties[1:]),)
+    assert not overloader.shadowed
+    assert overloader(1, 'b') == 'any str'
+
+
+@pytest.mark.overloader
+def test_analysis_index(monkeypatch):
+    compared = []
+    covers = FunctionImplementation.covers
+
+    def tracked_covers(implementation, other, exact=True):
+        compared.append(other)
+        return covers(implementation, other, exact)
+
+    monkeypatch.setattr(FunctionImplementation, 'covers', tracked_covers)
+    overloader = FunctionOverloader(default_function)
+
+    # Implementations with different values aren't compared.
+    for value in range(100):
+        overloader.register(value_implementation(value))
+
+    assert not compared
+
+    # Implementation of class is compared with implementations of its
+    # values only.
+    with pytest.warns(ShadowedImplementationWarning):
+        overloader.register(int_implementation)
+
+    assert len(compared) == 100
+    assert overloader.shadowed == tuple(overloader.varieties[1:101])
+    assert overloader(5) == 'int'
+
+
+@pytest.mark.overloader
+def test_mro_shadowed_only_equal():
+    overloader = FunctionOverloader(default_function, engine='mro')
+    overloader.register(int_implementation)
+    overloader.register(object_implementation)
+
+    assert not overloader.shadowed
+    assert overloader(1) == 'int'
+
+    with pytest.warns(ShadowedImplementationWarning):
+        overloader.register(int_implementation)
+
+    assert overloader.shadowed == (overloader.varieties[1],)
+
+
+@pytest.mark.overloader
+def test_warning_stacklevel():
+    from overload import overload
+
+    # Warnings point to the code, which registers implementation.
+    @overload(False)
+    def decorated(a: bytes):
+        return 'default'
+
+    decorated.register(int_implementation)
+    with pytest.warns(ShadowedImplementationWarning) as record:
+        @decorated.register
+        def _(a: Union[int, float], b: str = ''):
+            return 'number'
+
+    assert record[0].filename == __file__
+
+    overloader = FunctionOverloader(default_function)
+    overloader.register(int_implementation)
+    with pytest.warns(ShadowedImplementationWarning) as record:
+        overloader.register(number_implementation)
+
+    assert record[0].filename == __file__
+
+    # Deferred registration warns at the first call.
+    @overload(False, lazy=True)
+    def lazy(a: bytes):
+        return 'default'
+
+    lazy.register(int_implementation)
+    lazy.register(number_implementation)
+    with pytest.warns(ShadowedImplementationWarning) as record:
+        lazy(1)
+
+    assert record[0].filename == __file__
@@ -0,0 +1,77 @@
+import gc
+from weakref import ref
+
+import pytest
+
+from overload.overloader.cache import DispatchCache
+from overload.overloader.function import FunctionOverloader
+
+from .data import int_default, list_implementation, str_implementation
+
+
+@pytest.mark.overloader
+def test_cache_hits_and_misses():
+    overloader = FunctionOverloader(int_default)
+    overloader.register(str_implementation)
+
+    assert overloader('a') == 'str'
+    assert overloader('b') == 'str'
+    assert overloader(a='c') == 'str'
+    # Not compared call falls through to default and it is cached too.
+    assert overloader(1.5) == 'default'
+    assert overloader(2.5) == 'default'
+
+    info = overloader.cache_info
+    assert (info.hits, info.misses, info.currsize) == (2, 3, 3)
+    assert info.hit_ratio == 0.4
+
+
+@pytest.mark.overloader
+def test_cache_invalidation_on_register():
+    overloader = FunctionOverloader(int_default)
+
+    assert overloader([]) == 'default'
+    overloader.register(list_implementation)
+    assert overloader.cache_info.currsize == 0
+    assert overloader([]) == 'list'
+
+    overloader.as_default(str_implementation)
+    assert overloader.cache_info.currsize == 0
+    assert overloader(1.5) == 'str'
+
+
+@pytest.mark.overloader
+@pytest.mark.parametrize(
+    'maxsize,keys,expected',
+    (
+        (0, (1, 2), ()),
+        (2, (1, 2, 3), (2, 3)),
+        (None, (1, 2, 3), (1, 2, 3)),
+    ),
+)
+def test_cache_bound(maxsize, keys, expected):
+    cache = DispatchCache(maxsize)
+
+    for key in keys:
+        cache.set(key, key)
+
+    assert tuple(key for key in keys if cache.get(key)) == expected
+
+
+@pytest.mark.overloader
+@pytest.mark.parametrize('engine', ('linear', 'bitset'))
+def test_cache_classes_collected(engine):
+    overloader = FunctionOverloader(int_default, engine=engine)
+    overloader.register(str_implementation)
+
+    # Classes created at runtime aren't kept alive by dispatch cache.
+    runtime_class = type('RuntimeStr', (str,), {})
+    assert overloader(runtime_class('a')) == 'default'
+    assert overloader(a=runtime_class('a')) == 'default'
+    assert overloader.cache_info.currsize == 2
+
+    reference = ref(runtime_class)
+    del runtime_class
+    gc.collect()
+    assert reference() is None
+    assert overloader.cache_info.currsize == 0
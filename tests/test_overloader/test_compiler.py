@@ -0,0 +1,98 @@
+from typing import Any, Union
+
+import pytest
+
+from overload.overloader.function import FunctionOverloader
+from overload.type.type import Args, Kwargs
+
+
+def default_function(a: int, b: str = 'b'):
+    return 'default'
+
+
+def implementation_1(a: str, b: int):
+    return 1
+
+
+def implementation_2(*, a: float, b: Union[int, str] = 1):
+    return 2
+
+
+def implementation_3(a: list, *args: Args[int], **kwargs: Kwargs[str]):
+    return 3
+
+
+def implementation_4(a: Any, b: bytes, *, c: int):
+    return 4
+
+
+def implementation_5():
+    return 5
+
+
+CALLS = (
+    # Format: args, kwargs.
+    ((), {}),
+    ((1,), {}),
+    ((1, 'b'), {}),
+    ((1,), {'b': 'b'}),
+    (('a', 1), {}),
+    ((), {'a': 'a', 'b': 1}),
+    ((), {'a': 1.5}),
+    ((), {'a': 1.5, 'b': 'b'}),
+    ((), {'a': 1.5, 'b': []}),
+    (([],), {}),
+    (([], 1, 2), {}),
+    (([], 1, 'c'), {}),
+    (([],), {'d': 'd'}),
+    (([],), {'d': 1}),
+    ((None, b''), {'c': 1}),
+    ((), {'a': 1, 'b': b'', 'c': 1}),
+    (('a', b''), {'c': 'c'}),
+    ((1, 2, 3, 4, 5, 6), {}),
+)
+
+
+def make_overloader():
+    overloader = FunctionOverloader(default_function)
+
+    for implementation in (
+            implementation_1,
+            implementation_2,
+            implementation_3,
+            implementation_4,
+            implementation_5,
+    ):
+        overloader.register(implementation)
+
+    return overloader
+
+
+@pytest.mark.overloader
+@pytest.mark.parametrize('args,kwargs', CALLS)
+def test_compiled_dispatcher_match_compare(args, kwargs):
+    overloader = make_overloader()
+    expected = overloader._get_variety(
+        overloader.__type_handler__.converting_args(args),
+        overloader.__type_handler__.converting_kwargs(kwargs),
+    )
+
+    overloader.compile()
+
+    assert overloader.is_compiled
+    assert overloader._dispatch(args, kwargs) is expected
+
+
+@pytest.mark.overloader
+def test_compiled_dispatcher_rebuild_on_register():
+    overloader = FunctionOverloader(default_function)
+    overloader.compile()
+
+    assert overloader([]) == 'default'
+    source = overloader.dispatcher_source
+
+    overloader.register(implementation_3)
+
+    assert overloader.dispatcher_source != source
+    assert 'def dispatch_default_function(args, kwargs):' in source
+    assert overloader([]) == 3
@@ -0,0 +1,57 @@
+import asyncio
+import inspect
+
+import pytest
+
+from overload import overload
+from overload.exception.overloader import CoroutineMixError
+from overload.overloader.coroutine import CoroutineOverloader
+from overload.overloader.function import FunctionOverloader
+
+
+@overload
+async def handler(request: int):
+    return 'int'
+
+
+@handler.register
+async def _(request: str):
+    return 'str'
+
+
+def sync_implementation(request: bytes):
+    return 'bytes'
+
+
+async def async_implementation(request: bytes):
+    return 'bytes'
+
+
+@pytest.mark.overloader
+def test_coroutine_function():
+    assert isinstance(handler, CoroutineOverloader)
+    assert inspect.iscoroutinefunction(handler)
+    assert asyncio.iscoroutinefunction(handler)
+    assert handler.__name__ == 'handler'
+
+
+@pytest.mark.overloader
+def test_coroutine_returned_directly():
+    coroutine = handler('a')
+
+    assert inspect.iscoroutine(coroutine)
+    assert coroutine.cr_code is handler.varieties[-1].implementation.__code__
+    assert asyncio.run(coroutine) == 'str'
+    assert asyncio.run(handler(1)) == 'int'
+
+
+@pytest.mark.overloader
+def test_coroutine_mix():
+    with pytest.raises(CoroutineMixError):
+        handler.register(sync_implementation)
+
+    overloader = FunctionOverloader(sync_implementation)
+    assert not inspect.iscoroutinefunction(overloader)
+
+    with pytest.raises(CoroutineMixError):
+        overloader.register(async_implementation)
@@ -0,0 +1,145 @@
+import random
+from typing import Dict, FrozenSet, List, Sequence, Tuple
+
+import pytest
+
+from overload import overload, overload_method
+from overload.exception.type import UnknownDeepStrategy
+from overload.overloader.function import FunctionOverloader
+
+
+def default_function(value: object):
+    return 'object'
+
+
+def ints_function(value: List[int]):
+    return 'ints'
+
+
+def strs_function(value: List[str]):
+    return 'strs'
+
+
+def mapping_function(value: Dict[str, List[int]]):
+    return 'mapping'
+
+
+def pair_function(value: Tuple[int, str]):
+    return 'pair'
+
+
+def create_overloader(**kwargs) -> FunctionOverloader:
+    overloader = FunctionOverloader(default_function, deep=True, **kwargs)
+
+    for function in (
+            ints_function, strs_function, mapping_function, pair_function,
+    ):
+        overloader.register(function)
+
+    return overloader
+
+
+@pytest.mark.overloader
+@pytest.mark.parametrize('engine', ('linear', 'bitset', 'mro'))
+@pytest.mark.parametrize('compiled', (False, True))
+def test_deep_dispatch(engine, compiled):
+    overloader = create_overloader(engine=engine)
+
+    if compiled and engine != 'mro':
+        overloader.compile()
+
+    assert overloader.is_deep
+    assert not overloader.shadowed and not overloader.ambiguities
+    assert overloader([1, 2]) == 'ints'
+    assert overloader(['a', 'b']) == 'strs'
+    assert overloader([1.5]) == 'object'
+    assert overloader({'a': [1]}) == 'mapping'
+    assert overloader({'a': ['b']}) == 'object'
+    assert overloader({1: [1]}) == 'object'
+    assert overloader((1, 'a')) == 'pair'
+    assert overloader((1, 2)) == 'object'
+    assert overloader((1, 'a', 'b')) == 'object'
+    assert overloader(1) == 'object'
+
+
+@pytest.mark.overloader
+def test_deep_strategies():
+    values = [1] * 20 + ['a']
+
+    assert create_overloader()(values) == 'ints'
+    assert create_overloader(deep_size=32)(values) == 'object'
+    assert create_overloader(deep_strategy='all')(values) == 'object'
+
+    overloader = create_overloader(deep_strategy='random', deep_size=20)
+    random.seed(0)
+    assert {overloader(values) for _ in range(50)} == {'ints', 'object'}
+
+    with pytest.raises(UnknownDeepStrategy):
+        create_overloader(deep_strategy='middle')
+
+
+@pytest.mark.overloader
+def test_deep_immutable_cache():
+    @overload(deep=True, engine='mro')
+    def function(value: object):
+        return 'object'
+
+    @function.register
+    def _(value: Tuple[int, ...]):
+        return 'ints'
+
+    @function.register
+    def _(value: FrozenSet[str]):
+        return 'strs'
+
+    values = (1, 2, 3)
+    assert function(values) == function(values) == 'ints'
+    assert function(values + ('a',)) == 'object'
+    assert function(frozenset('ab')) == 'strs'
+    assert len(function._deep._cache) == 3
+
+
+@pytest.mark.overloader
+def test_deep_stream():
+    overloader = create_overloader()
+    items = [[1], ['a'], [2], (1, 'a')]
+
+    assert list(overloader.imap(items)) == ['ints', 'strs', 'ints', 'pair']
+    assert overloader.batch(items) == ['ints', 'strs', 'ints', 'pair']
+
+
+@pytest.mark.overloader
+def test_shallow_overloader_unaffected():
+    overloader = FunctionOverloader(default_function, overlapping=True)
+    overloader.register(ints_function)
+
+    assert not overloader.is_deep
+    assert overloader(['a']) == 'ints'
+
+
+@pytest.mark.overloader
+def test_deep_abstract_and_method():
+    class Numbers:
+        @overload_method(deep=True, engine='mro')
+        def total(self, values: object):
+            return None
+
+        @total.register
+        def _(self, values: Sequence[int]):
+            return sum(values)
+
+        @total.register
+        def _(self, values: Sequence[str]):
+            return ''.join(values)
+
+    class Derived(Numbers):
+        @overload_method(deep=True, engine='mro')
+        def total(self, values: Sequence[bytes]):
+            return b''.join(values)
+
+    for numbers in (Numbers(), Derived()):
+        assert numbers.total((1, 2)) == 3
+        assert numbers.total(['a', 'b']) == 'ab'
+        assert numbers.total([1.5]) is None
+
+    assert Derived().total([b'a', b'b']) == b'ab'
@@ -0,0 +1,105 @@
+import pytest
+
+from overload.engine import ENGINES
+from overload.overloader.function import FunctionOverloader
+
+from .data import (
+    int_optional_implementation,
+    keyword_implementation,
+    optional_default,
+    str_pair_implementation,
+)
+
+
+def create_overloader(**kwargs):
+    overloader = FunctionOverloader(optional_default, **kwargs)
+    overloader.register(int_optional_implementation)
+    overloader.register(str_pair_implementation)
+    overloader.register(keyword_implementation)
+    return overloader
+
+
+def names(report):
+    return [
+        candidate.implementation.implementation.__name__
+        for candidate in report.candidates
+    ]
+
+
+@pytest.mark.overloader
+@pytest.mark.parametrize('engine', ENGINES)
+def test_explain_resolved(engine):
+    overloader = create_overloader(engine=engine)
+    report = overloader.explain(1, b=2)
+
+    assert [type_.type for type_ in report.args] == [int]
+    assert {name: type_.type for name, type_ in report.kwargs.items()} == {
+        'b': int,
+    }
+    assert report.engine == engine
+    assert report.implementation.implementation is int_optional_implementation
+    assert not report.is_default
+    assert report.candidates[-1].compared
+    assert report.candidates[-1].reason is None
+    assert report.time == sum(
+        candidate.time for candidate in report.candidates
+    )
+    # Implementation isn't called and call isn't cached.
+    assert overloader.cache_info.currsize == 0
+
+
+@pytest.mark.overloader
+def test_explain_rejections():
+    overloader = create_overloader(engine='bitset')
+
+    report = overloader.explain('a', 1)
+    assert names(report) == [
+        'keyword_implementation',
+        'str_pair_implementation',
+        'int_optional_implementation',
+        'optional_default',
+    ]
+    assert [
+        (candidate.reason, candidate.slot)
+        for candidate in report.candidates
+    ] == [
+        ('missed_keyword', 'c'),
+        ('type_mismatch', 1),
+        ('type_mismatch', 0),
+        ('type_mismatch', 0),
+    ]
+    assert report.is_default
+    assert 'parameter b has type int' in report.candidates[1].description
+
+    report = overloader.explain('a', d=1)
+    assert report.candidates[1].reason == 'unexpected_keyword'
+
+    report = overloader.explain(1, 2, 3)
+    assert report.candidates[2].reason == 'too_many_positional'
+
+    report = overloader.explain()
+    assert report.candidates[0].reason == 'missed_keyword'
+    assert report.candidates[1].reason == 'missed_positional'
+
+
+@pytest.mark.overloader
+def test_explain_first_match():
+    # Linear engine stops at the first compared candidate.
+    report = create_overloader().explain('a', c=1)
+    assert names(report) == ['keyword_implementation']
+
+    # Mro engine compares all candidates of call shape.
+    report = create_overloader(engine='mro').explain(True)
+    assert names(report) == ['int_optional_implementation', 'optional_default']
+    assert all(candidate.compared for candidate in report.candidates)
+    assert report.implementation.implementation is int_optional_implementation
+
+
+@pytest.mark.overloader
+def test_explain_format():
+    report = create_overloader().explain('a', b=1)
+    text = report.format()
+
+    assert text.splitlines()[0] == 'call (str, b=int), engine linear:'
+    assert 'type_mismatch: parameter b has type int' in text
+    assert text.splitlines()[-1] == 'resolved: optional_default (default)'
@@ -0,0 +1,47 @@
+import pytest
+
+from overload import overload
+from overload.engine import LinearEngine, BitsetEngine
+from overload.exception.overloader import FrozenOverloaderError
+from overload.overloader.function import FunctionOverloader
+
+from .data import int_default, list_implementation, str_implementation
+
+
+@pytest.mark.overloader
+@pytest.mark.parametrize('engine', (LinearEngine.name, BitsetEngine.name))
+def test_freeze(engine):
+    overloader = FunctionOverloader(int_default, engine=engine)
+    overloader.register(str_implementation)
+    overloader.freeze()
+
+    assert overloader.is_frozen
+    assert isinstance(overloader.varieties, tuple)
+    assert overloader('a') == 'str'
+    assert overloader(1) == 'default'
+
+    with pytest.raises(FrozenOverloaderError):
+        overloader.register(list_implementation)
+
+    with pytest.raises(FrozenOverloaderError):
+        overloader.as_default(list_implementation)
+
+    assert overloader([]) == 'default'
+
+
+@pytest.mark.overloader
+@pytest.mark.parametrize('compiled', (False, True))
+def test_frozen_at_first_call(compiled):
+    overloader = overload(frozen=True)(int_default)
+    overloader.register(str_implementation)
+
+    if compiled:
+        overloader.compile()
+
+    assert not overloader.is_frozen
+    assert overloader('a') == 'str'
+    assert overloader.is_frozen
+    assert overloader.is_compiled == compiled
+
+    with pytest.raises(FrozenOverloaderError):
+        overloader.register(list_implementation)
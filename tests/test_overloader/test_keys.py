@@ -0,0 +1,87 @@
+import array
+
+import pytest
+
+from overload import (
+    Key,
+    overload,
+    register_key_extractor,
+    unregister_key_extractor,
+)
+from overload.overloader.function import FunctionOverloader
+
+
+@pytest.fixture
+def memoryview_keys():
+    register_key_extractor(memoryview)
+    yield
+    unregister_key_extractor(memoryview)
+
+
+def default_function(buffer: memoryview):
+    return 'memoryview'
+
+
+def bytes_function(buffer: Key[memoryview, 'B', True]):
+    return 'bytes'
+
+
+def doubles_function(buffer: Key[memoryview, 'd', True]):
+    return 'doubles'
+
+
+def strided_function(buffer: Key[memoryview, 'B', False]):
+    return 'strided'
+
+
+@pytest.mark.overloader
+@pytest.mark.parametrize('engine', ('linear', 'bitset', 'mro'))
+@pytest.mark.parametrize('compiled', (False, True))
+def test_memoryview_keys(memoryview_keys, engine, compiled):
+    overloader = FunctionOverloader(default_function, engine=engine)
+
+    for function in (bytes_function, doubles_function, strided_function):
+        overloader.register(function)
+
+    if compiled and overloader.engine.exact:
+        overloader.compile()
+
+    doubles = memoryview(array.array('d', [1.0, 2.0]))
+    longs = memoryview(array.array('q', [1, 2]))
+
+    for _ in range(2):
+        assert overloader(memoryview(b'abc')) == 'bytes'
+        assert overloader(memoryview(b'abcd')[::2]) == 'strided'
+        assert overloader(doubles) == 'doubles'
+        assert overloader(longs) == 'memoryview'
+
+    assert overloader.cache_info.currsize == 4
+    assert list(overloader.imap([doubles, doubles, longs])) == [
+        'doubles', 'doubles', 'memoryview',
+    ]
+
+
+@pytest.mark.overloader
+def test_unknown_default_extractor():
+    with pytest.raises(ValueError):
+        register_key_extractor(bytes)
+
+
+@pytest.mark.overloader
+def test_ndarray_keys():
+    numpy = pytest.importorskip('numpy')
+    register_key_extractor(numpy.ndarray)
+
+    try:
+        @overload
+        def total(values: numpy.ndarray):
+            return 'any'
+
+        @total.register
+        def _(values: Key[numpy.ndarray, 'f', 1]):
+            return 'float32'
+
+        assert total(numpy.zeros(2, dtype=numpy.float32)) == 'float32'
+        assert total(numpy.zeros(2, dtype=numpy.int64)) == 'any'
+    finally:
+        unregister_key_extractor(numpy.ndarray)
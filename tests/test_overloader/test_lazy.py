@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+from typing import List
+
+import pytest
+
+from overload import overload, overload_method
+from overload.exception.overloader import OverlappingError
+from overload.overloader.function import FunctionOverloader
+from overload.type.type import _TypeHandler
+
+
+def default_function(value: object):
+    return 'object'
+
+
+def int_function(value: int):
+    return 'int'
+
+
+def forward_function(value: Later):
+    return 'later'
+
+
+def strings_function(value: List[Later]):
+    return 'strings'
+
+
+def overlapping_function(value: object):
+    return 'overlapping'
+
+
+def none_default_function(value: int = None, other: str = 'a'):
+    return 'none'
+
+
+@pytest.mark.overloader
+@pytest.mark.parametrize('lazy', (False, True))
+def test_string_annotations(lazy):
+    overloader = FunctionOverloader(default_function, lazy=lazy)
+    overloader.register(int_function)
+    overloader.register(forward_function)
+
+    assert overloader(1) == 'int'
+    assert overloader(Later()) == 'later'
+    assert overloader('a') == 'object'
+
+
+@pytest.mark.overloader
+def test_lazy_registration():
+    overloader = FunctionOverloader(default_function, lazy=True)
+    overloader.register(int_function)
+    overloader.register(forward_function)
+
+    # Annotations aren't converted until the first call.
+    assert overloader.is_lazy and not overloader._varieties
+    assert overloader(1) == 'int'
+    assert len(overloader._varieties) == 3
+    assert overloader.default.implementation is default_function
+
+    overloader.as_default(strings_function)
+    assert overloader.default.implementation is strings_function
+
+
+@pytest.mark.overloader
+def test_lazy_validation():
+    overloader = FunctionOverloader(default_function, lazy=True)
+    overloader.register(overlapping_function)
+    overloader.register(int_function)
+
+    with pytest.raises(OverlappingError):
+        overloader(1)
+
+    # Objects registered after invalid object are kept.
+    assert overloader(1) == 'int'
+    assert len(overloader.varieties) == 2
+
+
+@pytest.mark.overloader
+def test_lazy_freeze_and_method():
+    @overload(lazy=True, frozen=True)
+    def function(value: object):
+        return 'object'
+
+    @function.register
+    def _(value: Later):
+        return 'later'
+
+    function.freeze()
+    assert function.is_frozen and function(Later()) == 'later'
+
+    class Base:
+        @overload_method(lazy=True)
+        def method(self, value: object):
+            return 'object'
+
+    class Child(Base):
+        @overload_method(lazy=True)
+        def method(self, value: Later):
+            return 'later'
+
+    @Base.method.register
+    def _(self, value: int):
+        return 'int'
+
+    assert Child().method(Later()) == 'later'
+    assert Child().method(1) == 'int'
+    assert Base().method(Later()) == 'object'
+    assert Child.method.default.implementation is (
+        Base.method.default.implementation
+    )
+
+
+@pytest.mark.overloader
+def test_forward_reference_deferred():
+    # Point isn't defined on registration, implementations are registered
+    # at the first call without lazy mode.
+    assert not Point.distance.is_lazy and Point.distance._pending
+    assert Point().distance(Point()) == 'point'
+    assert Point().distance(1) == 'int'
+    assert Point().distance('a') == 'object'
+    assert not Point.distance._pending
+    assert Point.distance.default.implementation.__name__ == 'distance'
+
+    # Default implementation is deferred too.
+    assert Point.contains._pending and Point.contains.default is not None
+    assert Point().contains(Point()) == 'point'
+    assert Point().contains(1) == 'int'
+
+
+@pytest.mark.overloader
+def test_none_default_not_optional():
+    annotations = _TypeHandler.resolve_annotations(none_default_function)
+    assert annotations == {'value': int, 'other': str}
+
+
+class Later:
+    pass
+
+
+class Point:
+    @overload_method
+    def distance(self, other: object):
+        return 'object'
+
+    @distance.register
+    def _(self, other: Point):
+        return 'point'
+
+    @distance.register
+    def _(self, other: int):
+        return 'int'
+
+    @overload_method
+    def contains(self, other: Point):
+        return 'point'
+
+    @contains.register
+    def _(self, other: int):
+        return 'int'
+
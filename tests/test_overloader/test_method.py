@@ -0,0 +1,204 @@
+import pytest
+
+from overload import overload_method
+from overload.exception.overloader import MethodRegisterTypeError
+from overload.overloader.method import MethodOverloader
+from overload.type.type import _TypeHandler
+
+
+class Shape:
+    def __init__(self, name: str):
+        self.name = name
+
+    @overload_method
+    def scale(self, factor: int):
+        return self.name, 'int', factor
+
+    @scale.register
+    def _(self, factor: float, copy: bool = False):
+        return self.name, 'float', factor, copy
+
+    @overload_method(engine='bitset')
+    @classmethod
+    def create(cls, name: str):
+        return cls, 'str'
+
+    @create.register
+    def _(cls, name: bytes):
+        return cls, 'bytes'
+
+    @overload_method
+    @staticmethod
+    def area(side: int):
+        return 'int'
+
+    @area.register
+    @staticmethod
+    def _(side: float):
+        return 'float'
+
+
+class Square(Shape):
+    pass
+
+
+@pytest.mark.overloader
+def test_instance_method():
+    shape = Shape('a')
+
+    assert shape.scale(2) == ('a', 'int', 2)
+    assert shape.scale(2.0, copy=True) == ('a', 'float', 2.0, True)
+    assert Shape.scale(shape, 2.0) == ('a', 'float', 2.0, False)
+    assert isinstance(Shape.__dict__['scale'], MethodOverloader)
+    assert Shape.scale is Shape.__dict__['scale']
+
+
+@pytest.mark.overloader
+def test_class_method():
+    assert Shape.create('a') == (Shape, 'str')
+    assert Square.create(b'a') == (Square, 'bytes')
+    assert Square('a').create(b'a') == (Square, 'bytes')
+
+
+@pytest.mark.overloader
+def test_static_method():
+    shape = Shape('a')
+
+    assert Shape.area(1) == 'int'
+    assert shape.area(1.5) == 'float'
+    assert shape.area is Shape.area
+
+
+@pytest.mark.overloader
+def test_receiver_type_not_extracted(monkeypatch):
+    extracted = []
+    extract_type = _TypeHandler.extract_type
+
+    def tracked_extract_type(handler, value):
+        extracted.append(value)
+        return extract_type(handler, value)
+
+    monkeypatch.setattr(_TypeHandler, 'extract_type', tracked_extract_type)
+    shape = Shape('a')
+    Shape.__dict__['scale']._cache.clear()
+
+    assert shape.scale(3) == ('a', 'int', 3)
+    assert extracted == [3]
+
+
+@pytest.mark.overloader
+def test_register_method_kind():
+    overloader = Shape.__dict__['create']
+
+    with pytest.raises(MethodRegisterTypeError):
+        overloader.register(staticmethod(lambda name: None))
+
+
+class Base:
+    @overload_method
+    def describe(self, value: int):
+        return 'base int'
+
+
+class Child(Base):
+    # Overloader is derived from overloader of Base.describe.
+    @overload_method
+    def describe(self, value: str):
+        return 'child str'
+
+
+class GrandChild(Child):
+    pass
+
+
+class Other(Base):
+    def describe(self, value):
+        return 'other'
+
+
+@pytest.mark.overloader
+def test_derived_method():
+    base, child, grand_child = Base(), Child(), GrandChild()
+
+    assert child.describe(1) == 'base int'
+    assert child.describe('a') == 'child str'
+    assert base.describe('a') == 'base int'
+    assert grand_child.describe('a') == 'child str'
+    assert Other().describe(1) == 'other'
+
+    base_overloader = Base.__dict__['describe']
+    child_overloader = Child.__dict__['describe']
+    assert child_overloader.parent is base_overloader
+    assert child_overloader.default is base_overloader.default
+    assert len(base_overloader.varieties) == 1
+    assert len(child_overloader._varieties) == 1
+
+    # Registration in parent doesn't change derived overloaders, calls
+    # aren't compared with own implementations are dispatched by parent.
+    @base_overloader.register
+    def _(self, value: bytes):
+        return 'base bytes'
+
+    assert grand_child.describe(b'a') == 'base bytes'
+    assert child.describe(b'a') == 'base bytes'
+    assert child.describe('a') == 'child str'
+    assert len(child_overloader.varieties) == 3
+    assert len(child_overloader._varieties) == 1
+
+    @child_overloader.register
+    def _(self, value: float):
+        return 'child float'
+
+    assert base.describe(1.5) == 'base int'
+    assert grand_child.describe(1.5) == 'child float'
+    assert child_overloader.explain(b'a').implementation.implementation(
+        None, b'a',
+    ) == 'base bytes'
+
+
+@pytest.mark.overloader
+def test_derived_method_default():
+    class Derived(Child):
+        @overload_method
+        def describe(self, value: float):
+            return 'derived float'
+
+        @describe.as_default
+        def _(self, value: object):
+            return 'derived default'
+
+    derived = Derived()
+    assert derived.describe(1.5) == 'derived float'
+    assert derived.describe('a') == 'child str'
+    # Implementation of Base.describe is the default of parent.
+    assert derived.describe(1) == 'derived default'
+    assert derived.describe([]) == 'derived default'
+    assert Derived.describe.default.implementation(None, []) == (
+        'derived default'
+    )
+    assert Child().describe([]) == 'base int'
+
+
+@pytest.mark.overloader
+def test_derived_method_override():
+    class Parent:
+        @overload_method
+        def convert(self, value: int):
+            return 'parent int'
+
+        @convert.register
+        def _(self, value: str):
+            return 'parent str'
+
+    # Plain override with the same annotations replaces default of parent.
+    class Override(Parent):
+        @overload_method
+        def convert(self, value: int):
+            return 'override int'
+
+    overloader = Override.__dict__['convert']
+    assert overloader.parent is Parent.__dict__['convert']
+    assert overloader.default is overloader._varieties[0]
+    assert Override().convert(1) == 'override int'
+    assert Override().convert('a') == 'parent str'
+    assert Parent().convert(1) == 'parent int'
@@ -0,0 +1,72 @@
+import pickle
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from overload import overload
+from overload.exception.overloader import OverloaderLookupError
+from overload.overloader.function import _call_chunk
+
+
+@overload
+def square(value: int):
+    return value * value
+
+
+@square.register
+def _(value: str):
+    return value.upper()
+
+
+@pytest.mark.overloader
+def test_overloader_lookup():
+    @overload
+    def local(value: int):
+        return value
+
+    with pytest.raises(OverloaderLookupError):
+        list(local.map_parallel([1]))
+
+    with pytest.raises(OverloaderLookupError) as error:
+        _call_chunk(__name__, 'missing', 0, [1])
+
+    # Error of worker process is passed to caller.
+    restored = pickle.loads(pickle.dumps(error.value))
+    assert (restored.module, restored.qualname) == (__name__, 'missing')
+    assert str(restored) == str(error.value)
+
+    with pytest.raises(OverloaderLookupError):
+        _call_chunk('tests.missing', 'square', 0, [1])
+
+    assert _call_chunk(__name__, 'square', 1, ['a'])[0] == ['A']
+
+
+@pytest.mark.overloader
+def test_map_parallel_threads():
+    items = [*range(50), 'a', 'b', *range(50, 100), 'c']
+
+    with ThreadPoolExecutor(4) as executor:
+        results = list(square.map_parallel(items, executor=executor))
+
+    assert results == [square(item) for item in items]
+    assert list(square.map_parallel([])) == []
+
+
+@pytest.mark.overloader
+def test_map_parallel_processes():
+    items = ['a', *range(20), 'b']
+
+    with ProcessPoolExecutor(2) as executor:
+        results = list(square.map_parallel(items, executor=executor))
+
+    assert results == [square(item) for item in items]
+
+
+@pytest.mark.overloader
+def test_map_parallel_adaptive_chunks():
+    chunks = list(square._chunks(range(100), {0: 0.001}, 0.01, 4096))
+
+    assert [len(items) for _, items in chunks] == [10] * 10
+    assert list(square._chunks(['a', 1, 2], {}, 0.01, 4096)) == [
+        (1, ['a']), (0, [1, 2]),
+    ]
@@ -0,0 +1,121 @@
+import gc
+import json
+from typing import Union
+
+import pytest
+
+from overload import overload
+from overload.__main__ import main
+from overload.overloader.function import FunctionOverloader
+from overload.overloader.registry import (
+    describe_overloader,
+    export_registry,
+    registered_overloaders,
+)
+from overload.type.type import Args
+
+
+def default_function(a: object):
+    return 'default'
+
+
+def number_implementation(a: Union[int, float]):
+    return 'number'
+
+
+def args_implementation(*a: Args[str]):
+    return 'args'
+
+
+@pytest.mark.overloader
+def test_registry_weak():
+    overloader = FunctionOverloader(default_function)
+    assert any(item is overloader for item in registered_overloaders())
+
+    del overloader
+    gc.collect()
+    assert not any(
+        item.__origin_name__ == 'default_function'
+        for item in registered_overloaders()
+    )
+
+
+@pytest.mark.overloader
+def test_describe_overloader():
+    overloader = FunctionOverloader(default_function, engine='bitset',
+                                    stats=True)
+    overloader.register(number_implementation)
+    overloader.register(args_implementation)
+    overloader(1)
+    overloader(1.5)
+    overloader(None)
+
+    description = describe_overloader(overloader)
+    assert description['name'] == 'default_function'
+    assert description['module'] == __name__
+    assert description['kind'] == 'FunctionOverloader'
+    assert description['engine'] == 'bitset'
+    assert description['implementations'] == 3
+    assert description['cache']['misses'] == 3
+    assert [row['parameters'] for row in description['table']] == [
+        {'a': 'object'}, {'a': 'int | float'}, {'*args': 'Args[str]'},
+    ]
+    assert [row['default'] for row in description['table']] == [
+        True, False, False,
+    ]
+    assert [row['calls'] for row in description['table']] == [1, 2, 0]
+    assert description['stats']['calls'] == 3
+    assert description['stats']['defaults'] == 1
+    # Description is JSON compatible.
+    assert json.loads(json.dumps(description)) == description
+
+
+@pytest.mark.overloader
+def test_describe_lazy_overloader():
+    @overload(lazy=True)
+    def function(a: 'Later'):
+        return 'default'
+
+    description = describe_overloader(function)
+    # Deferred registration isn't forced by description.
+    assert function._pending
+    assert description['qualname'].endswith('function')
+    assert (description['implementations'], description['pending']) == (
+        0, 1,
+    )
+    assert description['stats'] is None
+
+
+@pytest.mark.overloader
+def test_export_registry():
+    overloader = FunctionOverloader(default_function)
+    overloader.register(number_implementation)
+
+    document = json.loads(export_registry(min_implementations=2,
+                                          module=__name__))
+    names = [item['name'] for item in document['overloaders']]
+
+    assert document['count'] == len(names)
+    assert 'default_function' in names
+    assert not json.loads(
+        export_registry(module='not.existing.module'),
+    )['overloaders']
+
+
+@pytest.mark.overloader
+def test_registry_main(capsys, tmp_path):
+    overloader = FunctionOverloader(default_function)
+
+    assert main(['--module', __name__, '--indent', '2']) == 0
+    document = json.loads(capsys.readouterr().out)
+    assert any(
+        item['name'] == 'default_function'
+        for item in document['overloaders']
+    )
+
+    output = tmp_path / 'registry.json'
+    assert main(['json', '--module', 'json', '-o', str(output)]) == 0
+    assert json.loads(output.read_text()) == {
+        'count': 0, 'overloaders': [],
+    }
+    del overloader
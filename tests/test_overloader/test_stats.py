@@ -0,0 +1,135 @@
+import pytest
+
+from overload import overload, overload_method
+from overload.engine import ENGINES
+from overload.exception.overloader import StatsDisabledError
+from overload.overloader.function import FunctionOverloader
+from overload.overloader.stats import LATENCY_BOUNDS
+
+from .data import int_implementation, object_default, str_implementation
+
+
+def calls(info):
+    return {
+        implementation.implementation.__name__: count
+        for implementation, count in info.implementations
+    }
+
+
+@pytest.mark.overloader
+@pytest.mark.parametrize('engine', ENGINES)
+def test_stats_counts(engine):
+    overloader = FunctionOverloader(object_default, engine=engine,
+                                    stats=True)
+    overloader.register(int_implementation)
+    overloader.register(str_implementation)
+
+    assert overloader.has_stats
+    for value in (1, 2, 3, 'a', 1.5):
+        overloader(value)
+    overloader(a=4)
+
+    info = overloader.stats()
+    assert info.calls == 6
+    assert calls(info) == {
+        'int_implementation': 4,
+        'str_implementation': 1,
+        'object_default': 1,
+    }
+    assert info.implementations[0][1] == 4
+    assert info.defaults == 1
+    assert info.default_ratio == pytest.approx(1 / 6)
+    assert sum(count for _, count in info.latency) == 6
+    assert [bound for bound, _ in info.latency] == [*LATENCY_BOUNDS, None]
+
+
+@pytest.mark.overloader
+def test_stats_compares():
+    overloader = FunctionOverloader(object_default, stats=True)
+    overloader.register(int_implementation)
+    overloader.register(str_implementation)
+
+    # Linear engine compares only implementations indexed by class.
+    overloader(1)
+    assert overloader.stats().compares == 1
+    # Call resolved by cache isn't compared.
+    overloader(2)
+    assert overloader.stats().compares == 1
+    overloader('a')
+    assert overloader.stats().compares == 2
+    assert overloader.stats().compares_per_call == pytest.approx(2 / 3)
+
+
+@pytest.mark.overloader
+def test_stats_reset():
+    overloader = FunctionOverloader(object_default, stats=True)
+    overloader(1)
+    overloader.reset_stats()
+
+    info = overloader.stats()
+    assert (info.calls, info.implementations, info.defaults) == (0, (), 0)
+    assert info.compares_per_call == 0.0
+    assert overloader(1) == 'default'
+    assert overloader.stats().calls == 1
+
+
+@pytest.mark.overloader
+def test_stats_disabled():
+    overloader = FunctionOverloader(object_default)
+
+    assert not overloader.has_stats
+    # Calls are dispatched without counting wrapper.
+    overloader(1)
+    assert overloader._dispatch == overloader._resolve
+
+    with pytest.raises(StatsDisabledError):
+        overloader.stats()
+
+    with pytest.raises(StatsDisabledError):
+        overloader.reset_stats()
+
+
+@pytest.mark.overloader
+@pytest.mark.parametrize('frozen', (True, False))
+def test_stats_compiled(frozen):
+    overloader = FunctionOverloader(object_default, frozen=frozen,
+                                    stats=True)
+    overloader.register(int_implementation)
+    overloader.compile()
+
+    assert overloader(1) == 'int'
+    assert overloader(1.5) == 'default'
+    assert overloader.stats().calls == 2
+    assert overloader.stats().defaults == 1
+
+
+@pytest.mark.overloader
+def test_stats_decorators():
+    @overload(stats=True, lazy=True)
+    def function(a: object):
+        return 'default'
+
+    @function.register
+    def _(a: int):
+        return 'int'
+
+    assert function(1) == 'int'
+    assert function.stats().calls == 1
+
+    class Base:
+        @overload_method(stats=True)
+        def method(self, a: object):
+            return 'default'
+
+        @method.register
+        def _(self, a: int):
+            return 'int'
+
+    class Child(Base):
+        @overload_method(stats=True)
+        def method(self, a: str):
+            return 'str'
+
+    assert Child().method(1) == 'int'
+    assert Child.method.stats().calls == 1
+    assert Base.method.stats().calls == 0
@@ -0,0 +1,118 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from overload import batched, overload, overload_method
+from overload.type.type import _TypeHandler
+
+
+def double_all(items):
+    return [item * 2 for item in items]
+
+
+@overload
+def handle(record: int):
+    return record + 1
+
+
+@handle.register
+@batched(double_all)
+def _(record: str):
+    return record * 2
+
+
+@handle.register
+def _(record: bytes, suffix: bytes = b''):
+    return record + suffix
+
+
+@pytest.fixture
+def extracted(monkeypatch):
+    values = []
+    extract_type = _TypeHandler.extract_type
+
+    def tracked_extract_type(handler, value):
+        values.append(value)
+        return extract_type(handler, value)
+
+    monkeypatch.setattr(_TypeHandler, 'extract_type', tracked_extract_type)
+    handle._cache.clear()
+    return values
+
+
+@pytest.mark.overloader
+def test_imap(extracted):
+    results = handle.imap(iter([1, 2, 'a', 'b', 3]))
+
+    assert next(results) == 2
+    assert extracted == [1]
+    assert list(results) == [3, 'aa', 'bb', 4]
+    assert extracted == [1, 'a']
+
+
+@pytest.mark.overloader
+def test_starmap(extracted):
+    results = handle.starmap([(b'a', b'b'), (b'c', b'd'), (1,)])
+
+    assert list(results) == [b'ab', b'cd', 2]
+    assert extracted == [b'a', b'b', 1]
+
+
+@pytest.mark.overloader
+def test_batch(monkeypatch):
+    calls = []
+
+    def tracked_double_all(items):
+        calls.append(items)
+        return double_all(items)
+
+    implementation = handle.varieties[1].implementation
+    monkeypatch.setattr(
+        implementation, '__overload_batch__', tracked_double_all,
+    )
+
+    assert handle.batch(['a', 1, 'b', b'c', 'd']) == [
+        'aa', 2, 'bb', b'c', 'dd',
+    ]
+    assert calls == [['a', 'b', 'd']]
+
+
+class Counter:
+    def __init__(self, step):
+        self.step = step
+
+    @overload_method
+    def add(self, value: int):
+        return value + self.step
+
+    @add.register
+    @batched(lambda self, values: [value * self.step for value in values])
+    def _(self, value: str):
+        return value * self.step
+
+    @overload_method
+    @classmethod
+    def name(cls, value: int):
+        return f'{cls.__name__} {value}'
+
+    @overload_method
+    @staticmethod
+    def negate(value: int):
+        return -value
+
+
+@pytest.mark.overloader
+def test_method_receiver():
+    counter = Counter(2)
+    overloader = Counter.add
+
+    assert list(overloader.imap(counter, [1, 'a', 2])) == [3, 'aa', 4]
+    assert list(overloader.starmap(counter, [(1,), ('b',)])) == [3, 'bb']
+    assert overloader.batch(counter, ['a', 1, 'b']) == ['aa', 3, 'bb']
+    assert list(Counter.name.imap(Counter, [1])) == ['Counter 1']
+    assert list(Counter.__dict__['negate'].imap(None, [1, 2])) == [-1, -2]
+
+    with ThreadPoolExecutor(2) as executor:
+        assert list(overloader.map_parallel(
+            counter, [1, 2, 'a'], executor=executor,
+        )) == [3, 4, 'aa']
@@ -0,0 +1,126 @@
+import enum
+import typing
+import warnings
+
+import pytest
+
+from overload.exception.warning import ShadowedImplementationWarning
+from overload.overloader.function import FunctionOverloader
+from overload.overloader.method import MethodOverloader
+
+Literal = getattr(typing, 'Literal', None)
+if Literal is None:
+    pytest.skip('typing.Literal is not available.', allow_module_level=True)
+
+
+class Color(enum.Enum):
+    RED = 1
+    GREEN = 2
+
+
+def default_function(kind: str):
+    return 'str'
+
+
+def create_function(kind: Literal['create']):
+    return 'create'
+
+
+def delete_function(kind: Literal['delete', 'remove']):
+    return 'delete'
+
+
+def color_function(kind: Color):
+    return 'color'
+
+
+def red_function(kind: Literal[Color.RED]):
+    return 'red'
+
+
+@pytest.mark.overloader
+@pytest.mark.parametrize('engine', ('linear', 'bitset', 'mro'))
+@pytest.mark.parametrize('compiled', (False, True))
+def test_literal_dispatch(engine, compiled):
+    overloader = FunctionOverloader(default_function, engine=engine)
+
+    for function in (
+            create_function, delete_function, color_function, red_function,
+    ):
+        overloader.register(function)
+
+    if compiled and engine != 'mro':
+        overloader.compile()
+
+    assert not overloader.shadowed and not overloader.ambiguities
+    assert overloader('create') == overloader(kind='create') == 'create'
+    assert overloader('delete') == overloader('remove') == 'delete'
+    assert overloader('update') == 'str'
+    assert overloader(Color.RED) == 'red'
+    assert overloader(Color.GREEN) == 'color'
+
+
+@pytest.mark.overloader
+def test_class_shadows_literal():
+    overloader = FunctionOverloader(default_function)
+    overloader.register(red_function)
+
+    with pytest.warns(ShadowedImplementationWarning):
+        overloader.register(color_function)
+
+    assert overloader.shadowed == (overloader.varieties[1],)
+    assert overloader(Color.RED) == 'color'
+
+
+@pytest.mark.overloader
+@pytest.mark.parametrize('engine', ('linear', 'bitset'))
+def test_many_kinds(engine):
+    overloader = FunctionOverloader(default_function, engine=engine)
+    kinds = [f'kind_{index}' for index in range(200)]
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+
+        for kind in kinds:
+            namespace = {'Literal': Literal}
+            exec(
+                f'def handler(kind: Literal[{kind!r}]):\n'
+                f'    return {kind!r}\n',
+                namespace,
+            )
+            overloader.register(namespace['handler'])
+
+    assert [overloader(kind) for kind in kinds] == kinds
+    assert overloader('other') == 'str'
+
+    if engine == 'linear':
+        # Implementation of literal value is the first candidate.
+        bucket = overloader.engine._buckets[(1, frozenset())]
+        candidates = bucket.candidates(
+            (overloader._value_type('kind_7'),), {},
+        )
+        assert candidates[0].implementation('kind_7') == 'kind_7'
+
+
+@pytest.mark.overloader
+def test_literal_method():
+    class Handler:
+        @MethodOverloader
+        def handle(self, kind: str):
+            return 'str'
+
+        @handle.register
+        def _(self, kind: Literal['create']):
+            return 'create'
+
+    class Derived(Handler):
+        @MethodOverloader
+        def handle(self, kind: Literal['delete']):
+            return 'delete'
+
+    for handler in (Handler(), Derived()):
+        assert handler.handle('create') == 'create'
+        assert handler.handle('other') == 'str'
+
+    assert Derived().handle('delete') == 'delete'
+    assert Handler().handle('delete') == 'str'
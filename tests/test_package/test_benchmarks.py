@@ -0,0 +1,41 @@
+import pytest
+
+from benchmarks.suite import BenchmarkSuite, compare, measure_call
+
+
+@pytest.mark.package
+def test_measure_call():
+    result = measure_call(lambda: [0] * 100, repeat=1)
+
+    assert result['ns'] > 0
+    assert result['peak_bytes'] > 0
+    # Result of call isn't kept alive.
+    assert result['retained_bytes'] < 8
+
+
+@pytest.mark.package
+def test_suite_cases():
+    suite = BenchmarkSuite(quick=True, repeat=1)
+    names = [name for name, _ in suite.cases()]
+
+    assert len(names) == len(set(names))
+    for prefix in (
+            'dispatch/', 'direct/', 'singledispatch/', 'keyword/',
+            'variadic/', 'register/', 'corpus/',
+    ):
+        assert any(name.startswith(prefix) for name in names)
+
+    results = suite.run('variadic/kwargs/args=1')
+    assert list(results) == ['variadic/kwargs/args=1']
+    assert results['variadic/kwargs/args=1']['ns'] > 0
+
+
+@pytest.mark.package
+def test_compare():
+    baseline = {'a': {'ns': 100.0}, 'b': {'ns': 100.0}, 'c': {'ns': 1.0}}
+    results = {'a': {'ns': 105.0}, 'b': {'ns': 150.0}, 'd': {'ns': 1.0}}
+
+    assert compare(baseline, results, threshold=0.1) == [
+        ('a', 100.0, 105.0, pytest.approx(0.05), False),
+        ('b', 100.0, 150.0, pytest.approx(0.5), True),
+    ]
@@ -0,0 +1,150 @@
+import subprocess
+import sys
+from importlib import import_module
+
+import pytest
+
+import overload
+
+from benchmarks.importtime import parse
+
+
+@pytest.mark.package
+def test_lazy_names():
+    # Names, which was star imported from submodules before lazy loading.
+    submodules = {
+        'overload.decorator': ('decorator.decorator',),
+        'overload.exception': (
+            'exception.base', 'exception.overloader', 'exception.type',
+        ),
+        'overload.exception.warning': ('exception.warning',),
+        'overload.type': ('type.type',),
+        'overload.overloader.registry': ('overloader.registry',),
+    }
+    expected = {
+        name: module
+        for module, names in submodules.items()
+        for name_module in names
+        for name in import_module(f'overload.{name_module}').__all__
+    }
+
+    assert overload._SUBMODULES == expected
+
+    for name, module in overload._SUBMODULES.items():
+        assert getattr(overload, name) is getattr(
+            import_module(module), name,
+        )
+        assert name in dir(overload)
+
+
+@pytest.mark.package
+def test_unknown_name():
+    with pytest.raises(AttributeError):
+        overload.unknown_name
+
+
+def loaded_modules(code: str) -> set:
+    """Modules, loaded by code in fresh interpreter."""
+    process = subprocess.run(
+        (sys.executable, '-c', f'{code}\nimport sys\nprint(*sys.modules)'),
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+    return set(process.stdout.split())
+
+
+# Modules of package, loaded by import of decorators.
+DECORATOR_MODULES = {
+    'overload',
+    'overload.decorator',
+    'overload.decorator.decorator',
+    'overload.engine',
+    'overload.exception',
+    'overload.exception.base',
+    'overload.exception.overloader',
+    'overload.exception.type',
+    'overload.implementation',
+    'overload.implementation.base',
+    'overload.implementation.function',
+    'overload.overloader',
+    'overload.overloader.base',
+    'overload.overloader.cache',
+    'overload.overloader.function',
+    'overload.type',
+    'overload.type.type',
+    'overload.utils',
+    'overload.utils.coroutine',
+}
+
+
+@pytest.mark.package
+def test_lazy_import():
+    modules = loaded_modules('from overload import overload')
+
+    assert {
+        module for module in modules
+        if module.partition('.')[0] == 'overload'
+    } == DECORATOR_MODULES
+    for module in (
+            'asyncio',
+            'bisect',
+            'concurrent.futures',
+            'importlib',
+            'inspect',
+            'json',
+            'random',
+    ):
+        assert module not in modules
+
+
+@pytest.mark.package
+def test_lazy_engine_import():
+    modules = loaded_modules(
+        'from overload import overload\n'
+        '@overload\n'
+        'def function(value: int): ...\n'
+        '@function.register\n'
+        'def _(value: str): ...\n'
+        'function(1)\n'
+    )
+
+    # Only engine of overloader is imported.
+    assert {
+        module for module in modules
+        if module.partition('.')[0] == 'overload'
+    } == {
+        *DECORATOR_MODULES, 'overload.engine.base', 'overload.engine.linear',
+    }
+
+    modules = loaded_modules(
+        'from overload import overload\n'
+        '@overload(engine="mro", stats=True)\n'
+        'def function(value: int): ...\n'
+        'function.explain(1)\n'
+    )
+    for module in (
+            'overload.engine.mro',
+            'overload.overloader.explain',
+            'overload.overloader.stats',
+    ):
+        assert module in modules
+    for module in (
+            'overload.engine.linear',
+            'overload.engine.bitset',
+            'overload.overloader.compiler',
+            'overload.overloader.registry',
+            'overload.exception.warning',
+    ):
+        assert module not in modules
+
+
+@pytest.mark.package
+def test_importtime_parse():
+    output = (
+        'import time: self [us] | cumulative | imported package\n'
+        'import time:       120 |        120 |   typing\n'
+        'import time:        30 |        150 | overload\n'
+    )
+
+    assert parse(output) == {'typing': (120, 120), 'overload': (30, 150)}
@@ -1,6 +1,9 @@
+import gc
+import typing
+
 import pytest
 
-from overload.type.type import _TypeHandler
+from overload.type.type import _Type, _TypeHandler, _ValueType
 
 from .data import (
     OUT_UP_TYPES_AND_EXPECTATIONS,
@@ -17,7 +20,7 @@ set_custom_type_handler = _TypeHandler()
     OUT_UP_TYPES_AND_EXPECTATIONS,
 )
 def test_out_up_types(deep, input_type, expected):
-    handler = _TypeHandler()
+    handler = _TypeHandler(deep=deep)
     type_ = handler.out_up_types(input_type)
     assert type_ == expected
 
@@ -40,3 +43,82 @@ def test_converting_args(args, result):
 def test_converting_kwargs(kwargs, result):
     handler = _TypeHandler()
     assert result == handler.converting_kwargs(kwargs)
+
+
+@pytest.mark.type
+def test_extract_type_shared_and_weak():
+    handler = _TypeHandler()
+
+    class Dynamic:
+        pass
+
+    type_ = handler.extract_type(Dynamic())
+
+    assert handler.extract_type(Dynamic()) is type_
+    assert handler.extract_type(1) is handler.extract_type(2)
+    assert type_ == _Type(Dynamic) and hash(type_) == hash(_Type(Dynamic))
+
+    del Dynamic, type_
+    gc.collect()
+
+    assert len(handler._classes) == 1
+
+
+@pytest.mark.type
+def test_type_hash_eq_contract():
+    wildcard = set_custom_type_handler.out_up_types(typing.Any)
+
+    assert wildcard.is_wildcard
+    assert wildcard != _Type(int)
+    assert wildcard.matches(_Type(int)) and _Type(int).matches(wildcard)
+    assert {_Type(int): 1}.get(_Type(int)) == 1
+    assert _Type(str) not in {wildcard, _Type(int)}
+    assert set_custom_type_handler.annotations_match(
+        set_custom_type_handler.out_up_types(typing.Union[int, str]),
+        (wildcard, _Type(str)),
+    )
+
+
+@pytest.mark.type
+def test_deep_inner_types():
+    handler = _TypeHandler(deep=True)
+    ints = handler.out_up_types(typing.List[int])
+    pair = handler.out_up_types(typing.Tuple[int, str])
+    mapping = handler.out_up_types(typing.Dict[str, typing.List[int]])
+
+    assert ints.v_types == (_Type(int),) and ints.can_mixed_v
+    assert pair.v_types == (_Type(int), _Type(str)) and not pair.can_mixed_v
+    assert mapping.k_types == (_Type(str),)
+    assert mapping.v_types[0].v_types == (_Type(int),)
+    assert not handler.out_up_types(typing.List[typing.Any]).is_nested
+    assert not _TypeHandler().out_up_types(typing.List[int]).is_nested
+
+    assert not handler.annotations_match(
+        ints, handler.out_up_types(typing.List[str]),
+    )
+    assert handler.annotations_match(
+        ints, handler.out_up_types(typing.List[typing.Union[int, str]]),
+    )
+    assert handler.annotations_match(ints, handler.out_up_types(list))
+    assert not handler.annotations_match(
+        pair, handler.out_up_types(typing.Tuple[int, int]),
+    )
+
+
+@pytest.mark.type
+def test_literal_values():
+    literal = getattr(typing, 'Literal', None)
+    if literal is None:
+        pytest.skip('typing.Literal is not available.')
+
+    create = set_custom_type_handler.out_up_types(literal['create'])
+    values = set_custom_type_handler.out_up_types(
+        typing.Optional[literal['create', 1]],
+    )
+
+    assert isinstance(create, _ValueType)
+    assert create.type == (str, 'create') and create.base is str
+    assert create.value == 'create'
+    assert [type_.type for type_ in values] == [
+        (str, 'create'), (int, 1), type(None),
+    ]